@@ -0,0 +1,114 @@
+"""
+Synthetic address book and notes generator for benchmarks.
+
+Records look like the ones the CLI produces: single-token lowercase names
+(Ukrainian and English, transliterated and Cyrillic), one to three 10-digit
+phones and, for most contacts, a birthday. Generation is deterministic for a
+given seed, so datasets of the same size are identical between runs.
+"""
+import os
+import random
+import sys
+import uuid
+from datetime import date, timedelta
+from typing import Dict, Iterator, List
+
+# Додавання каталогу пакета до sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src", "CAPythonsBook")))
+
+from app.entities import AddressBook, Birthday, Name, NotesBook, Phone, Record
+
+UK_FIRST_NAMES = [
+    "олександр", "андрій", "богдан", "василь", "дмитро", "іван", "максим", "микола",
+    "олег", "петро", "тарас", "юрій", "анна", "валентина", "галина", "ірина",
+    "катерина", "людмила", "марія", "наталія", "оксана", "ольга", "софія", "юлія",
+    "ivan", "oleksandr", "taras", "mykola", "oksana", "olena", "yuliia", "sofiia",
+]
+UK_LAST_NAMES = [
+    "шевченко", "коваленко", "бондаренко", "ткаченко", "кравченко", "олійник",
+    "шевчук", "поліщук", "мельник", "бойко", "лисенко", "руденко", "савченко",
+    "shevchenko", "kovalenko", "bondarenko", "tkachenko", "melnyk", "boiko",
+]
+EN_FIRST_NAMES = [
+    "james", "john", "robert", "michael", "william", "david", "richard", "thomas",
+    "mary", "patricia", "jennifer", "linda", "elizabeth", "susan", "jessica", "sarah",
+]
+EN_LAST_NAMES = [
+    "smith", "johnson", "williams", "brown", "jones", "garcia", "miller", "davis",
+    "wilson", "anderson", "taylor", "moore", "jackson", "martin", "lee", "thompson",
+]
+OPERATOR_CODES = ["050", "063", "066", "067", "068", "073", "093", "095", "096", "097", "098", "099"]
+
+NOTE_WORDS = [
+    "зустріч", "дзвінок", "проєкт", "звіт", "покупки", "подарунок", "квитки", "лікар",
+    "meeting", "call", "project", "report", "groceries", "gift", "tickets", "deadline",
+    "review", "budget", "invoice", "travel", "birthday", "idea", "draft", "release",
+]
+NOTE_TAGS = ["#work", "#home", "#family", "#urgent", "#ideas", "#робота", "#дім", "#old"]
+
+BIRTHDAY_SHARE = 0.6
+
+
+def generate_name(rng: random.Random) -> str:
+    if rng.random() < 0.6:
+        first, last = rng.choice(UK_FIRST_NAMES), rng.choice(UK_LAST_NAMES)
+    else:
+        first, last = rng.choice(EN_FIRST_NAMES), rng.choice(EN_LAST_NAMES)
+    return f"{first}-{last}"
+
+
+def generate_phone(rng: random.Random) -> str:
+    return f"{rng.choice(OPERATOR_CODES)}{rng.randrange(10_000_000):07d}"
+
+
+def generate_birthday(rng: random.Random) -> str:
+    day = date(1940, 1, 1) + timedelta(days=rng.randrange(365 * 70))
+    return day.strftime("%d.%m.%Y")
+
+
+def generate_records(count: int, seed: int = 42) -> Iterator[Record]:
+    """Yields 'count' contacts with unique names."""
+    rng = random.Random(seed)
+    seen: Dict[str, int] = {}
+    for _ in range(count):
+        name = generate_name(rng)
+        duplicates = seen.get(name, 0)
+        seen[name] = duplicates + 1
+        if duplicates:
+            name = f"{name}-{duplicates}"
+
+        record = Record(Name(name))
+        record.id = uuid.UUID(int=rng.getrandbits(128), version=4)
+        for _ in range(rng.choice((1, 1, 1, 2, 2, 3))):
+            record.add_phone(Phone(generate_phone(rng)))
+        if rng.random() < BIRTHDAY_SHARE:
+            record.add_field("birthday", Birthday(generate_birthday(rng)))
+        yield record
+
+
+def generate_address_book(count: int, seed: int = 42) -> AddressBook:
+    book = AddressBook()
+    for record in generate_records(count, seed):
+        book.add_record(record)
+    return book
+
+
+def generate_notes(count: int, seed: int = 42) -> List[Dict[str, object]]:
+    rng = random.Random(seed)
+    notes = []
+    for number in range(count):
+        words = rng.choices(NOTE_WORDS, k=rng.randint(5, 40))
+        notes.append({
+            "id": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+            "title": f"{rng.choice(NOTE_WORDS)}-{number}",
+            "text": " ".join(words),
+            "tags": rng.sample(NOTE_TAGS, k=rng.randint(0, 3)),
+        })
+    return notes
+
+
+def generate_notes_book(count: int, file_name: str, seed: int = 42) -> NotesBook:
+    """Creates a notes book backed by 'file_name' (which must not exist yet) filled with synthetic notes."""
+    notes_book = NotesBook(file_name)
+    notes_book.notes = generate_notes(count, seed)
+    return notes_book
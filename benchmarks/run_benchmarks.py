@@ -0,0 +1,164 @@
+"""
+Benchmark suite for the address book and notes.
+
+Generates synthetic datasets (see 'datagen.py') of the requested sizes and
+measures storage load/save, name lookup, contact and notes search, upcoming
+birthdays (each computed, and answered from the result cache) and peak memory. Results are written as JSON so runs of different
+versions can be compared.
+
+Usage:
+    python benchmarks/run_benchmarks.py --sizes 1000 10000 100000 --output results.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks.datagen import generate_address_book, generate_notes_book
+from app.entities import AddressBook, Name
+from app.services import SearchContactsCommand
+from infrastructure.storage import FileStorage
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+CONTACT_KEYWORD = "shevchenko"
+NOTES_KEYWORD = "deadline"
+
+
+def measure(func: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    """Runs 'func' 'repeat' times and returns timing statistics in seconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return {
+        "median": statistics.median(samples),
+        "min": min(samples),
+        "max": max(samples),
+        "repeat": repeat,
+    }
+
+
+def measure_peak_memory(size: int, notes_file: str) -> Dict[str, float]:
+    """Peak traced memory while building a book and a notes corpus of 'size' records."""
+    tracemalloc.start()
+    try:
+        book = generate_address_book(size)
+        notes_book = generate_notes_book(size, notes_file)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del book, notes_book
+    return {"peak_bytes": peak, "current_bytes": current, "per_record_bytes": current / size}
+
+
+def run_size(size: int, repeat: int, lookups: int, directory: str) -> List[Dict[str, Any]]:
+    contacts_file = os.path.join(directory, f"addressbook_{size}.json")
+    notes_file = os.path.join(directory, f"notes_{size}.json")
+    storage = FileStorage(contacts_file)
+
+    book = generate_address_book(size)
+    notes_book = generate_notes_book(size, notes_file)
+    names = [record.name.value for record in book.data.values()]
+    lookup_names = [Name(name) for name in random.Random(size).choices(names, k=lookups)]
+    search_command = SearchContactsCommand(book)
+
+    def find_names() -> None:
+        for name in lookup_names:
+            book.find_by_name(name)
+
+    def search_contacts() -> None:
+        with contextlib.redirect_stdout(io.StringIO()):
+            search_command.execute(CONTACT_KEYWORD)
+
+    def uncached(cache, func: Callable[[], Any]) -> Callable[[], None]:
+        # Без збереженого результату кожен запуск обчислює його, як перший запуск після зміни
+        def run() -> None:
+            cache.clear()
+            func()
+        return run
+
+    operations: Dict[str, Callable[[], Any]] = {
+        "save_contacts": lambda: storage.save_contacts(book.data),
+        "load_contacts": lambda: AddressBook(storage.load_contacts()),
+        "find_by_name": find_names,
+        "search_contact": uncached(book.cache, search_contacts),
+        "search_contact_cached": search_contacts,
+        "search_notes": uncached(notes_book.cache, lambda: notes_book.search_notes(NOTES_KEYWORD)),
+        "search_notes_cached": lambda: notes_book.search_notes(NOTES_KEYWORD),
+        "get_upcoming_birthdays": uncached(book.cache, book.get_upcoming_birthdays),
+        "get_upcoming_birthdays_cached": book.get_upcoming_birthdays,
+    }
+
+    results = []
+    for operation, func in operations.items():
+        stats = measure(func, repeat)
+        result = {"size": size, "operation": operation, "unit": "s", **stats}
+        if operation == "find_by_name":
+            result["ops"] = lookups
+        results.append(result)
+        print(f"{size:>10} {operation:<24} {stats['median'] * 1000:12.3f} ms", file=sys.stderr)
+
+    del book, notes_book, search_command
+    memory = measure_peak_memory(size, notes_file + ".mem")
+    results.append({"size": size, "operation": "peak_memory", "unit": "bytes", **memory})
+    print(f"{size:>10} {'peak_memory':<24} {memory['peak_bytes'] / 2 ** 20:12.1f} MiB", file=sys.stderr)
+    return results
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def main(argv: List[str] = None) -> Dict[str, Any]:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", nargs="+", type=lambda value: int(float(value)), default=DEFAULT_SIZES,
+                        help="dataset sizes, e.g. 1000 1e5 1e7")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per operation (the median is reported)")
+    parser.add_argument("--lookups", type=int, default=100, help="names looked up per find_by_name run")
+    parser.add_argument("--output", help="JSON file for the results (stdout when omitted)")
+    args = parser.parse_args(argv)
+
+    report: Dict[str, Any] = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": [],
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            report["results"].extend(run_size(size, args.repeat, args.lookups, directory))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, ensure_ascii=False, indent=4)
+    else:
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=4)
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Startup time benchmark.
+
+Starts 'main.py' with "exit" on stdin several times in a scratch directory and
+reports the median wall time, plus the slowest imports from 'python -X importtime'.
+Exits with status 1 when the median exceeds the budget.
+
+Usage:
+    python benchmarks/startup.py [--runs 10] [--budget-ms 120] [--output startup.json]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+MAIN = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src", "CAPythonsBook", "main.py"))
+DEFAULT_BUDGET_MS = 120.0
+
+
+def run_main(directory: str, *options: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *options, MAIN],
+        input="exit\n", cwd=directory, capture_output=True, text=True, encoding="utf-8", check=True,
+    )
+
+
+def startup_times(runs: int, directory: str) -> List[float]:
+    run_main(directory)  # warm-up: byte-compiles the modules
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        run_main(directory)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def import_times(directory: str, top: int) -> List[Dict[str, Any]]:
+    """Slowest modules by cumulative import time (microseconds) of one startup."""
+    stderr = run_main(directory, "-X", "importtime").stderr
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules.append({"module": name.strip(), "self_us": int(self_us), "cumulative_us": int(cumulative_us)})
+    return sorted(modules, key=lambda module: -module["cumulative_us"])[:top]
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="allowed median startup time")
+    parser.add_argument("--top", type=int, default=15, help="number of slowest imports to report")
+    parser.add_argument("--output", help="JSON file for the results (stdout when omitted)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        samples = startup_times(args.runs, directory)
+        imports = import_times(directory, args.top)
+
+    median_ms = statistics.median(samples) * 1000
+    report = {
+        "python": sys.version.split()[0],
+        "runs": args.runs,
+        "median_ms": median_ms,
+        "min_ms": min(samples) * 1000,
+        "max_ms": max(samples) * 1000,
+        "budget_ms": args.budget_ms,
+        "imports": imports,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=4)
+    else:
+        json.dump(report, sys.stdout, indent=4)
+        print()
+
+    within_budget = median_ms <= args.budget_ms
+    print(f"startup median {median_ms:.1f} ms, budget {args.budget_ms:.1f} ms: "
+          f"{'ok' if within_budget else 'over budget'}", file=sys.stderr)
+    return 0 if within_budget else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
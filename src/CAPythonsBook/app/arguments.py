@@ -0,0 +1,149 @@
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+class ArgumentError(ValueError):
+    """
+    Invalid command arguments. Besides the human-readable message it carries a
+    machine-friendly 'code' ("missing_argument", "unexpected_argument",
+    "invalid_value", "missing_option_value"), which is also the name of the
+    message template reporting it, the name of the argument and the word at fault.
+    """
+
+    def __init__(self, code: str, argument: Optional[str], message: str, value: Optional[str] = None):
+        super().__init__(message)
+        self.code = code
+        self.argument = argument
+        self.value = value
+
+
+class Arg:
+    """
+    Positional command argument. 'type' converts (and validates) the raw string,
+    e.g. 'Phone'; a 'rest' argument takes all remaining words joined by spaces.
+    A 'free_text' argument (the text of a note) is the last one and also takes
+    the ';' of the line, which otherwise separates commands.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        type: Callable[[str], Any] = str,
+        required: bool = True,
+        default: Any = None,
+        rest: bool = False,
+        free_text: bool = False,
+    ):
+        self.name = name
+        self.type = type
+        self.required = required
+        self.default = default
+        self.rest = rest or free_text
+        self.free_text = free_text
+
+
+class Option:
+    """Named command option taking a value, e.g. '--limit 10'; passed to 'execute' as a keyword."""
+
+    def __init__(self, flag: str, type: Callable[[str], Any] = str, default: Any = None):
+        self.flag = flag
+        self.dest = flag.lstrip("-").replace("-", "_")
+        self.type = type
+        self.default = default
+
+
+class Flag(Option):
+    """Option without a value, e.g. '--fuzzy': 'True' when given, 'False' otherwise."""
+
+    def __init__(self, flag: str):
+        super().__init__(flag, bool, False)
+
+
+def non_negative_int(value: str) -> int:
+    if not value.isdigit():
+        raise ValueError(f"'{value}' is not a non-negative number.")
+    return int(value)
+
+
+def fraction(value: str) -> float:
+    try:
+        number = float(value)
+    except ValueError:
+        number = -1.0
+    if not 0 <= number <= 1:
+        raise ValueError(f"'{value}' is not a number from 0 to 1.")
+    return number
+
+
+def choice(*values: str) -> Callable[[str], str]:
+    """Converter accepting only one of the values, e.g. 'choice("name", "birthday")'."""
+
+    def convert(value: str) -> str:
+        if value not in values:
+            raise ValueError(f"'{value}' is not one of: {', '.join(values)}.")
+        return value
+
+    return convert
+
+
+# Paging options shared by the listing commands.
+PAGING_OPTIONS = (Option("--limit", non_negative_int), Option("--offset", non_negative_int, 0))
+
+
+class ArgumentSchema:
+    """Parses and converts the words following a command according to its declared arguments."""
+
+    def __init__(self, args: Sequence[Arg] = (), options: Sequence[Option] = ()):
+        self.args = tuple(args)
+        self.options = {option.flag: option for option in options}
+        self.min_args = sum(1 for arg in self.args if arg.required)
+        self.max_args = None if any(arg.rest for arg in self.args) else len(self.args)
+        # Whether the command takes the rest of the input line, ';' included
+        self.takes_line = bool(self.args) and self.args[-1].free_text
+
+    def parse(self, words: Sequence[str]) -> Tuple[List[Any], Dict[str, Any]]:
+        """Returns the converted positional values and the option keywords for 'execute'."""
+        options = {option.dest: option.default for option in self.options.values()}
+        positional: List[str] = []
+        if self.options:
+            words_iter = iter(words)
+            for word in words_iter:
+                option = self.options.get(word)
+                if option is None:
+                    positional.append(word)
+                    continue
+                if isinstance(option, Flag):
+                    options[option.dest] = True
+                    continue
+                value = next(words_iter, None)
+                if value is None:
+                    raise ArgumentError("missing_option_value", option.dest, f"Option '{word}' expects a value.", word)
+                options[option.dest] = self._convert(option.type, option.dest, value)
+        else:
+            positional = list(words)
+
+        if len(positional) < self.min_args:
+            missing = self.args[len(positional)].name
+            raise ArgumentError("missing_argument", missing, f"Missing argument '{missing}'.")
+        if self.max_args is not None and len(positional) > self.max_args:
+            unexpected = positional[self.max_args]
+            raise ArgumentError("unexpected_argument", None, f"Unexpected argument '{unexpected}'.", unexpected)
+
+        values = []
+        for index, arg in enumerate(self.args):
+            if arg.rest:
+                raw = " ".join(positional[index:])
+                values.append(self._convert(arg.type, arg.name, raw) if raw else arg.default)
+            elif index < len(positional):
+                values.append(self._convert(arg.type, arg.name, positional[index]))
+            else:
+                values.append(arg.default)
+        return values, options
+
+    @staticmethod
+    def _convert(type: Callable[[str], Any], name: str, value: str) -> Any:
+        if type is str:
+            return value
+        try:
+            return type(value)
+        except ValueError as e:
+            raise ArgumentError("invalid_value", name, str(e), value) from e
@@ -0,0 +1,44 @@
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+from app.metrics import metrics
+
+
+class QueryCache:
+    """
+    LRU cache of query results of a book. Entries belong to the generation of
+    the book they were computed for: the book bumps its generation on every
+    change, and the first lookup with a newer generation drops all the entries,
+    so a stale result is never returned. Hits and misses are counted here and
+    in 'metrics' as '<name>.hits' and '<name>.misses'.
+    """
+
+    MAX_ENTRIES = 128
+
+    def __init__(self, name: str, max_entries: int = MAX_ENTRIES) -> None:
+        self.name = name
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, generation: int, compute: Callable[[], Any]) -> Any:
+        """Cached result for the key, computed with 'compute' if missing or stale."""
+        if generation != self.generation:
+            self.entries.clear()
+            self.generation = generation
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            metrics.increment(f"{self.name}.hits")
+            return self.entries[key]
+        self.misses += 1
+        metrics.increment(f"{self.name}.misses")
+        value = self.entries[key] = compute()
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        self.entries.clear()
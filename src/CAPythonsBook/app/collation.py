@@ -0,0 +1,71 @@
+import re
+import unicodedata
+from typing import Dict, Optional, Tuple
+
+# Порядок символів: цифри, латиниця, потім кирилиця за українською абеткою
+# (ґ після г, є після е, і та ї після и; російські літери на своїх місцях)
+ALPHABET = (
+    "0123456789"
+    "abcdefghijklmnopqrstuvwxyz"
+    "абвгґдеёєжзиіїйклмнопрстуфхцчшщъыьэюя"
+)
+# Mapped to the private use area, the letters sort after spaces and punctuation,
+# which keeps "ivan petrenko" before "ivana"; apostrophes are ignored ("Мар'яна" == "Марʼяна").
+_BASE = 0xE000
+# Other letters (Greek, CJK, ...) follow the alphabet, in code point order.
+_OTHER = chr(_BASE + len(ALPHABET))
+# Latin letters without a decomposition, named after their base letter ("LATIN SMALL LETTER L WITH STROKE").
+_LATIN_NAME = re.compile(r"LATIN (?:SMALL|CAPITAL) LETTER ([A-Z]{1,2})(?: WITH .*)?")
+
+
+def _base_letters(char: str) -> str:
+    """The letters an accented letter is written with ("é" -> "e", "ł" -> "l", "æ" -> "ae"), or the letter itself."""
+    decomposed = "".join(part for part in unicodedata.normalize("NFD", char) if not unicodedata.combining(part))
+    if decomposed != char:
+        return decomposed
+    match = _LATIN_NAME.fullmatch(unicodedata.name(char, ""))
+    return match.group(1).lower() if match else char
+
+
+class _CollationTable(Dict[int, Optional[str]]):
+    """
+    Translation table of 'collation_key'. Characters outside ALPHABET are
+    looked up once and cached: accented letters sort as their base letters
+    ("É" with "e"; 'й', 'ї' and 'ё' are in ALPHABET, so they never decompose),
+    combining marks are dropped, other letters go after the alphabet and the
+    remaining characters (spaces, punctuation) stay as they are.
+    """
+
+    def __missing__(self, code: int) -> Optional[str]:
+        char = chr(code)
+        if unicodedata.combining(char):
+            value = None
+        else:
+            base = _base_letters(char)
+            if base != char:
+                value = base.translate(self)
+            elif char.isalpha():
+                value = _OTHER + char
+            else:
+                value = char
+        self[code] = value
+        return value
+
+
+_TABLE = _CollationTable({ord(char): chr(_BASE + rank) for rank, char in enumerate(ALPHABET)})
+_TABLE.update({ord(char): None for char in "'ʼ’`"})
+
+
+def collation_key(text: str) -> Tuple[str, str]:
+    """
+    Sort key of a name ordering mixed Ukrainian and English text as people
+    expect: case-insensitive, by the Ukrainian alphabet for Cyrillic (plain
+    code points put 'ґ', 'є', 'і' and 'ї' after 'я'), Latin before Cyrillic,
+    accented Latin letters with their base letters. Ties are broken by the
+    text itself, so the order is total.
+    """
+    folded = text.casefold()
+    if not folded.isascii():
+        # Літери, введені як основа й комбінований знак ("й" як "и" + U+0306), стають однією
+        folded = unicodedata.normalize("NFC", folded)
+    return folded.translate(_TABLE), text
@@ -1,17 +1,34 @@
-from typing import Dict, Optional
+from typing import Dict, Optional, Sequence, Tuple
+from app.arguments import Arg, ArgumentSchema, Option
+from app.entities import AddressBook, NotesBook
 from app.interfaces import Command
+from app.trie import PrefixTrie
 
 # Реєстр для зберігання команд
 command_registry: Dict[str, Command] = {}
 
+# Збільшується при кожній реєстрації команди; за ним перебудовуються похідні структури (таблиця диспетчеризації).
+registry_version = 0
 
-def register_command(name: str):
+# Імена зареєстрованих команд для автодоповнення
+command_names = PrefixTrie()
+
+
+def register_command(name: str, book: Optional[str] = "contacts", args: Sequence[Arg] = (), options: Sequence[Option] = ()):
     """
     Декоратор для реєстрації команд.
+    'book' — книга, з якою працює команда ("contacts", "notes" або None),
+    'args' та 'options' — опис аргументів, за яким вони перевіряються й перетворюються до виклику 'execute'.
     """
 
     def decorator(command: Command):
+        global registry_version
+        command.book = book
+        command.schema = ArgumentSchema(args, options)
+        if name not in command_registry:
+            command_names.add(name)
         command_registry[name] = command
+        registry_version += 1
         return command
 
     return decorator
@@ -23,3 +40,41 @@ def get_command(command_name: str) -> Optional[Command]:
     Якщо назва команди відсутня (команда не знайдена) — повертає 'None'.
     """
     return command_registry.get(command_name)
+
+
+class CommandDispatcher:
+    """
+    Dispatch table of command handlers created once for the given books:
+    looking up a command is a single dict access returning a reusable handler
+    and its argument schema.
+    """
+
+    def __init__(self, address_book: AddressBook, notes_book: NotesBook):
+        self.address_book = address_book
+        self.notes_book = notes_book
+        self.table: Dict[str, Tuple[Command, ArgumentSchema]] = {}
+        self.version = -1
+
+    def rebuild(self) -> None:
+        books = {"contacts": self.address_book, "notes": self.notes_book, None: None}
+        self.table = {
+            name: (command(books[command.book], self.notes_book), command.schema)
+            for name, command in command_registry.items()
+        }
+        self.version = registry_version
+
+    def lookup(self, command_name: str) -> Optional[Tuple[Command, ArgumentSchema]]:
+        if self.version != registry_version:
+            self.rebuild()
+        return self.table.get(command_name)
+
+
+_dispatcher: Optional[CommandDispatcher] = None
+
+
+def get_dispatcher(address_book: AddressBook, notes_book: NotesBook) -> CommandDispatcher:
+    """Dispatcher for the given books, reused while the same books are passed in."""
+    global _dispatcher
+    if _dispatcher is None or _dispatcher.address_book is not address_book or _dispatcher.notes_book is not notes_book:
+        _dispatcher = CommandDispatcher(address_book, notes_book)
+    return _dispatcher
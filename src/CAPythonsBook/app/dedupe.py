@@ -0,0 +1,176 @@
+import re
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from app.fuzzy import edit_distance
+from app.indexes import tokenize
+
+# Contacts with a confidence below this are not reported as duplicates.
+DEFAULT_MIN_CONFIDENCE = 0.7
+# Blocks larger than this (a very common name key) are not compared pairwise:
+# each contact is compared only with its WINDOW neighbours in name order.
+MAX_BLOCK_SIZE = 50
+WINDOW = 10
+
+# Weights of the evidence in the confidence of a pair.
+NAME_WEIGHT = 0.5
+PHONE_WEIGHT = 0.4
+BIRTHDAY_WEIGHT = 0.1
+
+# Голосні (латиниця й кирилиця) та знаки, що не входять до фонетичного ключа
+_VOWELS = re.compile(r"[aeiouyаеєиіїоуюяьйъ'ʼ]+")
+_REPEATS = re.compile(r"(.)\1+")
+
+
+def normalized_name(name: str) -> str:
+    """Lower-cased words of the name in sorted order ("Petrenko Ivan" == "ivan petrenko")."""
+    return " ".join(sorted(tokenize(name)))
+
+
+def phonetic_key(name: str) -> str:
+    """
+    Rough phonetic key of a name: for every word, its first letter followed by
+    its consonants without repeats; the words in sorted order.
+    """
+    words = []
+    for word in sorted(tokenize(name)):
+        words.append(word[0] + _REPEATS.sub(r"\1", _VOWELS.sub("", word[1:])))
+    return " ".join(words)
+
+
+def phone_key(phone) -> str:
+    return re.sub(r"\D", "", str(phone))
+
+
+class DuplicateCluster:
+    """Contacts found to be duplicates of each other, in book order; 'confidence' is that of its weakest link."""
+
+    def __init__(self, records: List, confidence: float) -> None:
+        self.records = records
+        self.confidence = confidence
+
+
+def merged_fields(records: Sequence) -> Optional[Dict[str, str]]:
+    """
+    Values of the fields other than the name and phones the contacts would
+    have merged, or 'None' if two of them have different values of a field
+    (e.g. two birthdays): merging those would lose one of the values.
+    """
+    fields: Dict[str, str] = {}
+    for record in records:
+        for key, value in record.fields.items():
+            if key in ("name", "phones"):
+                continue
+            if fields.setdefault(key, str(value)) != str(value):
+                return None
+    return fields
+
+
+class _Features:
+    __slots__ = ("name", "phones", "birthday")
+
+    def __init__(self, record) -> None:
+        self.name = normalized_name(record.name.value)
+        self.phones = {phone_key(phone) for phone in record.phones}
+        birthday = record.fields.get("birthday")
+        self.birthday = str(birthday) if birthday is not None else None
+
+
+def pair_confidence(a: _Features, b: _Features) -> float:
+    """
+    How likely two contacts are the same person, from 0 to 1: the similarity of
+    the names, a shared phone and an equal birthday add up with their weights;
+    different birthdays halve the result.
+    """
+    longest = max(len(a.name), len(b.name)) or 1
+    score = NAME_WEIGHT * (1 - edit_distance(a.name, b.name) / longest)
+    if a.phones & b.phones:
+        score += PHONE_WEIGHT
+    if a.birthday is not None and b.birthday is not None:
+        if a.birthday == b.birthday:
+            score += BIRTHDAY_WEIGHT
+        else:
+            score *= 0.5
+    return score
+
+
+def _candidate_pairs(blocks: Dict[Tuple[str, str], List[int]], names: List[str]) -> Iterator[Tuple[int, int]]:
+    seen: Set[Tuple[int, int]] = set()
+    for members in blocks.values():
+        if len(members) < 2:
+            continue
+        if len(members) <= MAX_BLOCK_SIZE:
+            pairs = ((a, b) for i, a in enumerate(members) for b in members[i + 1:])
+        else:
+            # Sorted neighbourhood: only near neighbours in name order
+            ordered = sorted(members, key=lambda index: names[index])
+            pairs = ((a, b) for i, a in enumerate(ordered) for b in ordered[i + 1:i + 1 + WINDOW])
+        for a, b in pairs:
+            pair = (a, b) if a < b else (b, a)
+            if pair not in seen:
+                seen.add(pair)
+                yield pair
+
+
+def find_duplicates(records: Sequence, min_confidence: float = DEFAULT_MIN_CONFIDENCE) -> List[DuplicateCluster]:
+    """
+    Clusters of duplicate contacts. Instead of comparing every pair, contacts
+    are grouped into blocks by their phone numbers and the phonetic key of
+    their names, and only contacts sharing a block are compared. Pairs with
+    at least 'min_confidence' are joined into clusters with a union-find,
+    strongest first; a pair is not joined if its clusters have different
+    values of some field (see 'merged_fields'), so no cluster links two
+    contacts with, say, different birthdays through a third one.
+    """
+    features = [_Features(record) for record in records]
+    blocks: Dict[Tuple[str, str], List[int]] = {}
+    for index, (record, feature) in enumerate(zip(records, features)):
+        blocks.setdefault(("name", phonetic_key(record.name.value)), []).append(index)
+        for phone in feature.phones:
+            blocks.setdefault(("phone", phone), []).append(index)
+
+    parent = list(range(len(records)))
+    # root -> the lowest confidence of the pairs joined into its cluster
+    weakest: Dict[int, float] = {}
+    # root -> the field values of its cluster
+    cluster_fields: Dict[int, Dict[str, str]] = {}
+
+    def find(index: int) -> int:
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    def fields_of(root: int) -> Dict[str, str]:
+        if root not in cluster_fields:
+            cluster_fields[root] = merged_fields([records[root]])
+        return cluster_fields[root]
+
+    pairs = []
+    for a, b in _candidate_pairs(blocks, [feature.name for feature in features]):
+        confidence = pair_confidence(features[a], features[b])
+        if confidence >= min_confidence:
+            pairs.append((-confidence, a, b))
+    pairs.sort()
+
+    for confidence, a, b in pairs:
+        confidence = -confidence
+        root_a, root_b = find(a), find(b)
+        if root_a == root_b:
+            weakest[root_a] = min(weakest[root_a], confidence)
+            continue
+        fields_a, fields_b = fields_of(root_a), fields_of(root_b)
+        if any(fields_b.get(key, value) != value for key, value in fields_a.items()):
+            continue
+        # Корінь — менший індекс, щоб кластер починався з найстаршого запису
+        root, child = (root_a, root_b) if root_a < root_b else (root_b, root_a)
+        parent[child] = root
+        cluster_fields[root] = {**fields_a, **fields_b}
+        del cluster_fields[child]
+        weakest[root] = min(weakest.get(root, 1.0), weakest.pop(child, 1.0), confidence)
+
+    members: Dict[int, List] = {}
+    for index, record in enumerate(records):
+        root = find(index)
+        if root in weakest:
+            members.setdefault(root, []).append(record)
+    return [DuplicateCluster(members[root], round(weakest[root], 2)) for root in sorted(members)]
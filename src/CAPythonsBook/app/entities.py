@@ -1,15 +1,45 @@
 import json
 import os
 import uuid
-from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+import weakref
+from datetime import date, datetime, timedelta
+from functools import total_ordering
+from typing import TYPE_CHECKING, Iterator, List, Optional, Dict, Any, Tuple
 from collections import UserDict
+from itertools import islice
 from colorama import Fore, Style
+from app.metrics import metrics
+from app.tracing import tracer
+from app.cache import QueryCache
+from app.phones import country_code_of, normalize_phone
+from app.events import (
+    ContactEvent, Event, EventBus, FieldRemoved, FieldSet, NoteAdded, NoteDeleted, NoteEdited, NoteEvent,
+    PhoneAdded, PhoneEdited, PhoneRemoved, RecordAdded, RecordChanged, RecordRemoved, RecordsReset,
+)
+
+if TYPE_CHECKING:
+    # Індекси та сканування імпортуються при першому використанні, а не під час запуску
+    from app.fuzzy import BKTree
+    from app.indexes import ContactIndexes, SortedView
+    from app.scan import ScanEngine
+    from app.trie import PrefixTrie
 
 
 class Field:
     def __init__(self, value: str):
-        self.value = value
+        self.value = self.validate(value)
+
+    @classmethod
+    def validate(cls, value: str) -> str:
+        """Checks the raw value (raising 'ValueError') and returns the value to store."""
+        return value
+
+    @classmethod
+    def from_valid(cls, value: str) -> "Field":
+        """Field of a value that has already passed 'validate' (e.g. in a bulk-load worker)."""
+        field = cls.__new__(cls)
+        field.value = value
+        return field
 
     def __str__(self):
         return str(self.value)
@@ -19,26 +49,119 @@ class Field:
 
 
 class Name(Field):
-    def __init__(self, value: str):
-        if not value:
+    @classmethod
+    def validate(cls, value: str) -> str:
+        if not value or not isinstance(value, str):
             raise ValueError("Name cannot be empty.")
-        super().__init__(value)
+        return value
 
 
 class Phone(Field):
-    def __init__(self, value: str):
-        if not value.isdigit() or len(value.strip()) != 10:
-            raise ValueError("Phone number must be 10 digits")
-        super().__init__(value)
+    """
+    Phone number in the E.164 form ("+380671234567"), kept as the whole number
+    in an integer and its country calling code; 'value' is the E.164 text.
+    Legacy 10-digit numbers without a country ("1234567890") have no country
+    code and keep their digits as the value.
+    """
+
+    @classmethod
+    def validate(cls, value: str) -> str:
+        return normalize_phone(value)
+
+    @property
+    def value(self) -> str:
+        return str(self.number) if self.country_code is None else f"+{self.number}"
+
+    @value.setter
+    def value(self, value: str) -> None:
+        if value[:1] == "+":
+            self.number = int(value[1:])
+            self.country_code = country_code_of(value[1:])
+        else:
+            self.number = int(value)
+            self.country_code = None
 
 
+@total_ordering
 class Birthday(Field):
-    def __init__(self, value: str):
+    """
+    Date of birth. 'value' is the canonical "DD.MM.YYYY" text; the date is
+    parsed once and kept as its ordinal, so the accessors and comparisons
+    below do not parse the text again.
+    """
+
+    @classmethod
+    def validate(cls, value: str) -> str:
+        # Звичайний випадок (і всі збережені дати): рівно DD.MM.YYYY, без strptime
+        if isinstance(value, str) and len(value) == 10 and value[2] == value[5] == ".":
+            day, month, year = value[:2], value[3:5], value[6:]
+            if day.isdigit() and month.isdigit() and year.isdigit():
+                try:
+                    date(int(year), int(month), int(day))
+                    return value
+                except ValueError:
+                    pass
         try:
-            datetime.strptime(value, "%d.%m.%Y")
-        except ValueError:
+            parsed = datetime.strptime(value, "%d.%m.%Y").date()
+        except (ValueError, TypeError):
             raise ValueError("Invalid date format. Use DD.MM.YYYY")
-        super().__init__(value)
+        return f"{parsed.day:02d}.{parsed.month:02d}.{parsed.year:04d}"
+
+    @property
+    def value(self) -> str:
+        return self._value
+
+    @value.setter
+    def value(self, value: str) -> None:
+        self._value = value
+        self.ordinal = date(int(value[6:]), int(value[3:5]), int(value[:2])).toordinal()
+
+    @property
+    def date(self) -> date:
+        return date.fromordinal(self.ordinal)
+
+    @property
+    def month_day(self) -> Tuple[int, int]:
+        """(month, day) of the birthday, the order of birthdays within a year."""
+        return int(self._value[3:5]), int(self._value[:2])
+
+    @property
+    def day_of_year(self) -> int:
+        """Day of the year of the birthday in a leap year (1-366), the same every year."""
+        month, day = self.month_day
+        return date(2000, month, day).timetuple().tm_yday
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Birthday):
+            return NotImplemented
+        return self.ordinal == other.ordinal
+
+    def __lt__(self, other: "Birthday") -> bool:
+        if not isinstance(other, Birthday):
+            return NotImplemented
+        return self.ordinal < other.ordinal
+
+    def __hash__(self) -> int:
+        return hash(self.ordinal)
+
+
+def birthday_in_year(birthday: date, year: int) -> date:
+    """Birthday date in the given year; 29.02 falls on 01.03 in non-leap years."""
+    try:
+        return birthday.replace(year=year)
+    except ValueError:
+        return date(year, 3, 1)
+
+
+def next_birthday(birthday: date, today: date) -> date:
+    """The first birthday on or after 'today'."""
+    day = birthday_in_year(birthday, today.year)
+    return day if day >= today else birthday_in_year(birthday, today.year + 1)
+
+
+def congratulation_date(day: date) -> date:
+    """Birthdays falling on a weekend are celebrated on the following Monday."""
+    return day + timedelta(days=7 - day.weekday()) if day.weekday() > 4 else day
 
 
 class Record:
@@ -47,17 +170,39 @@ class Record:
         self.name = name
         self.fields: Dict[str, Field] = {"name": name}
         self.fields.update(fields)
+        # Weak reference to the address book holding the record: changes are published on its event bus.
+        self.owner: Optional[weakref.ref] = None
+
+    @classmethod
+    def from_fields(cls, record_id: uuid.UUID, fields: Dict[str, Any]) -> "Record":
+        """Record with a known id and already converted fields (the first one being "name")."""
+        record = cls.__new__(cls)
+        record.id = record_id
+        record.name = fields["name"]
+        record.fields = fields
+        record.owner = None
+        return record
+
+    def _publish(self, event: Event) -> None:
+        book = self.owner() if self.owner is not None else None
+        if book is not None:
+            book.events.publish(event)
 
     def add_field(self, field_name: str, field: Field):
+        old = self.fields.get(field_name)
         self.fields[field_name] = field
+        self._publish(FieldSet(self, field_name, old, field))
 
     def remove_field(self, field_name: str):
         if field_name in self.fields:
-            del self.fields[field_name]
+            old = self.fields.pop(field_name)
+            self._publish(FieldRemoved(self, field_name, old))
 
     def edit_field(self, field_name: str, new_field: Field):
         if field_name in self.fields:
+            old = self.fields[field_name]
             self.fields[field_name] = new_field
+            self._publish(FieldSet(self, field_name, old, new_field))
 
     def matches_criteria(self, keyword: str) -> bool:
         for field in self.fields.values():
@@ -65,15 +210,35 @@ class Record:
                 return True
         return False
 
+    @property
+    def phones(self) -> List[Phone]:
+        return self.fields.get("phones", [])
+
     def add_phone(self, phone: Phone):
         if "phones" not in self.fields:
             self.fields["phones"] = []
         self.fields["phones"].append(phone)
+        self._publish(PhoneAdded(self, phone))
+
+    def edit_phone(self, old_phone: Phone, new_phone: Phone):
+        for index, phone in enumerate(self.phones):
+            if phone.value == old_phone.value:
+                self.fields["phones"][index] = new_phone
+                self._publish(PhoneEdited(self, phone, new_phone))
+                return
+        raise ValueError(f"Phone number '{old_phone.value}' not found.")
+
+    def remove_phone(self, phone: Phone):
+        phones = [p for p in self.phones if p.value != phone.value]
+        if len(phones) != len(self.phones):
+            self.fields["phones"] = phones
+            self._publish(PhoneRemoved(self, phone))
 
     def to_dict(self):
         return {k: [f.to_dict() for f in v] if isinstance(v, list) else v.to_dict() for k, v in self.fields.items()}
 
-    def __str__(self):
+    def summary(self) -> str:
+        """One-line description of the contact without colors."""
         field_strings = []
         for key, value in self.fields.items():
             if isinstance(value, list):
@@ -82,51 +247,328 @@ class Record:
                 field_str = str(value)
             field_strings.append(f"{key}: {field_str}")
         field_str = "; ".join(field_strings)
-        return f"{Fore.GREEN}Contact {field_str}{Style.RESET_ALL}"
+        return f"Contact {field_str}"
+
+    def __str__(self):
+        return f"{Fore.GREEN}{self.summary()}{Style.RESET_ALL}"
+
+
+def name_sort_key(record: Record):
+    # Imported here: startup does not sort by name.
+    from app.collation import collation_key
+
+    return collation_key(record.name.value)
+
+
+def birthday_sort_key(record: Record):
+    """Calendar order of the birthdays (month and day, whatever the year), then the name; no birthday last."""
+    birthday = record.fields.get("birthday")
+    return (birthday.month_day if birthday is not None else (13, 0)), name_sort_key(record)
+
+
+# Orders of 'AddressBook.sorted_records' kept in sorted views; "created" is the order of the book itself.
+SORT_KEYS = {"name": name_sort_key, "birthday": birthday_sort_key}
+SORT_ORDERS = ("created", *SORT_KEYS)
 
 
 class AddressBook(UserDict):
+    def __init__(self, records: Optional[Dict[uuid.UUID, Record]] = None):
+        # Збільшується при кожній зміні книги; результати запитів кешуються для поточного значення.
+        self.generation = 0
+        self.cache = QueryCache("contacts_cache")
+        # Changes of the book and its records; the indexes below follow them synchronously.
+        self.events = EventBus()
+        self.events.subscribe(ContactEvent, self._bump_generation)
+        self.events.subscribe(RecordAdded, self._index_add)
+        self.events.subscribe(RecordRemoved, self._index_remove)
+        self.events.subscribe(RecordChanged, self._index_update)
+        self.events.subscribe(RecordsReset, self._reset_indexes)
+        # Sorted views by order name, built on first use (see 'sorted_records')
+        self._sorted_views: Dict[str, "SortedView"] = {}
+        super().__init__()
+        if records:
+            self.load(records)
+
+    def load(self, records: Dict[uuid.UUID, Record]) -> None:
+        """Adds the records in bulk: a single 'RecordsReset' event instead of one per record."""
+        owner = weakref.ref(self)
+        for record in records.values():
+            record.owner = owner
+        self.data.update(records)
+        self.events.publish(RecordsReset())
+
+    # State of the records saved by 'begin'; 'None' outside of a transaction.
+    snapshot: Optional[Dict[uuid.UUID, tuple]] = None
+    # Name indexes, built on first use and then kept up to date: a prefix trie of
+    # the contact names and a BK-tree of the lower-cased names to record ids.
+    _name_index: "Optional[PrefixTrie]" = None
+    _fuzzy_index: "Optional[BKTree]" = None
+    # Field indexes of the query planner ('search'), also built on first use.
+    _query_indexes: "Optional[ContactIndexes]" = None
+    # Full scans of queries no index covers; created on first use.
+    _scan_engine: "Optional[ScanEngine]" = None
+
+    @property
+    def name_index(self) -> "PrefixTrie":
+        if self._name_index is None:
+            # Imported here: the indexes are built on first use, not at startup.
+            from app.trie import PrefixTrie
+
+            self._name_index = PrefixTrie(record.name.value for record in self.data.values())
+        return self._name_index
+
+    @property
+    def fuzzy_index(self) -> "BKTree":
+        if self._fuzzy_index is None:
+            # Imported here: the indexes are built on first use, not at startup.
+            from app.fuzzy import BKTree
+
+            self._fuzzy_index = BKTree()
+            for record_id, record in self.data.items():
+                self._fuzzy_index.add(record.name.value.lower(), record_id)
+        return self._fuzzy_index
+
+    @property
+    def query_indexes(self) -> "ContactIndexes":
+        if self._query_indexes is None:
+            # Imported here: the indexes are built on first use, not at startup.
+            from app.indexes import ContactIndexes
+
+            self._query_indexes = ContactIndexes()
+            for record_id, record in self.data.items():
+                self._query_indexes.add(record_id, record)
+        return self._query_indexes
+
+    @property
+    def scan_engine(self) -> "ScanEngine":
+        if self._scan_engine is None:
+            # Imported here: the settings file and the scan engine are needed only by a scan.
+            from app.scan import ScanEngine
+            from app.settings import get_settings
+
+            self._scan_engine = ScanEngine(get_settings().scan_workers)
+        return self._scan_engine
+
+    def _bump_generation(self, event: ContactEvent) -> None:
+        self.generation += 1
+
+    def _index_add(self, event: RecordAdded) -> None:
+        record_id, record = event.record_id, event.record
+        record.owner = weakref.ref(self)
+        if self._query_indexes is not None:
+            self._query_indexes.add(record_id, record)
+        if self._scan_engine is not None:
+            self._scan_engine.add(record_id, record)
+        if self._name_index is not None:
+            self._name_index.add(record.name.value)
+        if self._fuzzy_index is not None:
+            self._fuzzy_index.add(record.name.value.lower(), record_id)
+        for order, view in self._sorted_views.items():
+            view.set(record_id, SORT_KEYS[order](record))
+
+    def _index_remove(self, event: RecordRemoved) -> None:
+        record_id, record = event.record_id, event.record
+        record.owner = None
+        if self._query_indexes is not None:
+            self._query_indexes.remove(record_id)
+        if self._scan_engine is not None:
+            self._scan_engine.remove(record_id)
+        if self._name_index is not None:
+            self._name_index.remove(record.name.value)
+        if self._fuzzy_index is not None:
+            self._fuzzy_index.remove(record.name.value.lower(), record_id)
+        for view in self._sorted_views.values():
+            view.discard(record_id)
+
+    def _index_update(self, event: RecordChanged) -> None:
+        record = event.record
+        if record.id not in self.data:
+            return
+        if self._query_indexes is not None:
+            self._query_indexes.update(record.id, record)
+        if self._scan_engine is not None:
+            self._scan_engine.update(record.id, record)
+        for order, view in self._sorted_views.items():
+            view.set(record.id, SORT_KEYS[order](record))
+
+    def _reset_indexes(self, event: RecordsReset) -> None:
+        # Індекси будуються заново при наступному використанні
+        self._name_index = None
+        self._fuzzy_index = None
+        self._query_indexes = None
+        self._sorted_views = {}
+        if self._scan_engine is not None:
+            self._scan_engine.reset()
+
+    def __setitem__(self, record_id: uuid.UUID, record: Record) -> None:
+        old = self.data.get(record_id)
+        if old is not None:
+            self.events.publish(RecordRemoved(record_id, old))
+        self.data[record_id] = record
+        self.events.publish(RecordAdded(record_id, record))
+
+    def __delitem__(self, record_id: uuid.UUID) -> None:
+        record = self.data.pop(record_id)
+        self.events.publish(RecordRemoved(record_id, record))
+
+    @property
+    def in_transaction(self) -> bool:
+        return self.snapshot is not None
+
+    def begin(self) -> None:
+        """
+        Starts a transaction: changes are made in memory as usual and either kept
+        by 'commit' or undone by 'rollback'. Records are changed in place, so the
+        snapshot keeps each record with a copy of its fields (and phone lists).
+        """
+        if self.in_transaction:
+            raise ValueError("A transaction is already in progress.")
+        self.snapshot = {
+            record_id: (record, record.name, {k: list(v) if isinstance(v, list) else v for k, v in record.fields.items()})
+            for record_id, record in self.data.items()
+        }
+
+    def commit(self) -> None:
+        if not self.in_transaction:
+            raise ValueError("No transaction in progress.")
+        self.snapshot = None
+
+    def rollback(self) -> None:
+        if not self.in_transaction:
+            raise ValueError("No transaction in progress.")
+        # Записи, додані в транзакції, більше не належать книзі
+        for record_id, record in self.data.items():
+            if record_id not in self.snapshot:
+                record.owner = None
+        owner = weakref.ref(self)
+        self.data = {}
+        for record_id, (record, name, fields) in self.snapshot.items():
+            record.name = name
+            record.fields = fields
+            # Deleted records lost their owner in '_index_remove'
+            record.owner = owner
+            self.data[record_id] = record
+        self.snapshot = None
+        self.events.publish(RecordsReset())
+
     def add_record(self, record: Record):
-        self.data[record.id] = record
+        self[record.id] = record
 
     def delete(self, record_id: uuid.UUID):
         if record_id in self.data:
-            del self.data[record_id]
+            del self[record_id]
         else:
             raise KeyError(f"Record with ID '{record_id}' not found")
 
+    def merge(self, records: List[Record]) -> Record:
+        """
+        Merges duplicate contacts into the first one: it gets the phones it does
+        not have yet and the fields it lacks; the other contacts are deleted.
+        Contacts with different values of a field (e.g. two birthdays) are not
+        merged, since one of the values would be lost.
+        """
+        # Imported here: startup does not need the duplicate checks.
+        from app.dedupe import merged_fields
+
+        if merged_fields(records) is None:
+            raise ValueError("Contacts with different values of the same field cannot be merged.")
+        target, duplicates = records[0], records[1:]
+        for record in duplicates:
+            known = {phone.value for phone in target.phones}
+            for phone in record.phones:
+                if phone.value not in known:
+                    known.add(phone.value)
+                    target.add_phone(phone)
+            for key, value in record.fields.items():
+                if key not in ("name", "phones") and key not in target.fields:
+                    target.add_field(key, value)
+            self.delete(record.id)
+        return target
+
     def find_by_name(self, name: Name) -> Optional[Record]:
-        for record in self.data.values():
-            if record.fields["name"].value == name.value:
-                return record
-        return None
+        with tracer.span("find_by_name", "entities"):
+            for record in self.data.values():
+                if record.fields["name"].value == name.value:
+                    return record
+            return None
+
+    def search(self, query: str) -> Iterator[Record]:
+        """
+        Contacts matching a query (see 'app.query.parse_query'), in name order
+        (see 'name_sort_key'). If the query has an indexed predicate to start
+        from, the most selective one is looked up and the rest of the query is
+        checked only on the contacts it returns; otherwise the whole book is
+        scanned (by worker processes for large books, see 'app.scan'). Either
+        way the order is the same. Results are cached until the book changes.
+        """
+        key = ("search", " ".join(query.lower().split()))
+        return iter(self.cache.get(key, self.generation, lambda: self._search(query)))
+
+    def _search(self, query: str) -> List[Record]:
+        # Imported here: startup does not need the query language.
+        from app.query import parse_query
+
+        node = parse_query(query)
+        with tracer.span("search", "entities", query=query):
+            indexes = self.query_indexes
+            if node.estimate(indexes) is None:
+                found = self.scan_engine.scan(node, list(self.data.values()))
+            else:
+                records = (self.data[record_id] for record_id in node.candidates(indexes))
+                found = [record for record in records if node.matches(record)]
+            return sorted(found, key=lambda record: (name_sort_key(record), str(record.id)))
+
+    def sorted_records(self, order: str = "created", offset: int = 0, limit: Optional[int] = None) -> List[Record]:
+        """
+        A page of the contacts in one of SORT_ORDERS. The "name" and "birthday"
+        orders come from sorted views built on first use and then kept up to
+        date, so a page costs a slice rather than a sort of the whole book.
+        """
+        end = None if limit is None else offset + limit
+        if order == "created":
+            return list(islice(self.data.values(), offset, end))
+        view = self._sorted_views.get(order)
+        if view is None:
+            # Imported here: startup does not need the sorted views.
+            from app.indexes import SortedView
+
+            key = SORT_KEYS[order]
+            view = SortedView((key(record), record_id) for record_id, record in self.data.items())
+            self._sorted_views[order] = view
+        return [self.data[record_id] for record_id in view.page(offset, limit)]
+
+    def find_similar(self, name: str, max_distance: int) -> List[Record]:
+        """Contacts whose names are within 'max_distance' edits of the name, closest first."""
+        with tracer.span("find_similar", "entities"):
+            return [
+                self.data[record_id]
+                for _, _, record_ids in self.fuzzy_index.search(name.lower(), max_distance)
+                for record_id in sorted(record_ids, key=str)
+            ]
+
+    def suggest_names(self, name: str, max_distance: int, limit: int = 3) -> List[str]:
+        """Names of the closest contacts, for "did you mean" hints."""
+        matches = self.fuzzy_index.search(name.lower(), max_distance)
+        return [self.data[next(iter(record_ids))].name.value for _, _, record_ids in matches[:limit]]
 
     def get_upcoming_birthdays(self) -> List[Dict[str, str]]:
         today = datetime.today().date()
+        key = ("upcoming_birthdays", today)
+        return list(self.cache.get(key, self.generation, lambda: self._upcoming_birthdays(today)))
+
+    def _upcoming_birthdays(self, today: date) -> List[Dict[str, str]]:
         upcoming_birthdays = []
 
         for record in self.data.values():
             if "birthday" in record.fields:
-                birthday = datetime.strptime(
-                    record.fields["birthday"].value, "%d.%m.%Y").date()
-                birthday_this_year = birthday.replace(year=today.year)
-
-                if birthday_this_year < today:
-                    birthday_this_year = birthday_this_year.replace(
-                        year=today.year + 1)
+                birthday_this_year = next_birthday(record.fields["birthday"].date, today)
 
                 day_difference = (birthday_this_year - today).days
                 if 0 <= day_difference <= 7:
-                    congratulation_date = birthday_this_year
-                    if birthday_this_year.weekday() > 4:
-                        congratulation_date += timedelta(
-                            days=7 - birthday_this_year.weekday()
-                        )
-
                     upcoming_birthdays.append(
                         {
                             "name": record.fields["name"].value,
-                            "congratulation_date": congratulation_date.strftime(
+                            "congratulation_date": congratulation_date(birthday_this_year).strftime(
                                 "%d.%m.%Y"
                             ),
                         }
@@ -142,16 +584,26 @@ class NotesBook:
     def __init__(self, file_name: str = 'notes.json') -> None:
         self.file_name = file_name
         self.notes: List[Dict[str, str]] = self.load_notes()
+        # Збільшується при кожній зміні нотаток (див. 'AddressBook.generation').
+        self.generation = 0
+        self.cache = QueryCache("notes_cache")
+        self.events = EventBus()
+        self.events.subscribe(NoteEvent, self._bump_generation)
+
+    def _bump_generation(self, event: NoteEvent) -> None:
+        self.generation += 1
 
     def load_notes(self) -> List[Dict[str, str]]:
-        if os.path.exists(self.file_name):
-            with open(self.file_name, 'r', encoding='utf-8') as file:
-                return json.load(file)
-        return []
+        with metrics.measure("storage", "load_notes"):
+            if os.path.exists(self.file_name):
+                with open(self.file_name, 'r', encoding='utf-8') as file:
+                    return json.load(file)
+            return []
 
     def save_notes(self) -> None:
-        with open(self.file_name, 'w', encoding='utf-8') as file:
-            json.dump(self.notes, file, ensure_ascii=False, indent=4)
+        with metrics.measure("storage", "save_notes"):
+            with open(self.file_name, 'w', encoding='utf-8') as file:
+                json.dump(self.notes, file, ensure_ascii=False, indent=4)
 
     def add_note(self, title: str, text: str, tags: List[str]) -> None:
         note_id = str(uuid.uuid4())
@@ -162,6 +614,7 @@ class NotesBook:
             "tags": tags
         }
         self.notes.append(new_note)
+        self.events.publish(NoteAdded(new_note))
         self.save_notes()
 
     def edit_note(self, note_id: str, new_title: str, new_text: str) -> None:
@@ -169,15 +622,24 @@ class NotesBook:
             if note['id'] == note_id:
                 note['title'] = new_title
                 note['text'] = new_text
+                self.events.publish(NoteEdited(note))
                 self.save_notes()
                 return
         raise KeyError(f"Note with ID '{note_id}' does not exist.")
 
     def delete_note(self, note_id: str) -> None:
+        deleted = [note for note in self.notes if note['id'] == note_id]
         self.notes = [note for note in self.notes if note['id'] != note_id]
+        for note in deleted:
+            self.events.publish(NoteDeleted(note))
         self.save_notes()
 
     def search_notes(self, keyword: str) -> List[Dict[str, str]]:
+        """Notes whose title, text or tags contain the keyword; cached until the notes change."""
+        key = keyword.lower().strip()
+        return list(self.cache.get(key, self.generation, lambda: self._search_notes(keyword)))
+
+    def _search_notes(self, keyword: str) -> List[Dict[str, str]]:
         results = []
         for note in self.notes:
             if (keyword.lower() in note['title'].lower() or
@@ -186,13 +648,14 @@ class NotesBook:
                 results.append(note)
         return results
 
-    def display_notes(self) -> None:
+    def display_notes(self, writer, offset: int = 0, limit: Optional[int] = None) -> None:
+        """Writes the notes (or the requested page of them) line by line to 'writer'."""
         if not self.notes:
             raise ValueError("No notes available.")
         else:
-            for note in self.notes:
+            for note in self.notes[offset:None if limit is None else offset + limit]:
                 # print(f"ID: {note['id']}\nTitle: {note['title']}\nText: {
                 #       note['text']}\nTags: {', '.join(note['tags'])}\n{'-'*40}")
-                print(f"\nID: {note['id']}\nTitle: {
-                      note['title']}\nText: {note['text']}\n")
-                print('-'*40)
+                writer.write_line(f"\nID: {note['id']}\nTitle: {
+                                  note['title']}\nText: {note['text']}\n")
+                writer.write_line('-'*40)
@@ -0,0 +1,152 @@
+import uuid
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Tuple, Type
+
+
+class Event:
+    """Base class of the change events published by the books and their records."""
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={value!r}" for name, value in vars(self).items())
+        return f"{type(self).__name__}({fields})"
+
+
+# After 'Event': a forward reference ("Event") is compiled on import, which slows startup.
+Handler = Callable[[Event], None]
+
+
+# --- Контакти ---
+
+class ContactEvent(Event):
+    """Any change of an address book."""
+
+
+class RecordAdded(ContactEvent):
+    def __init__(self, record_id: uuid.UUID, record: Any) -> None:
+        self.record_id = record_id
+        self.record = record
+
+
+class RecordRemoved(ContactEvent):
+    def __init__(self, record_id: uuid.UUID, record: Any) -> None:
+        self.record_id = record_id
+        self.record = record
+
+
+class RecordChanged(ContactEvent):
+    """A field of a record in the book has changed (one of the subclasses below)."""
+
+    def __init__(self, record: Any) -> None:
+        self.record = record
+
+
+class FieldSet(RecordChanged):
+    def __init__(self, record: Any, field_name: str, old: Any, new: Any) -> None:
+        super().__init__(record)
+        self.field_name = field_name
+        self.old = old
+        self.new = new
+
+
+class FieldRemoved(RecordChanged):
+    def __init__(self, record: Any, field_name: str, old: Any) -> None:
+        super().__init__(record)
+        self.field_name = field_name
+        self.old = old
+
+
+class PhoneAdded(RecordChanged):
+    def __init__(self, record: Any, phone: Any) -> None:
+        super().__init__(record)
+        self.phone = phone
+
+
+class PhoneEdited(RecordChanged):
+    def __init__(self, record: Any, old: Any, new: Any) -> None:
+        super().__init__(record)
+        self.old = old
+        self.new = new
+
+
+class PhoneRemoved(RecordChanged):
+    def __init__(self, record: Any, phone: Any) -> None:
+        super().__init__(record)
+        self.phone = phone
+
+
+class RecordsReset(ContactEvent):
+    """Records were added or replaced in bulk (initial load, transaction rollback) without per-record events."""
+
+
+# --- Нотатки ---
+
+class NoteEvent(Event):
+    def __init__(self, note: Dict[str, Any]) -> None:
+        self.note = note
+
+
+class NoteAdded(NoteEvent):
+    pass
+
+
+class NoteEdited(NoteEvent):
+    pass
+
+
+class NoteDeleted(NoteEvent):
+    pass
+
+
+class EventBus:
+    """
+    Delivers events to the handlers subscribed to their type or any of its base
+    classes. Synchronous handlers run inside 'publish', before it returns;
+    queued handlers get the events later, in order, when 'drain' is called.
+    """
+
+    def __init__(self) -> None:
+        self.handlers: Dict[Type[Event], List[Tuple[Handler, bool]]] = {}
+        self.queue: Deque[Event] = deque()
+        # event type -> (synchronous handlers, queued handlers), resolved over the MRO once
+        self._resolved: Dict[Type[Event], Tuple[Tuple[Handler, ...], Tuple[Handler, ...]]] = {}
+
+    def subscribe(self, event_type: Type[Event], handler: Handler, queued: bool = False) -> Callable[[], None]:
+        """Subscribes the handler; returns a function cancelling the subscription."""
+        entry = (handler, queued)
+        self.handlers.setdefault(event_type, []).append(entry)
+        self._resolved.clear()
+
+        def unsubscribe() -> None:
+            handlers = self.handlers.get(event_type, [])
+            if entry in handlers:
+                handlers.remove(entry)
+                self._resolved.clear()
+
+        return unsubscribe
+
+    def _resolve(self, event_type: Type[Event]) -> Tuple[Tuple[Handler, ...], Tuple[Handler, ...]]:
+        resolved = self._resolved.get(event_type)
+        if resolved is None:
+            entries = [entry for cls in event_type.__mro__ for entry in self.handlers.get(cls, ())]
+            resolved = self._resolved[event_type] = (
+                tuple(handler for handler, queued in entries if not queued),
+                tuple(handler for handler, queued in entries if queued),
+            )
+        return resolved
+
+    def publish(self, event: Event) -> None:
+        sync_handlers, queued_handlers = self._resolve(type(event))
+        for handler in sync_handlers:
+            handler(event)
+        if queued_handlers:
+            self.queue.append(event)
+
+    def drain(self) -> int:
+        """Delivers the queued events to the queued handlers; returns how many events were delivered."""
+        delivered = 0
+        while self.queue:
+            event = self.queue.popleft()
+            for handler in self._resolve(type(event))[1]:
+                handler(event)
+            delivered += 1
+        return delivered
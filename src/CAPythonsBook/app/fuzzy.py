@@ -0,0 +1,102 @@
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+
+
+def edit_distance(a: str, b: str) -> int:
+    """Levenshtein distance: the number of inserted, deleted or replaced characters."""
+    # Спільні початок і кінець не впливають на відстань (імена часто їх мають)
+    shortest = min(len(a), len(b))
+    start = 0
+    while start < shortest and a[start] == b[start]:
+        start += 1
+    end = 0
+    while end < shortest - start and a[-1 - end] == b[-1 - end]:
+        end += 1
+    return _levenshtein(a[start:len(a) - end], b[start:len(b) - end])
+
+
+def _levenshtein(a: str, b: str) -> int:
+    # Bit-parallel algorithm of Myers (Hyyrö's form): a column of the distance
+    # matrix is kept as bit vectors of +1/-1 vertical steps, one integer
+    # operation per character of 'a' instead of a loop over 'b'.
+    if not b:
+        return len(a)
+    peq: Dict[str, int] = {}
+    for index, char in enumerate(b):
+        peq[char] = peq.get(char, 0) | (1 << index)
+    mask = (1 << len(b)) - 1
+    last = 1 << (len(b) - 1)
+    pv, mv, score = mask, 0, len(b)
+    for char in a:
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        ph = (ph << 1) | 1
+        mh <<= 1
+        pv = (mh | ~(xv | ph)) & mask
+        mv = ph & xv
+    return score
+
+
+class _Node:
+    __slots__ = ("key", "items", "children")
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+        self.items: Set[Hashable] = set()
+        # distance to this node's key -> child
+        self.children: Dict[int, "_Node"] = {}
+
+
+class BKTree:
+    """
+    Burkhard-Keller tree over edit distance. Each key (a lower-cased contact
+    name) holds the items filed under it (record ids). A search with distance
+    'n' only descends into children whose distance to their parent is within
+    'n' of the query's distance to the parent, so most of the tree is skipped.
+    Removing the last item of a key leaves its node in place as a branching point.
+    """
+
+    def __init__(self) -> None:
+        self.root: Optional[_Node] = None
+
+    def add(self, key: str, item: Hashable) -> None:
+        if self.root is None:
+            self.root = _Node(key)
+        node = self.root
+        while node.key != key:
+            distance = edit_distance(key, node.key)
+            child = node.children.get(distance)
+            if child is None:
+                child = node.children[distance] = _Node(key)
+            node = child
+        node.items.add(item)
+
+    def remove(self, key: str, item: Hashable) -> None:
+        node = self.root
+        while node is not None and node.key != key:
+            node = node.children.get(edit_distance(key, node.key))
+        if node is not None:
+            node.items.discard(item)
+
+    def search(self, key: str, max_distance: int) -> List[Tuple[int, str, Set[Hashable]]]:
+        """'(distance, key, items)' of the keys within 'max_distance', closest first."""
+        if self.root is None:
+            return []
+        found = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            distance = edit_distance(key, node.key)
+            if distance <= max_distance and node.items:
+                found.append((distance, node.key, set(node.items)))
+            for child_distance, child in node.children.items():
+                if distance - max_distance <= child_distance <= distance + max_distance:
+                    stack.append(child)
+        found.sort(key=lambda match: (match[0], match[1]))
+        return found
@@ -0,0 +1,147 @@
+import re
+import uuid
+from bisect import bisect_left, insort
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from app.phones import phone_digits, suffix_key
+
+# Characters separating the words of the token index.
+TOKEN_SEPARATORS = re.compile(r"[\W_]+")
+# Upper bound of all the keys starting with a prefix.
+_MAX_CHAR = chr(0x10FFFF)
+
+
+def tokenize(value: str) -> List[str]:
+    return [token for token in TOKEN_SEPARATORS.split(value.lower()) if token]
+
+
+def field_values(record, field_name: Optional[str]) -> List[str]:
+    """
+    Lower-cased values of a field of the record ('phone' means the phone
+    numbers); with no field name, the words of all the fields.
+    """
+    if field_name is None:
+        return [token for value in field_values(record, "*") for token in tokenize(value)]
+    values = []
+    for name, value in record.fields.items():
+        name = name.lower()
+        if field_name == "*" or name == field_name or (field_name == "phone" and name == "phones"):
+            for field in value if isinstance(value, list) else [value]:
+                values.append(str(field).lower())
+    return values
+
+
+class SortedIndex:
+    """
+    Index from keys to record ids. The distinct keys are kept sorted (with
+    'bisect'), so exact keys, prefixes and ranges are found without a scan.
+    """
+
+    def __init__(self) -> None:
+        self.keys: List[str] = []
+        self.ids: Dict[str, Set[uuid.UUID]] = {}
+
+    def add(self, key: str, record_id: uuid.UUID) -> None:
+        ids = self.ids.get(key)
+        if ids is None:
+            ids = self.ids[key] = set()
+            insort(self.keys, key)
+        ids.add(record_id)
+
+    def remove(self, key: str, record_id: uuid.UUID) -> None:
+        ids = self.ids.get(key)
+        if ids is None:
+            return
+        ids.discard(record_id)
+        if not ids:
+            del self.ids[key]
+            del self.keys[bisect_left(self.keys, key)]
+
+    def prefix_range(self, prefix: str) -> Tuple[int, int]:
+        """Positions in 'keys' of the keys starting with the prefix."""
+        return bisect_left(self.keys, prefix), bisect_left(self.keys, prefix + _MAX_CHAR)
+
+    def keys_with_prefix(self, prefix: str) -> Iterator[str]:
+        start, end = self.prefix_range(prefix)
+        for index in range(start, end):
+            yield self.keys[index]
+
+
+class SortedView:
+    """
+    Record ids in the order of a precomputed sort key, kept sorted with
+    'bisect' as records are added, changed and removed: a page of the
+    listing is a slice, without sorting the book or computing keys again.
+    """
+
+    def __init__(self, items: Iterable[Tuple[Any, uuid.UUID]] = ()) -> None:
+        self.entries: List[Tuple[Any, uuid.UUID]] = sorted(items)
+        self.keys: Dict[uuid.UUID, Any] = {record_id: key for key, record_id in self.entries}
+
+    def set(self, record_id: uuid.UUID, key: Any) -> None:
+        """Adds the record, or moves it if its key has changed."""
+        old = self.keys.get(record_id)
+        if old is not None:
+            if old == key:
+                return
+            self.discard(record_id)
+        self.keys[record_id] = key
+        insort(self.entries, (key, record_id))
+
+    def discard(self, record_id: uuid.UUID) -> None:
+        key = self.keys.pop(record_id, None)
+        if key is not None:
+            del self.entries[bisect_left(self.entries, (key, record_id))]
+
+    def page(self, offset: int = 0, limit: Optional[int] = None) -> List[uuid.UUID]:
+        end = None if limit is None else offset + limit
+        return [record_id for _, record_id in self.entries[offset:end]]
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+class ContactIndexes:
+    """
+    Indexes of an address book used by the query planner: names, phone
+    numbers, birthdays and the words of all the fields, plus the phone digits
+    reversed ('phone_suffixes'), which finds the numbers ending with some
+    digits by a prefix lookup. The keys of every
+    record are remembered, so a changed record is re-indexed by dropping its
+    old keys and adding the new ones.
+    """
+
+    FIELDS = ("name", "phone", "birthday")
+    TOKEN = "token"
+    PHONE_SUFFIX = "phone_suffix"
+
+    def __init__(self) -> None:
+        self.indexes: Dict[str, SortedIndex] = {
+            name: SortedIndex() for name in self.FIELDS + (self.TOKEN, self.PHONE_SUFFIX)
+        }
+        self.phone_suffixes = self.indexes[self.PHONE_SUFFIX]
+        self.record_keys: Dict[uuid.UUID, Dict[str, Set[str]]] = {}
+
+    def add(self, record_id: uuid.UUID, record) -> None:
+        keys = {name: set(field_values(record, name)) for name in self.FIELDS}
+        keys[self.TOKEN] = set(field_values(record, None))
+        keys[self.PHONE_SUFFIX] = {suffix_key(phone_digits(phone)) for phone in keys["phone"]}
+        for name, values in keys.items():
+            for value in values:
+                self.indexes[name].add(value, record_id)
+        self.record_keys[record_id] = keys
+
+    def remove(self, record_id: uuid.UUID) -> None:
+        for name, values in self.record_keys.pop(record_id, {}).items():
+            for value in values:
+                self.indexes[name].remove(value, record_id)
+
+    def update(self, record_id: uuid.UUID, record) -> None:
+        self.remove(record_id)
+        self.add(record_id, record)
+
+    def index_for(self, field_name: Optional[str]) -> Optional[SortedIndex]:
+        """Index serving the field ('None' for bare words), or 'None' if the field is not indexed."""
+        if field_name is None:
+            return self.indexes[self.TOKEN]
+        return self.indexes[field_name] if field_name in self.FIELDS else None
@@ -1,26 +1,40 @@
 from abc import ABC, abstractmethod
 from typing import Dict
 from app.entities import Record, Field, AddressBook, Name, NotesBook
+from app.arguments import ArgumentSchema
 import uuid
 from presentation.messages import Message
+from app.settings import get_settings
 
 
 class Command(ABC):
     description = ""
     exit_command_flag = False
+    # Set by 'register_command': the book the command works with and its argument schema.
+    book = "contacts"
+    schema = ArgumentSchema()
 
     def __init__(
         self,
         book_type: AddressBook | NotesBook,
-        #  notes_book: NotesBook
+        notes_book: NotesBook = None,
     ):
         self.book_type = book_type
-        # self.notes_book = notes_book
+        # Commands working with both books (e.g. 'memory') use it alongside 'book_type'.
+        self.notes_book = notes_book
 
     @abstractmethod
-    def execute(self, *args: str) -> None:
+    def execute(self, *args, **options) -> None:
+        """Runs the command with the arguments already parsed and converted by its schema."""
         pass
 
+    def contact_not_found(self, name: Name) -> None:
+        """Reports a missing contact along with the closest existing names, if any."""
+        Message.error("contact_not_found", name=name.value)
+        suggestions = self.book_type.suggest_names(name.value, get_settings().fuzzy_distance)
+        if suggestions:
+            Message.info("did_you_mean", names=", ".join(suggestions))
+
 
 # Базовий клас для команд, що працюють з полями (Field). Він наслідує від 'Command' і додає специфічні методи для роботи з полями.
 class FieldCommand(Command, ABC):
@@ -28,23 +42,14 @@ class FieldCommand(Command, ABC):
     def execute_field(self, record: Record, field: Field) -> None:
         pass
 
-    def execute(self, *args: str) -> None:
-        if len(args) < 2:
-            Message.error("incorrect_arguments")
-            return
-        name, *field_args = args
-        record = self.book_type.find_by_name(Name(name))
+    def execute(self, name: Name, field: Field) -> None:
+        record = self.book_type.find_by_name(name)
         if not record:
-            Message.error("contact_not_found", name=name)
+            self.contact_not_found(name)
             return
 
-        field = self.create_field(*field_args)
         self.execute_field(record, field)
 
-    @abstractmethod
-    def create_field(self, *args: str) -> Field:
-        pass
-
 
 # Інтерфейс для класів, які будуть відповідати за збереження і завантаження контактів.
 class StorageInterface(ABC):
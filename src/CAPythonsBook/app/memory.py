@@ -0,0 +1,118 @@
+import sys
+import tracemalloc
+from typing import Any, Dict, List, Optional, Set
+
+from app.entities import AddressBook, Birthday, Field, Name, NotesBook, Phone
+
+# Field classes reported separately; any other field is accounted as generic 'Field'.
+FIELD_TYPES = (Name, Phone, Birthday)
+
+
+def deep_sizeof(obj: Any, seen: Set[int]) -> int:
+    """
+    Size in bytes of 'obj' and everything reachable from it through containers,
+    instance '__dict__' and '__slots__'. Objects whose id is in 'seen' are skipped
+    and every visited object is added to it, so shared objects are counted once.
+    """
+    size = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen or isinstance(current, type):
+            continue
+        seen.add(id(current))
+        size += sys.getsizeof(current)
+
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        if hasattr(current, "__dict__"):
+            stack.append(current.__dict__)
+        for slot in getattr(type(current), "__slots__", ()):
+            if slot not in ("__dict__", "__weakref__") and hasattr(current, slot):
+                stack.append(getattr(current, slot))
+    return size
+
+
+def _add(breakdown: Dict[str, Dict[str, int]], category: str, size: int) -> None:
+    entry = breakdown.setdefault(category, {"count": 0, "bytes": 0})
+    entry["count"] += 1
+    entry["bytes"] += size
+
+
+def allocation_sites(top: int = 10) -> List[Dict[str, Any]]:
+    """Top allocation sites by size (empty when tracemalloc is not tracing)."""
+    if not tracemalloc.is_tracing():
+        return []
+    snapshot = tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    ))
+    return [
+        {
+            "file": stat.traceback[0].filename,
+            "line": stat.traceback[0].lineno,
+            "bytes": stat.size,
+            "count": stat.count,
+        }
+        for stat in snapshot.statistics("lineno")[:top]
+    ]
+
+
+def memory_report(address_book: AddressBook, notes_book: Optional[NotesBook] = None, top: int = 10) -> Dict[str, Any]:
+    """
+    Memory used by the loaded books: totals, per-record averages, a breakdown by
+    field type (Name, Phone, Birthday, generic Field, note text, record, note
+    and book overhead) and, when tracemalloc is tracing, the top allocation sites.
+    """
+    seen: Set[int] = set()
+    breakdown: Dict[str, Dict[str, int]] = {}
+
+    contacts_bytes = 0
+    for record in address_book.data.values():
+        for value in record.fields.values():
+            for field in value if isinstance(value, list) else [value]:
+                category = type(field).__name__ if isinstance(field, FIELD_TYPES) else Field.__name__
+                size = deep_sizeof(field, seen)
+                _add(breakdown, category, size)
+                contacts_bytes += size
+        size = deep_sizeof(record, seen)
+        _add(breakdown, "Record", size)
+        contacts_bytes += size
+    size = deep_sizeof(address_book, seen)
+    _add(breakdown, "AddressBook", size)
+    contacts_bytes += size
+
+    notes_bytes = 0
+    notes = notes_book.notes if notes_book is not None else []
+    for note in notes:
+        size = deep_sizeof(note.get("text", ""), seen)
+        _add(breakdown, "note text", size)
+        notes_bytes += size
+        size = deep_sizeof(note, seen)
+        _add(breakdown, "Note", size)
+        notes_bytes += size
+    if notes_book is not None:
+        size = deep_sizeof(notes_book, seen)
+        _add(breakdown, "NotesBook", size)
+        notes_bytes += size
+
+    return {
+        "total_bytes": contacts_bytes + notes_bytes,
+        "contacts": {
+            "count": len(address_book.data),
+            "bytes": contacts_bytes,
+            "per_record_bytes": contacts_bytes / len(address_book.data) if address_book.data else 0,
+        },
+        "notes": {
+            "count": len(notes),
+            "bytes": notes_bytes,
+            "per_record_bytes": notes_bytes / len(notes) if notes else 0,
+        },
+        "breakdown": breakdown,
+        "tracing": tracemalloc.is_tracing(),
+        "allocation_sites": allocation_sites(top),
+    }
@@ -0,0 +1,108 @@
+import json
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+
+
+class LatencyHistogram:
+    """Running totals plus a bounded sample of recent durations (in seconds)."""
+
+    MAX_SAMPLES = 10_000
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples: deque = deque(maxlen=self.MAX_SAMPLES)
+
+    def add(self, duration: float) -> None:
+        self.count += 1
+        self.total += duration
+        if duration > self.max:
+            self.max = duration
+        self.samples.append(duration)
+
+    def percentile(self, pct: float) -> float:
+        """Nearest-rank percentile over the kept samples."""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        rank = max(int(round(pct / 100 * len(ordered))) - 1, 0)
+        return ordered[min(rank, len(ordered) - 1)]
+
+    def to_dict(self) -> Dict[str, float]:
+        ms = 1000.0
+        return {
+            "count": self.count,
+            "total_ms": self.total * ms,
+            "mean_ms": self.total / self.count * ms if self.count else 0.0,
+            "p50_ms": self.percentile(50) * ms,
+            "p95_ms": self.percentile(95) * ms,
+            "p99_ms": self.percentile(99) * ms,
+            "max_ms": self.max * ms,
+        }
+
+
+class Metrics:
+    """
+    Collects per-command latency, storage load/save timings, error counts and
+    plain counters (e.g. query cache hits and misses).
+    A single module-level instance ('metrics') is shared by the whole application.
+    """
+
+    SECTIONS = ("commands", "storage")
+    UNKNOWN_COMMAND = "<unknown>"
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.histograms: Dict[str, Dict[str, LatencyHistogram]] = {
+            section: {} for section in self.SECTIONS
+        }
+        self.errors: Dict[str, int] = {}
+        self.counters: Dict[str, int] = {}
+
+    def histogram(self, section: str, name: str) -> LatencyHistogram:
+        histograms = self.histograms[section]
+        if name not in histograms:
+            histograms[name] = LatencyHistogram()
+        return histograms[name]
+
+    def record_error(self, name: str) -> None:
+        self.errors[name] = self.errors.get(name, 0) + 1
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    @contextmanager
+    def measure(self, section: str, name: str) -> Iterator[None]:
+        """
+        Times the wrapped block into the '(section, name)' histogram.
+        An exception escaping the block is counted as an error for 'name' and re-raised.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.record_error(name)
+            raise
+        finally:
+            self.histogram(section, name).add(time.perf_counter() - start)
+
+    def snapshot(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            section: {name: hist.to_dict() for name, hist in histograms.items()}
+            for section, histograms in self.histograms.items()
+        }
+        data["errors"] = dict(self.errors)
+        data["counters"] = dict(self.counters)
+        return data
+
+    def dump(self, file_path: str) -> None:
+        with open(file_path, "w", encoding="utf-8") as file:
+            json.dump(self.snapshot(), file, ensure_ascii=False, indent=4)
+
+
+metrics = Metrics()
@@ -0,0 +1,75 @@
+import re
+
+# Country calling code of the national numbers ("0671234567" is "+380671234567").
+DEFAULT_COUNTRY_CODE = 380
+# Two-digit country calling codes (ITU-T E.164); 1 and 7 are the one-digit
+# codes and all the others have three digits, so the codes are prefix-free.
+TWO_DIGIT_CODES = frozenset({
+    20, 27, 30, 31, 32, 33, 34, 36, 39, 40, 41, 43, 44, 45, 46, 47, 48, 49,
+    51, 52, 53, 54, 55, 56, 57, 58, 60, 61, 62, 63, 64, 65, 66, 81, 82, 84,
+    86, 90, 91, 92, 93, 94, 95, 98,
+})
+# Length limits of an international number without the '+'.
+MIN_DIGITS = 8
+MAX_DIGITS = 15
+
+# Символи оформлення номера, які ігноруються: пробіли, дефіси, дужки, крапки
+_FORMATTING = re.compile(r"[\s\-().]")
+_NON_DIGITS = re.compile(r"\D")
+
+
+def country_code_of(digits: str) -> int:
+    """Country calling code at the start of an international number (digits without the '+')."""
+    if digits[0] in "17":
+        return int(digits[0])
+    if int(digits[:2]) in TWO_DIGIT_CODES:
+        return int(digits[:2])
+    return int(digits[:3])
+
+
+def normalize_phone(value: str) -> str:
+    """
+    E.164 form ('+' and up to 15 digits) of a phone number written with or
+    without spaces, dashes, dots and parentheses: international numbers start
+    with '+' or '00'; 10-digit national numbers ("067 123 45 67") and the same
+    with the country code but without '+' ("380...") get DEFAULT_COUNTRY_CODE.
+    Other 10-digit numbers ("1234567890", accepted before numbers had country
+    codes) are a legacy form kept as they are: no country code can be inferred.
+    """
+    if not isinstance(value, str):
+        raise ValueError("Phone number must be 10 digits or start with '+' and the country code.")
+    # Збережені номери вже у формі E.164
+    if value[:1] == "+" and value[1:].isdigit() and value[1] != "0" and MIN_DIGITS < len(value) <= MAX_DIGITS + 1:
+        return value
+    text = value if value.isdigit() else _FORMATTING.sub("", value)
+    national_prefix = str(DEFAULT_COUNTRY_CODE)
+    if text.startswith("+"):
+        digits = text[1:]
+    elif text.startswith("00"):
+        digits = text[2:]
+    elif len(text) == 10 and text.startswith("0"):
+        digits = national_prefix + text[1:]
+    elif len(text) == 10 and text.isdigit():
+        return text
+    elif len(text) == len(national_prefix) + 9 and text.startswith(national_prefix):
+        digits = text
+    else:
+        digits = ""
+    if not digits.isdigit() or digits.startswith("0") or not MIN_DIGITS <= len(digits) <= MAX_DIGITS:
+        raise ValueError("Phone number must be 10 digits or start with '+' and the country code.")
+    return "+" + digits
+
+
+def phone_digits(value: str) -> str:
+    return _NON_DIGITS.sub("", value)
+
+
+def looks_like_phone(text: str) -> bool:
+    """Whether a search word is a phone number or its last digits (at least 7 of them)."""
+    stripped = _FORMATTING.sub("", text).lstrip("+")
+    return stripped.isdigit() and len(stripped) >= 7
+
+
+def suffix_key(digits: str) -> str:
+    """Key of the phone suffix index: the digits reversed, so a suffix becomes a prefix."""
+    return digits[::-1]
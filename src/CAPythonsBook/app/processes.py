@@ -0,0 +1,17 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from multiprocessing.context import BaseContext
+
+
+def pool_context() -> "BaseContext":
+    """
+    Start method of the worker process pools. Forking a process that runs
+    threads (the birthday reminders) may deadlock the child, so the workers
+    are started by a fork server where there is one and spawned elsewhere.
+    """
+    # Imported here: only the pools need multiprocessing.
+    import multiprocessing
+
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return multiprocessing.get_context(method)
@@ -0,0 +1,244 @@
+import re
+import uuid
+from typing import List, Optional, Set, Tuple
+
+from app.indexes import ContactIndexes, field_values
+from app.phones import DEFAULT_COUNTRY_CODE, looks_like_phone, phone_digits, suffix_key
+
+# Names accepted for the fields in 'field:pattern'.
+FIELD_ALIASES = {"phones": "phone"}
+BARE_WORD_SEPARATORS = re.compile(r"[^\w*]+")
+
+
+class Pattern:
+    """Lower-cased pattern where '*' matches any characters (possibly none)."""
+
+    def __init__(self, text: str) -> None:
+        self.text = text.lower()
+        self.exact = "*" not in self.text
+        self.prefix = self.text.split("*", 1)[0]
+        self.regex = re.compile(".*".join(re.escape(part) for part in self.text.split("*")), re.DOTALL)
+
+    def match(self, value: str) -> bool:
+        return value == self.text if self.exact else self.regex.fullmatch(value) is not None
+
+
+class Node:
+    """Node of a parsed query."""
+
+    def matches(self, record) -> bool:
+        raise NotImplementedError
+
+    def estimate(self, indexes: ContactIndexes, limit: Optional[int] = None) -> Optional[int]:
+        """
+        Number of contacts the indexes return for this node (counting may stop
+        once it reaches 'limit'), or 'None' if the node cannot use an index.
+        """
+        return None
+
+    def candidates(self, indexes: ContactIndexes) -> Set[uuid.UUID]:
+        """Ids of a superset of the matching contacts, taken from the indexes."""
+        raise NotImplementedError
+
+
+class Term(Node):
+    def __init__(self, field: Optional[str], pattern: str) -> None:
+        self.field = field
+        self.pattern = Pattern(pattern)
+        # Keys matched in the last indexes looked up: a pattern without a prefix
+        # ("*enko*") checks every key, so the estimate and the candidates share one pass.
+        self._matched: Optional[Tuple[ContactIndexes, List[str]]] = None
+
+    def __getstate__(self) -> dict:
+        # Scan workers need only the pattern, not the indexes the keys came from
+        return {**self.__dict__, "_matched": None}
+
+    def matches(self, record) -> bool:
+        return any(self.pattern.match(value) for value in field_values(record, self.field))
+
+    def _keys(self, indexes: ContactIndexes) -> List[str]:
+        index = indexes.index_for(self.field)
+        if self.pattern.exact:
+            return [self.pattern.text] if self.pattern.text in index.ids else []
+        if self._matched is None or self._matched[0] is not indexes:
+            keys = [key for key in index.keys_with_prefix(self.pattern.prefix) if self.pattern.match(key)]
+            self._matched = (indexes, keys)
+        return self._matched[1]
+
+    def estimate(self, indexes: ContactIndexes, limit: Optional[int] = None) -> Optional[int]:
+        index = indexes.index_for(self.field)
+        if index is None:
+            return None
+        total = 0
+        for key in self._keys(indexes):
+            total += len(index.ids[key])
+            if limit is not None and total >= limit:
+                break
+        return total
+
+    def candidates(self, indexes: ContactIndexes) -> Set[uuid.UUID]:
+        index = indexes.index_for(self.field)
+        found: Set[uuid.UUID] = set()
+        for key in self._keys(indexes):
+            found.update(index.ids[key])
+        return found
+
+    def __repr__(self) -> str:
+        return f"Term({self.field!r}, {self.pattern.text!r})"
+
+
+class PhoneSuffix(Node):
+    """
+    Phone numbers ending with the given digits, however they were written:
+    the leading zeros (e.g. of a national number) are not compared.
+    """
+
+    def __init__(self, text: str) -> None:
+        self.digits = phone_digits(text).lstrip("0")
+        self.key = suffix_key(self.digits)
+
+    def matches(self, record) -> bool:
+        return any(phone_digits(value).endswith(self.digits) for value in field_values(record, "phone"))
+
+    def estimate(self, indexes: ContactIndexes, limit: Optional[int] = None) -> Optional[int]:
+        index = indexes.phone_suffixes
+        total = 0
+        for key in index.keys_with_prefix(self.key):
+            total += len(index.ids[key])
+            if limit is not None and total >= limit:
+                break
+        return total
+
+    def candidates(self, indexes: ContactIndexes) -> Set[uuid.UUID]:
+        index = indexes.phone_suffixes
+        found: Set[uuid.UUID] = set()
+        for key in index.keys_with_prefix(self.key):
+            found.update(index.ids[key])
+        return found
+
+    def __repr__(self) -> str:
+        return f"PhoneSuffix({self.digits!r})"
+
+
+class Not(Node):
+    def __init__(self, node: Node) -> None:
+        self.node = node
+
+    def matches(self, record) -> bool:
+        return not self.node.matches(record)
+
+    def __repr__(self) -> str:
+        return f"Not({self.node!r})"
+
+
+class And(Node):
+    def __init__(self, nodes: List[Node]) -> None:
+        self.nodes = nodes
+
+    def matches(self, record) -> bool:
+        return all(node.matches(record) for node in self.nodes)
+
+    def _best(self, indexes: ContactIndexes, limit: Optional[int] = None):
+        best, best_estimate = None, None
+        for node in self.nodes:
+            estimate = node.estimate(indexes, best_estimate if best_estimate is not None else limit)
+            if estimate is not None and (best_estimate is None or estimate < best_estimate):
+                best, best_estimate = node, estimate
+        return best, best_estimate
+
+    def estimate(self, indexes: ContactIndexes, limit: Optional[int] = None) -> Optional[int]:
+        return self._best(indexes, limit)[1]
+
+    def candidates(self, indexes: ContactIndexes) -> Set[uuid.UUID]:
+        # Only the most selective part is looked up; the rest is checked on the candidates.
+        return self._best(indexes)[0].candidates(indexes)
+
+    def __repr__(self) -> str:
+        return f"And({self.nodes!r})"
+
+
+class Or(Node):
+    def __init__(self, nodes: List[Node]) -> None:
+        self.nodes = nodes
+
+    def matches(self, record) -> bool:
+        return any(node.matches(record) for node in self.nodes)
+
+    def estimate(self, indexes: ContactIndexes, limit: Optional[int] = None) -> Optional[int]:
+        total = 0
+        for node in self.nodes:
+            estimate = node.estimate(indexes, None if limit is None else limit - total)
+            if estimate is None:
+                return None
+            total += estimate
+        return total
+
+    def candidates(self, indexes: ContactIndexes) -> Set[uuid.UUID]:
+        found: Set[uuid.UUID] = set()
+        for node in self.nodes:
+            found.update(node.candidates(indexes))
+        return found
+
+    def __repr__(self) -> str:
+        return f"Or({self.nodes!r})"
+
+
+def _international_prefix(digits: str) -> Optional[str]:
+    """E.164 form of the start of a national number ("067" becomes "+38067"), or 'None' if it is not one."""
+    # Номери зберігаються у форматі E.164, тож національний префікс без "0" іде після коду країни
+    if digits[:1] == "0" and digits[1:2].isdigit():
+        return f"+{DEFAULT_COUNTRY_CODE}{digits[1:]}"
+    return None
+
+
+def _parse_word(word: str) -> Node:
+    if word.startswith("-") and len(word) > 1:
+        return Not(_parse_word(word[1:]))
+    field, separator, pattern = word.partition(":")
+    if separator and field and pattern:
+        field = FIELD_ALIASES.get(field.lower(), field.lower())
+        if field == "phone":
+            if "*" not in pattern and looks_like_phone(pattern):
+                return PhoneSuffix(pattern)
+            pattern = _international_prefix(pattern) or pattern
+        return Term(field, pattern)
+    # Голе слово: кожна його частина має входити в якесь слово контакту ("enko" знаходить "shevchenko");
+    # частина з '*' — звичайний шаблон слова ("shev*" — лише початок слова)
+    terms = [Term(None, part if "*" in part else f"*{part}*")
+             for part in BARE_WORD_SEPARATORS.split(word) if part.strip("*")]
+    if not terms:
+        raise ValueError(f"Invalid search term '{word}'.")
+    alternatives = [terms[0] if len(terms) == 1 else And(terms)]
+    # A number (or its last digits) also finds the phones it ends, and a national prefix the phones it starts
+    if looks_like_phone(word):
+        alternatives.append(PhoneSuffix(word))
+    if word.isdigit() and _international_prefix(word):
+        alternatives.append(Term("phone", _international_prefix(word) + "*"))
+    return alternatives[0] if len(alternatives) == 1 else Or(alternatives)
+
+
+def parse_query(text: str) -> Node:
+    """
+    Parses a query of 'search-contact' into a tree of 'Term', 'Not', 'And' and 'Or' nodes:
+
+        name:ivan phone:067* birthday:05.* -tag:old shev
+
+    Words are combined with AND, 'or' separates alternatives and a leading '-'
+    negates a word. 'field:pattern' matches the whole value of a field, with '*'
+    standing for any characters; a bare word matches any part of a word of any
+    field ("enko" finds "shevchenko"), or, with '*', the pattern of a word
+    ("shev*" finds only the words starting with it). The substring match has
+    no index: it checks every distinct word of the token index. A phone number
+    without '*' (in any format, or just its last 7 or more digits) finds the
+    phones ending with it, and a national prefix ("067") the phones starting with it.
+    """
+    alternatives: List[List[Node]] = [[]]
+    for word in text.split():
+        if word.lower() == "or":
+            alternatives.append([])
+        else:
+            alternatives[-1].append(_parse_word(word))
+    if not all(alternatives):
+        raise ValueError("Empty search query." if len(alternatives) == 1 else "'or' must join two queries.")
+    nodes = [terms[0] if len(terms) == 1 else And(terms) for terms in alternatives]
+    return nodes[0] if len(nodes) == 1 else Or(nodes)
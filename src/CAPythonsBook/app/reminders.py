@@ -0,0 +1,119 @@
+import heapq
+import threading
+import uuid
+from datetime import date, datetime, time, timedelta
+from typing import Callable, List, Optional, Set, Tuple
+
+from app.entities import AddressBook, congratulation_date, next_birthday
+from app.events import ContactEvent, FieldRemoved, FieldSet, RecordAdded, RecordChanged, RecordRemoved
+from app.metrics import metrics
+
+# Longest sleep between checks, so a changed system clock (or a suspended
+# machine) delays a reminder by at most this much.
+MAX_SLEEP = 3600.0
+
+# (reminder time, record id, congratulation date); the name is looked up when it fires,
+# so renaming a contact needs no rebuild
+Reminder = Tuple[datetime, uuid.UUID, date]
+
+
+class BirthdayScheduler:
+    """
+    Reminds about birthdays while the REPL waits for input. A background thread
+    keeps a heap of the next reminder of every contact with a birthday: at
+    'at' o'clock on the congratulation date (weekend birthdays move to
+    Monday, as in 'get_upcoming_birthdays'). It sleeps until the earliest one,
+    calls 'notify(name, congratulation date)' for the due reminders and
+    schedules their next year. The heap is rebuilt only when the book's
+    birthdays change (contacts added or removed, birthday set or removed).
+    """
+
+    def __init__(
+        self,
+        book: AddressBook,
+        notify: Callable[[str, date], None],
+        at: time = time(9, 0),
+        clock: Callable[[], datetime] = datetime.now,
+    ) -> None:
+        self.book = book
+        self.notify = notify
+        self.at = at
+        self.clock = clock
+        self.reminders: List[Reminder] = []
+        # (record id, congratulation date) already reminded about, so a rebuilt heap does not repeat them
+        self.notified: Set[Tuple[uuid.UUID, date]] = set()
+        self.condition = threading.Condition()
+        self.dirty = True
+        self.stopped = False
+        self.thread: Optional[threading.Thread] = None
+        self._unsubscribe = book.events.subscribe(ContactEvent, self._on_change)
+
+    def _on_change(self, event: ContactEvent) -> None:
+        if isinstance(event, (FieldSet, FieldRemoved)):
+            if event.field_name != "birthday":
+                return
+        elif isinstance(event, RecordChanged):
+            return
+        elif isinstance(event, (RecordAdded, RecordRemoved)) and "birthday" not in event.record.fields:
+            return
+        with self.condition:
+            self.dirty = True
+            self.condition.notify()
+
+    def _next_reminder(self, record_id: uuid.UUID, birthday: date, today: date) -> Reminder:
+        day = congratulation_date(next_birthday(birthday, today))
+        if (record_id, day) in self.notified:
+            day = congratulation_date(next_birthday(birthday, day + timedelta(days=1)))
+        return datetime.combine(day, self.at), record_id, day
+
+    def _schedule(self, today: date) -> None:
+        reminders = []
+        # Копія записів: книгу змінює основний потік
+        for record_id, record in list(self.book.data.items()):
+            field = record.fields.get("birthday")
+            if field is not None:
+                reminders.append(self._next_reminder(record_id, field.date, today))
+        heapq.heapify(reminders)
+        self.reminders = reminders
+        metrics.increment("reminders.rescheduled")
+
+    def run_pending(self) -> Optional[float]:
+        """
+        Rebuilds the schedule if the birthdays have changed and sends the due
+        reminders; returns the seconds until the next one ('None' if there are none).
+        """
+        now = self.clock()
+        if self.dirty:
+            self.dirty = False
+            self._schedule(now.date())
+        while self.reminders and self.reminders[0][0] <= now:
+            _, record_id, day = heapq.heappop(self.reminders)
+            record = self.book.data.get(record_id)
+            if record is None:
+                continue
+            self.notified.add((record_id, day))
+            self.notify(record.fields["name"].value, day)
+            if "birthday" in record.fields:
+                heapq.heappush(self.reminders, self._next_reminder(record_id, record.fields["birthday"].date, day))
+        if not self.reminders:
+            return None
+        return max((self.reminders[0][0] - now).total_seconds(), 0.0)
+
+    def _run(self) -> None:
+        with self.condition:
+            while not self.stopped:
+                delay = self.run_pending()
+                self.condition.wait(MAX_SLEEP if delay is None else min(delay, MAX_SLEEP))
+
+    def start(self) -> None:
+        self.thread = threading.Thread(target=self._run, name="birthday-reminders", daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        self._unsubscribe()
+        with self.condition:
+            self.stopped = True
+            self.condition.notify()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
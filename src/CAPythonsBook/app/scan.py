@@ -0,0 +1,169 @@
+import os
+import uuid
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Below this many records a scan runs in the calling process.
+PARALLEL_MIN_RECORDS = 50_000
+# Records per partition. Partitions are the unit of work of the scan workers
+# and of the updates sent to them: a change re-sends only its partition.
+PARTITION_SIZE = 5_000
+
+
+class ScanRow:
+    """
+    Plain copy of a record for the scan workers: 'fields' maps the field keys
+    to values (or lists of values) as strings, which is all a query needs.
+    """
+
+    __slots__ = ("fields",)
+
+    def __init__(self, fields: Dict[str, Any]) -> None:
+        self.fields = fields
+
+
+def to_row(record) -> ScanRow:
+    return ScanRow({
+        key: [str(field) for field in value] if isinstance(value, list) else str(value)
+        for key, value in record.fields.items()
+    })
+
+
+# Rows of the partitions a worker process has received: partition -> (version, rows).
+_worker_partitions: Dict[int, Tuple[int, List[Optional[ScanRow]]]] = {}
+
+
+def _scan_partition(node, partition: int, version: int, rows: Optional[List[Optional[ScanRow]]]) -> Optional[List[int]]:
+    """
+    Offsets of the matching rows of a partition. The rows are sent only when
+    the partition has changed; otherwise the worker uses its copy, and returns
+    'None' if it has none of that version, so the parent sends the rows.
+    """
+    if rows is not None:
+        _worker_partitions[partition] = (version, rows)
+    else:
+        cached = _worker_partitions.get(partition)
+        if cached is None or cached[0] != version:
+            return None
+        rows = cached[1]
+    return [offset for offset, row in enumerate(rows) if row is not None and node.matches(row)]
+
+
+class ScanEngine:
+    """
+    Evaluates a query over all the records of a book. Large books are scanned
+    by a pool of worker processes, started once. The records are split into
+    partitions of 'partition_size' in book order. Each worker keeps plain
+    copies of the partitions it has scanned, with their versions. The book
+    reports its changes ('add', 'remove', 'update', 'reset'), and a change
+    gives only its partition a new version. A scan sends the query with the
+    partition versions, plus the rows of the partitions changed since the last
+    scan. A worker without the current rows of a partition asks for them. The
+    matches of the partitions are merged in book order. Smaller books, or a
+    single worker, are scanned in-process.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        min_records: int = PARALLEL_MIN_RECORDS,
+        partition_size: int = PARTITION_SIZE,
+    ) -> None:
+        self.workers = workers
+        self.min_records = min_records
+        self.partition_size = partition_size
+        self.executor = None
+        # Records in book order; removed ones leave 'None' until the slots are rebuilt
+        self.slots: List[Any] = []
+        self.rows: List[Optional[ScanRow]] = []
+        self.positions: Dict[uuid.UUID, int] = {}
+        # Version of every partition, and the version whose rows were last sent
+        self.versions: List[int] = []
+        self.sent: Dict[int, int] = {}
+        self.last_version = 0
+        self.loaded = False
+
+    def _touch(self, position: int) -> None:
+        partition = position // self.partition_size
+        self.last_version += 1
+        if partition == len(self.versions):
+            self.versions.append(self.last_version)
+        else:
+            self.versions[partition] = self.last_version
+
+    def add(self, record_id: uuid.UUID, record) -> None:
+        if not self.loaded:
+            return
+        self.positions[record_id] = len(self.slots)
+        self.slots.append(record)
+        self.rows.append(to_row(record))
+        self._touch(len(self.slots) - 1)
+
+    def remove(self, record_id: uuid.UUID) -> None:
+        position = self.positions.pop(record_id, None)
+        if position is None:
+            return
+        self.slots[position] = None
+        self.rows[position] = None
+        self._touch(position)
+        # Забагато порожніх місць: розділи будуються заново при наступному скануванні
+        if len(self.slots) > 2 * len(self.positions) + self.partition_size:
+            self.reset()
+
+    def update(self, record_id: uuid.UUID, record) -> None:
+        position = self.positions.get(record_id)
+        if position is not None:
+            self.rows[position] = to_row(record)
+            self._touch(position)
+
+    def reset(self) -> None:
+        """Forgets the records; the next parallel scan copies them again."""
+        self.slots, self.rows, self.positions, self.versions = [], [], {}, []
+        self.loaded = False
+
+    def _load(self, records: Sequence[Any]) -> None:
+        self.reset()
+        self.loaded = True
+        for record in records:
+            self.add(record.id, record)
+
+    def scan(self, node, records: Sequence[Any]) -> List[Any]:
+        """The records matching the query node, in their original order."""
+        workers = self.workers or os.cpu_count() or 1
+        if workers <= 1 or len(records) < self.min_records:
+            return [record for record in records if node.matches(record)]
+
+        if not self.loaded or len(records) != len(self.positions):
+            self._load(records)
+        if self.executor is None:
+            # Imported here: only large books start a process pool.
+            from concurrent.futures import ProcessPoolExecutor
+            from app.processes import pool_context
+
+            self.executor = ProcessPoolExecutor(max_workers=workers, mp_context=pool_context())
+        futures = [self._submit(node, partition, self.sent.get(partition) != version)
+                   for partition, version in enumerate(self.versions)]
+        results = [future.result() for future in futures]
+        # Розділи, яких виконавець ще не мав: надсилаються ще раз разом із записами
+        retries = {partition: self._submit(node, partition, True)
+                   for partition, offsets in enumerate(results) if offsets is None}
+        for partition, future in retries.items():
+            results[partition] = future.result()
+        return [
+            self.slots[partition * self.partition_size + offset]
+            for partition, offsets in enumerate(results)
+            for offset in offsets
+        ]
+
+    def _submit(self, node, partition: int, send_rows: bool):
+        version = self.versions[partition]
+        rows = None
+        if send_rows:
+            start = partition * self.partition_size
+            rows = self.rows[start:start + self.partition_size]
+            self.sent[partition] = version
+        return self.executor.submit(_scan_partition, node, partition, version, rows)
+
+    def shutdown(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
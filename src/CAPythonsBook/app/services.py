@@ -1,20 +1,24 @@
 from app import command_registry
 import re
 from app.interfaces import Command, FieldCommand
-from app.entities import Field, Name, Phone, Birthday, Record, AddressBook, NotesBook
+from app.entities import Field, Name, Phone, Birthday, Record, AddressBook, NotesBook, SORT_ORDERS
 from infrastructure.storage import FileStorage
+from infrastructure.bulk import parse_records, read_contacts_file
 from presentation.messages import Message
-from app.command_registry import register_command, get_command
+from presentation.output import OutputWriter, page
+from app.arguments import Arg, ArgumentError, Flag, Option, PAGING_OPTIONS, choice, fraction, non_negative_int
+from app.command_registry import register_command, get_dispatcher
 from infrastructure.storage import FileStorage
-from app.settings import Settings
-from typing import Callable
+from app.settings import get_settings
+from app.metrics import metrics
+from app.tracing import tracer
+from typing import Callable, Dict, List, Optional, Tuple
 from colorama import Fore, Style
 import sys
+import uuid
+from datetime import datetime
 
 
-# Initialize settings
-settings = Settings()
-
 # Language mapping
 LANGUAGE_MAP = {
     "en": {"en": "English", "uk": "Ukrainian"},
@@ -61,29 +65,36 @@ def input_error(handler: Callable) -> Callable:
 @input_error
 def handle_command(command: str, address_book: AddressBook, notes_book: NotesBook, *args: str) -> None:
     """Handles the user command by calling the corresponding method."""
-    cmd = get_command(command)
-    if cmd:
-        cmd_instance = cmd(
-            notes_book if 'note' in command else address_book)
-        # cmd_instance = cmd(command.includes('note') ? notes_book: address_book)
-        cmd_instance.execute(*args)
+    with tracer.span("get_command", "commands"):
+        entry = get_dispatcher(address_book, notes_book).lookup(command)
+    if entry:
+        handler, schema = entry
+        with metrics.measure("commands", command), tracer.span("execute", "commands", command=command):
+            try:
+                values, options = schema.parse(args)
+            except ArgumentError as e:
+                metrics.record_error(command)
+                Message.error(e.code, argument=e.argument, value=e.value, error=e)
+                return
+            handler.execute(*values, **options)
     else:
+        metrics.record_error(metrics.UNKNOWN_COMMAND)
         Message.error("incorrect_command", command=command)
 
 
-@register_command("hello")
+@register_command("hello", book=None)
 class HelloCommand(Command):
     description = {
         "en": "Displays a greeting message.",
         "uk": "Виводить вітання.",
     }
 
-    def execute(self, *args: str) -> None:
+    def execute(self) -> None:
         """Displays a greeting message."""
         Message.info("greeting")
 
 
-@register_command("add")
+@register_command("add", args=[Arg("name", Name), Arg("phone", Phone)])
 class AddContactCommand(Command):
     description = {
         "en": "Adds a new contact to the address book.",
@@ -94,28 +105,24 @@ class AddContactCommand(Command):
         "uk": "[ім'я] [телефон]"
     }
 
-    def execute(self, *args: str) -> None:
+    def execute(self, name: Name, phone: Phone) -> None:
         """Adds a new contact to the address book."""
-        if len(args) != 2:
-            Message.error("incorrect_arguments")
-            return
-        name, phone = args
-        record = self.book_type.find_by_name(Name(name))
+        record = self.book_type.find_by_name(name)
         if record:
-            if any(p.value == phone for p in record.phones):
-                Message.warning("contact_exists", name=name, phone=phone)
+            if any(p.value == phone.value for p in record.phones):
+                Message.warning("contact_exists", name=name.value, phone=phone.value)
             else:
                 current_phone = record.phones[0].value if record.phones else "No phone"
-                Message.warning("contact_exists", name=name,
+                Message.warning("contact_exists", name=name.value,
                                 phone=current_phone)
         else:
-            new_record = Record(Name(name))
-            new_record.add_phone(Phone(phone))
+            new_record = Record(name)
+            new_record.add_phone(phone)
             self.book_type.add_record(new_record)
-            Message.info("contact_added", name=name, phone=phone)
+            Message.info("contact_added", name=name.value, phone=phone.value)
 
 
-@register_command("change")
+@register_command("change", args=[Arg("name", Name), Arg("phone", Phone)])
 class ChangeContactCommand(Command):
     description = {
         "en": "Changes the phone number of an existing contact.",
@@ -126,26 +133,25 @@ class ChangeContactCommand(Command):
         "uk": "[ім'я] [телефон]"
     }
 
-    def execute(self, *args: str) -> None:
+    def execute(self, name: Name, new_phone: Phone) -> None:
         """Changes the phone number of an existing contact."""
-        if len(args) != 2:
-            Message.error("incorrect_arguments")
-            return
-        name, new_phone = args
-        record = self.book_type.find_by_name(Name(name))
+        record = self.book_type.find_by_name(name)
         if record:
             current_phone = record.phones[0].value if record.phones else None
-            if new_phone == current_phone:
-                Message.warning("contact_exists", name=name, phone=new_phone)
+            if new_phone.value == current_phone:
+                Message.warning("contact_exists", name=name.value, phone=new_phone.value)
+            elif current_phone is None:
+                record.add_phone(new_phone)
+                Message.info("contact_added", name=name.value, phone=new_phone.value)
             else:
-                record.edit_phone(record.phones[0], Phone(new_phone))
-                Message.info("contact_updated", name=name,
-                             old_phone=current_phone, new_phone=new_phone)
+                record.edit_phone(record.phones[0], new_phone)
+                Message.info("contact_updated", name=name.value,
+                             old_phone=current_phone, new_phone=new_phone.value)
         else:
-            Message.error("contact_not_found", name=name)
+            self.contact_not_found(name)
 
 
-@register_command("add-phone")
+@register_command("add-phone", args=[Arg("name", Name), Arg("phone", Phone)])
 class AddPhoneCommand(FieldCommand):
     description = {
         "en": "Adds a new phone number to an existing contact.",
@@ -156,9 +162,6 @@ class AddPhoneCommand(FieldCommand):
         "uk": "[ім'я] [телефон]"
     }
 
-    def create_field(self, *args: str) -> Field:
-        return Phone(args[0])
-
     def execute_field(self, record: Record, field: Field) -> None:
         """Adds a new phone number to an existing contact."""
         if any(p.value == field.value for p in record.phones):
@@ -170,7 +173,7 @@ class AddPhoneCommand(FieldCommand):
                          phone=field.value)
 
 
-@register_command("add-birthday")
+@register_command("add-birthday", args=[Arg("name", Name), Arg("birthday", Birthday)])
 class AddBirthdayCommand(FieldCommand):
     description = {
         "en": "Adds a birthday to an existing contact.",
@@ -181,56 +184,60 @@ class AddBirthdayCommand(FieldCommand):
         "uk": "[ім'я] [дата народження]"
     }
 
-    def create_field(self, *args: str) -> Field:
-        return Birthday(args[0])
-
     def execute_field(self, record: Record, field: Field) -> None:
         """Adds a birthday to an existing contact."""
-        record.add_field("Birthday", field)
+        record.add_field("birthday", field)
         Message.info("birthday_set", name=record.name.value,
                      birthday=field.value)
 
 
-@register_command("all")
+@register_command("all", options=[Option("--sort", choice(*SORT_ORDERS), "created"), *PAGING_OPTIONS])
 class ShowAllContactsCommand(Command):
     description = {
         "en": "Shows all contacts in the address book.",
         "uk": "Виводить всі контакти.",
     }
+    example = {
+        "en": "[--sort name|birthday|created] [--limit N] [--offset N]",
+        "uk": "[--sort name|birthday|created] [--limit N] [--offset N]"
+    }
 
-    def execute(self, *args: str) -> None:
+    def execute(self, sort: str = "created", limit: int = None, offset: int = 0) -> None:
         """Shows all contacts in the address book."""
         if self.book_type.data:
-            for record in self.book_type.data.values():
-                print(str(record))
+            with OutputWriter() as writer:
+                for record in self.book_type.sorted_records(sort, offset, limit):
+                    writer.write_line(record.summary(), Fore.GREEN)
         else:
             raise IndexError("No contacts available.")
 
-@register_command("search-contact")
+@register_command("search-contact", args=[Arg("keyword", rest=True)], options=[Flag("--fuzzy"), *PAGING_OPTIONS])
 class SearchContactsCommand(Command):
     description = {
         "en": "Searches for contacts matching the given criteria.",
         "uk": "Шукає контакти за заданими критеріями."
     }
     example = {
-        "en": "[search string]",
-        "uk": "[пошуковий запит]"
+        "en": "[query, e.g. name:ivan* phone:067* -tag:old] [--fuzzy] [--limit N] [--offset N]",
+        "uk": "[запит, напр. name:ivan* phone:067* -tag:old] [--fuzzy] [--limit N] [--offset N]"
     }
 
-    def execute(self, *args: str) -> None:
+    def execute(self, keyword: str, fuzzy: bool = False, limit: int = None, offset: int = 0) -> None:
         """Searches for contacts matching the given criteria."""
-        if len(args) < 1:
-            Message.error("incorrect_arguments")
-            return
-        keyword = " ".join(args)
-        results = [record for record in self.book_type.values() if record.matches_criteria(keyword)]
-        if results:
-            for record in results:
-                print(record)
+        if fuzzy:
+            # Найближчі за написанням імена, від найближчого
+            results = iter(self.book_type.find_similar(keyword, get_settings().fuzzy_distance))
         else:
+            results = self.book_type.search(keyword)
+        found = False
+        with OutputWriter() as writer:
+            for record in page(results, offset, limit):
+                found = True
+                writer.write_line(record.summary(), Fore.GREEN)
+        if not found:
             Message.info("no_results_found")
 
-@register_command("show-phone")
+@register_command("show-phone", args=[Arg("name", Name)])
 class ShowPhoneCommand(Command):
     description = {
         "en": "Shows the phone number of a contact.",
@@ -241,20 +248,121 @@ class ShowPhoneCommand(Command):
         "uk": "[ім'я]"
     }
 
-    def execute(self, *args: str) -> None:
+    def execute(self, name: Name) -> None:
         """Shows the phone number of a contact."""
-        if len(args) != 1:
-            Message.error("incorrect_arguments")
-            return
-        name = args[0]
-        record = self.book_type.find_by_name(Name(name))
+        record = self.book_type.find_by_name(name)
         if record:
             phones = "; ".join([phone.value for phone in record.phones])
-            Message.info("phone_info", name=name, phone=phones)
+            Message.info("phone_info", name=name.value, phone=phones)
+        else:
+            self.contact_not_found(name)
+
+@register_command("import-contacts", args=[Arg("file")])
+class ImportContactsCommand(Command):
+    description = {
+        "en": "Imports contacts from a JSON or CSV file, skipping existing names.",
+        "uk": "Імпортує контакти з файлу JSON або CSV, пропускаючи наявні імена."
+    }
+    example = {
+        "en": "[file.json or file.csv]",
+        "uk": "[файл.json або файл.csv]"
+    }
+
+    # Скільки помилкових записів показати поіменно
+    MAX_REPORTED_ERRORS = 5
+
+    def execute(self, file: str) -> None:
+        """Imports contacts from a JSON or CSV file, skipping existing names."""
+        try:
+            items = read_contacts_file(file)
+        except (OSError, ValueError) as e:
+            Message.error("import_failed", file=file, error=e)
+            return
+        decoded, invalid = parse_records(items, get_settings().load_workers)
+        for key, error in invalid[:self.MAX_REPORTED_ERRORS]:
+            Message.warning("import_invalid", row=key, error=error)
+
+        names = self.book_type.name_index
+        imported, seen, skipped = {}, set(), 0
+        for _, fields in decoded:
+            name = fields["name"].value
+            if name in names or name in seen:
+                skipped += 1
+                continue
+            seen.add(name)
+            record = Record.from_fields(uuid.uuid4(), fields)
+            imported[record.id] = record
+        self.book_type.load(imported)
+        Message.info("import_done", imported=len(imported), skipped=skipped, invalid=len(invalid))
+
+@register_command("dedupe", options=[Flag("--merge"), Option("--min-confidence", fraction)])
+class DedupeCommand(Command):
+    description = {
+        "en": "Finds duplicate contacts (similar names, shared phones) and optionally merges them.",
+        "uk": "Шукає дублікати контактів (схожі імена, спільні телефони) і за потреби об'єднує їх."
+    }
+    example = {
+        "en": "[--merge] [--min-confidence 0..1]",
+        "uk": "[--merge] [--min-confidence 0..1]"
+    }
+
+    def execute(self, merge: bool = False, min_confidence: Optional[float] = None) -> None:
+        """Finds duplicate contacts and optionally merges them."""
+        # Imported here: startup does not need the duplicate search.
+        from app.dedupe import DEFAULT_MIN_CONFIDENCE, find_duplicates
+
+        if min_confidence is None:
+            min_confidence = DEFAULT_MIN_CONFIDENCE
+        clusters = find_duplicates(list(self.book_type.data.values()), min_confidence)
+        if not clusters:
+            Message.info("no_duplicates")
+            return
+        with OutputWriter() as writer:
+            for cluster in clusters:
+                names = " | ".join(record.summary() for record in cluster.records)
+                writer.write_line(f"[{cluster.confidence:.2f}] {names}", Fore.YELLOW)
+        if merge:
+            for cluster in clusters:
+                self.book_type.merge(cluster.records)
+            merged = sum(len(cluster.records) - 1 for cluster in clusters)
+            Message.info("duplicates_merged", merged=merged, clusters=len(clusters))
         else:
-            Message.error("contact_not_found", name=name)
+            Message.info("duplicates_found", clusters=len(clusters))
+
+
+@register_command("export-birthdays", args=[Arg("file", required=False, default="birthdays.ics")])
+class ExportBirthdaysCommand(Command):
+    description = {
+        "en": "Exports the birthdays to an iCalendar (.ics) file with yearly events.",
+        "uk": "Експортує дні народження у файл iCalendar (.ics) зі щорічними подіями."
+    }
+    example = {
+        "en": "[file.ics, birthdays.ics by default]",
+        "uk": "[файл.ics, за замовчуванням birthdays.ics]"
+    }
 
-@register_command("add-note")
+    def execute(self, file: str = "birthdays.ics") -> None:
+        """Exports the birthdays to an iCalendar file."""
+        # Imported here: only the export needs the calendar format.
+        from infrastructure.ical import calendar_lines, record_birthdays, write_calendar
+
+        # Заголовок події без кольорів термінала
+        title = Message.templates.get("birthday_event", "{name}")
+        lines = calendar_lines(
+            record_birthdays(self.book_type.data.values()),
+            datetime.today().date(),
+            lambda name: title.format(name=name),
+        )
+        try:
+            # Рядки вже мають закінчення CRLF, тому без перетворення переносів
+            with open(file, "w", encoding="utf-8", newline="") as output:
+                exported = write_calendar(lines, output)
+        except OSError as e:
+            Message.error("export_failed", file=file, error=e)
+            return
+        Message.info("birthdays_exported", count=exported, file=file)
+
+@register_command("add-note", book="notes", args=[Arg("title"), Arg("text", free_text=True)])
 class AddNoteCommand(Command):
     description = {
         "en": "Adds a new note.",
@@ -265,7 +373,7 @@ class AddNoteCommand(Command):
         "uk": "[заголовок] [текст] [теги]"
     }
 
-    def execute(self, *args: tuple) -> None:
+    def execute(self, title: str, text: str) -> None:
         """Додає нову нотатку."""
         def remove_hash_words(s: str) -> str:
             return re.sub(r'\s*#[\w-]+', '', s).strip()
@@ -274,17 +382,13 @@ class AddNoteCommand(Command):
             hash_words = re.findall(r'#[\w-]+', s)
             return hash_words
 
-        title = args[0]
-        text = remove_hash_words(' '.join(args[1:]))
-        tags = extract_hash_words(' '.join(args[1:]))
-        if len(args) < 2:
-            Message.error("incorrect_arguments")
-            return
+        tags = extract_hash_words(text)
+        text = remove_hash_words(text)
         self.book_type.add_note(title, text, tags)
         Message.info("note_added", title=title)
 
 
-@register_command("edit-note")
+@register_command("edit-note", book="notes", args=[Arg("note_id"), Arg("title"), Arg("text", free_text=True, required=False, default="")])
 class EditNoteCommand(Command):
     description = {
         "en": "Edits an existing note.",
@@ -295,20 +399,13 @@ class EditNoteCommand(Command):
         "uk": "[заголовок] [текст] [теги]"
     }
 
-    def execute(self, *args: tuple) -> None:
+    def execute(self, id_note: str, title: str, text: str) -> None:
         """Редагує наявну нотатку."""
-        id_note = args[0]
-        title = args[1]
-        text = ' '.join(args[2:])
-        if len(args) < 2:
-            Message.error("incorrect_arguments")
-            return
-
         self.book_type.edit_note(id_note, title, text)
         Message.info("note_updated", title=title, text=text)
 
 
-@register_command("delete-note")
+@register_command("delete-note", book="notes", args=[Arg("note_id")])
 class DeleteNoteCommand(Command):
     description = {
         "en": "Deletes an existing note.",
@@ -319,51 +416,96 @@ class DeleteNoteCommand(Command):
         "uk": "[заголовок]"
     }
 
-    def execute(self, *args: tuple) -> None:
+    def execute(self, title: str) -> None:
         """Видаляє наявну нотатку."""
-        if len(args) != 1:
-            Message.error("incorrect_arguments")
-            return
-        title = args[0]
         self.book_type.delete_note(title)
         Message.info("note_deleted", title=title)
 
-@register_command("search-notes")
+@register_command("search-notes", book="notes", args=[Arg("keyword", rest=True)], options=PAGING_OPTIONS)
 class SearchNotesCommand(Command):
     description = {
         "en": "Searches for notes matching the given criteria.",
         "uk": "Шукає нотатки за заданими критеріями."
     }
     example = {
-        "en": "[search string]",
-        "uk": "[пошуковий запит]"
+        "en": "[search string] [--limit N] [--offset N]",
+        "uk": "[пошуковий запит] [--limit N] [--offset N]"
     }
 
-    def execute(self, *args: str) -> None:
+    def execute(self, keyword: str, limit: int = None, offset: int = 0) -> None:
         """Searches for notes matching the given criteria."""
-        if len(args) < 1:
-            Message.error("incorrect_arguments")
-            return
-        keyword = " ".join(args)
         results = self.book_type.search_notes(keyword)
         if results:
-            for note in results:
-                print(f"\nID: {note['id']}\nTitle: {note['title']}\nText: {note['text']}\nTags: {', '.join(note['tags'])}\n")
-                print('-'*40)
+            with OutputWriter() as writer:
+                for note in page(results, offset, limit):
+                    writer.write_line(f"\nID: {note['id']}\nTitle: {note['title']}\nText: {note['text']}\nTags: {', '.join(note['tags'])}\n")
+                    writer.write_line('-'*40)
         else:
             Message.info("no_results_found")
 
-@register_command("display-notes")
+@register_command("display-notes", book="notes", options=PAGING_OPTIONS)
 class DisplayNotesCommand(Command):
     description = {
         "en":  "Displays all notes.",
         "uk": "Виводить всі нотатки."
     }
+    example = {
+        "en": "[--limit N] [--offset N]",
+        "uk": "[--limit N] [--offset N]"
+    }
 
-    def execute(self, *args: str) -> None:
+    def execute(self, limit: int = None, offset: int = 0) -> None:
         """Виводить всі нотатки."""
-        self.book_type.display_notes()
+        with OutputWriter() as writer:
+            self.book_type.display_notes(writer, offset, limit)
+
+
+@register_command("begin")
+class BeginCommand(Command):
+    description = {
+        "en": "Starts a batch: contacts are saved once on 'commit' or restored on 'rollback'.",
+        "uk": "Починає пакет змін: контакти зберігаються один раз після 'commit' або відновлюються після 'rollback'."
+    }
 
+    def execute(self) -> None:
+        """Starts a transaction on the address book."""
+        if self.book_type.in_transaction:
+            Message.warning("transaction_in_progress")
+            return
+        self.book_type.begin()
+        Message.info("transaction_started")
+
+
+@register_command("commit")
+class CommitCommand(Command):
+    description = {
+        "en": "Keeps the changes made since 'begin' and saves the contacts.",
+        "uk": "Залишає зміни, зроблені після 'begin', та зберігає контакти."
+    }
+
+    def execute(self) -> None:
+        """Ends the transaction; the contacts are saved after the command as usual."""
+        if not self.book_type.in_transaction:
+            Message.warning("no_transaction")
+            return
+        self.book_type.commit()
+        Message.info("transaction_committed")
+
+
+@register_command("rollback")
+class RollbackCommand(Command):
+    description = {
+        "en": "Discards the changes made since 'begin'.",
+        "uk": "Скасовує зміни, зроблені після 'begin'."
+    }
+
+    def execute(self) -> None:
+        """Restores the contacts as they were at 'begin'."""
+        if not self.book_type.in_transaction:
+            Message.warning("no_transaction")
+            return
+        self.book_type.rollback()
+        Message.info("transaction_rolled_back")
 
 
 @register_command("exit")
@@ -374,28 +516,65 @@ class ExitCommand(Command):
         "uk": "Зберігає адресну книгу та виходить з програми.",
     }
 
-    def execute(self, *args: str) -> None:
+    def execute(self) -> None:
         """Saves the address book and exits the program."""
+        # Незавершений пакет змін не зберігається
+        if self.book_type.in_transaction:
+            self.book_type.rollback()
+            Message.warning("transaction_rolled_back")
         storage = FileStorage("addressbook.json")
         storage.save_contacts(self.book_type.data)
         Message.info("exit_message")
         sys.exit()
 
 
-@register_command("help")
+@register_command("help", book=None, args=[Arg("prefix", required=False, default="")])
 class HelpCommand(Command):
     description = {
         "en": "Displays this help message.",
         "uk": "Виводить це повідомлення про доступні команди."
     }
+    example = {
+        "en": "[command prefix (optional)]",
+        "uk": "[початок команди (необов'язково)]"
+    }
+
+    # Rendered help table by language: the registry version it was rendered for,
+    # the header line, a line per command and the whole table joined. A prefix
+    # filters the lines on each call, so the prefixes typed do not grow the cache.
+    rendered: Dict[str, Tuple[int, str, List[Tuple[str, str]], str]] = {}
 
-    def execute(self, *args: str) -> None:
+    def execute(self, prefix: str = "") -> None:
         """Displays this help message."""
+        _, header, rows, output = self.get_table(get_settings().language)
+        if prefix:
+            lines = [line for command_name, line in rows if command_name.startswith(prefix)]
+            output = "\n".join(["", header, *lines, ""]) if lines else ""
+        if output:
+            print(output)
+        else:
+            Message.info("no_results_found")
+
+    @classmethod
+    def get_table(cls, language: str) -> Tuple[int, str, List[Tuple[str, str]], str]:
+        """
+        Cached help table of the language. Registering a command bumps the registry
+        version, so a table rendered for an older version is rendered again.
+        """
+        table = cls.rendered.get(language)
+        if table is None or table[0] != command_registry.registry_version:
+            header, rows = cls.render(language)
+            output = "\n".join(["", header, *(line for _, line in rows), ""])
+            table = cls.rendered[language] = (command_registry.registry_version, header, rows, output)
+        return table
+
+    @staticmethod
+    def render(language: str) -> Tuple[str, List[Tuple[str, str]]]:
+        """Renders the header and the line of each registered command in the given language."""
         headers = {
             "en": ("Command", "Parameters", "Description"),
             "uk": ("Команда", "Параметри", "Опис")
         }
-        language = settings.language
         max_command_len = max(len(command_name) for command_name in command_registry.command_registry.keys())
         max_example_len = max(
             len(command_class.example.get(language, "")) if hasattr(command_class, 'example') else 0
@@ -403,22 +582,22 @@ class HelpCommand(Command):
         )
 
         command_header, example_header, description_header = headers[language]
-        print(f"\n{Style.BRIGHT}{Fore.CYAN}{command_header.ljust(max_command_len)}\t{example_header.ljust(max_example_len)}\t{description_header}{Style.RESET_ALL}")
-
+        header = f"{Style.BRIGHT}{Fore.CYAN}{command_header.ljust(max_command_len)}\t{example_header.ljust(max_example_len)}\t{description_header}{Style.RESET_ALL}"
 
+        rows = []
         for command_name, command_class in command_registry.command_registry.items():
             description = command_class.description.get(language, "No description available.")
             example = command_class.example.get(language, "") if hasattr(command_class, 'example') else ""
-            
+
             command_str = f"{Style.BRIGHT}{Fore.WHITE}{command_name.ljust(max_command_len)}{Style.RESET_ALL}"
             example_str = f"{Fore.WHITE}{example.ljust(max_example_len)}{Style.RESET_ALL}"
             description_str = f"{Fore.GREEN}{description}{Style.RESET_ALL}"
-            
-            print(f"{command_str}\t{example_str}\t{description_str}")
-        
-        print()
 
-@register_command("set-language")
+            rows.append((command_name, f"{command_str}\t{example_str}\t{description_str}"))
+
+        return header, rows
+
+@register_command("set-language", book=None, args=[Arg("language")])
 class SetLanguageCommand(Command):
     description = {
         "en": "Sets the application language.",
@@ -430,12 +609,9 @@ class SetLanguageCommand(Command):
         "uk": "['en' або 'uk']"
     }
 
-    def execute(self, *args: str) -> None:
+    def execute(self, language: str) -> None:
         """Sets the application language."""
-        if len(args) != 1:
-            Message.error("incorrect_arguments")
-            return
-        language = args[0]
+        settings = get_settings()
         if language not in LANGUAGE_MAP[settings.language]:
             Message.error("incorrect_arguments")
             return
@@ -443,3 +619,110 @@ class SetLanguageCommand(Command):
         Message.load_templates(language)
         user_friendly_language_name = Message.LANGUAGE_MAP[language]
         Message.info("set_language", language=user_friendly_language_name)
+
+
+@register_command("stats", book=None, args=[Arg("file", required=False)])
+class StatsCommand(Command):
+    description = {
+        "en": "Shows command latency, storage timings and error counts.",
+        "uk": "Показує час виконання команд, роботи зі сховищем та кількість помилок."
+    }
+    example = {
+        "en": "[json file (optional)]",
+        "uk": "[json файл (необов'язково)]"
+    }
+
+    def execute(self, file: str = None) -> None:
+        """Shows command latency, storage timings and error counts."""
+        if file:
+            metrics.dump(file)
+            Message.info("stats_saved", file=file)
+            return
+
+        headers = {
+            "en": ("Name", "Count", "p50 ms", "p95 ms", "p99 ms", "Max ms", "Errors"),
+            "uk": ("Назва", "Кількість", "p50 мс", "p95 мс", "p99 мс", "Макс мс", "Помилки")
+        }
+        snapshot = metrics.snapshot()
+        rows = [
+            (name, stats, snapshot["errors"].get(name, 0))
+            for section in metrics.SECTIONS
+            for name, stats in snapshot[section].items()
+        ]
+        if not rows and not snapshot["errors"] and not snapshot["counters"]:
+            Message.info("no_stats")
+            return
+
+        name_header, *value_headers = headers[get_settings().language]
+        # Errors of names without timings (e.g. unknown commands) get empty timing columns.
+        untimed = [name for name in snapshot["errors"] if not any(row[0] == name for row in rows)]
+        name_len = max(len(name) for name in [name_header, *untimed, *snapshot["counters"], *(row[0] for row in rows)])
+        value_len = max(len(header) for header in value_headers)
+        header_str = "\t".join(header.rjust(value_len) for header in value_headers)
+        print(f"\n{Style.BRIGHT}{Fore.CYAN}{name_header.ljust(name_len)}\t{header_str}{Style.RESET_ALL}")
+
+        for name, stats, errors in rows:
+            values = [str(stats["count"])] + [
+                f"{stats[key]:.3f}" for key in ("p50_ms", "p95_ms", "p99_ms", "max_ms")
+            ] + [str(errors)]
+            values_str = "\t".join(value.rjust(value_len) for value in values)
+            print(f"{Style.BRIGHT}{Fore.WHITE}{name.ljust(name_len)}{Style.RESET_ALL}\t{Fore.GREEN}{values_str}{Style.RESET_ALL}")
+
+        for name in untimed:
+            values = [""] * (len(value_headers) - 1) + [str(snapshot["errors"][name])]
+            values_str = "\t".join(value.rjust(value_len) for value in values)
+            print(f"{Style.BRIGHT}{Fore.WHITE}{name.ljust(name_len)}{Style.RESET_ALL}\t{Fore.RED}{values_str}{Style.RESET_ALL}")
+
+        # Лічильники (напр. влучання кешу запитів) мають лише значення в колонці кількості
+        for name, count in snapshot["counters"].items():
+            values = [str(count)] + [""] * (len(value_headers) - 1)
+            values_str = "\t".join(value.rjust(value_len) for value in values)
+            print(f"{Style.BRIGHT}{Fore.WHITE}{name.ljust(name_len)}{Style.RESET_ALL}\t{Fore.GREEN}{values_str}{Style.RESET_ALL}")
+
+        print()
+
+
+@register_command("memory", args=[Arg("top", non_negative_int, required=False, default=10)])
+class MemoryCommand(Command):
+    description = {
+        "en": "Shows memory used by the contacts and notes.",
+        "uk": "Показує пам'ять, яку займають контакти та нотатки."
+    }
+    example = {
+        "en": "[number of allocation sites (optional)]",
+        "uk": "[кількість місць виділення (необов'язково)]"
+    }
+
+    def execute(self, top: int = 10) -> None:
+        """Shows memory used by the contacts and notes."""
+        from app.memory import memory_report  # tracemalloc is only needed here
+
+        report = memory_report(self.book_type, self.notes_book, top)
+
+        headers = {
+            "en": ("Type", "Count", "Bytes", "Bytes/item"),
+            "uk": ("Тип", "Кількість", "Байти", "Байти/шт")
+        }
+        type_header, *value_headers = headers[get_settings().language]
+        rows = [("contacts", report["contacts"]), ("notes", report["notes"])] + [
+            (category, {**entry, "per_record_bytes": entry["bytes"] / entry["count"]})
+            for category, entry in sorted(report["breakdown"].items(), key=lambda item: -item[1]["bytes"])
+        ]
+        name_len = max(len(name) for name in [type_header, *(row[0] for row in rows)])
+        value_len = max(len(header) for header in value_headers + ["0" * 12])
+        header_str = "\t".join(header.rjust(value_len) for header in value_headers)
+        print(f"\n{Style.BRIGHT}{Fore.CYAN}{type_header.ljust(name_len)}\t{header_str}{Style.RESET_ALL}")
+        for name, entry in rows:
+            values = [str(entry["count"]), f"{entry['bytes']:,}", f"{entry['per_record_bytes']:,.1f}"]
+            values_str = "\t".join(value.rjust(value_len) for value in values)
+            print(f"{Style.BRIGHT}{Fore.WHITE}{name.ljust(name_len)}{Style.RESET_ALL}\t{Fore.GREEN}{values_str}{Style.RESET_ALL}")
+        print()
+        Message.info("memory_total", size=f"{report['total_bytes']:,}")
+
+        if not report["tracing"]:
+            Message.info("memory_tracing_hint")
+            return
+        for site in report["allocation_sites"]:
+            print(f"{Fore.WHITE}{site['file']}:{site['line']}{Style.RESET_ALL}\t"
+                  f"{Fore.GREEN}{site['bytes']:,} B\t{site['count']:,}{Style.RESET_ALL}")
+        print()
@@ -4,10 +4,24 @@ import os
 
 class Settings:
     DEFAULT_LANGUAGE = "en"
+    DEFAULT_FUZZY_DISTANCE = 2
+    DEFAULT_REMINDER_TIME = "09:00"
     SETTINGS_FILE = "settings.json"
 
     def __init__(self):
         self.language = self.DEFAULT_LANGUAGE
+        # Path of a JSON file the runtime metrics are dumped to at exit (disabled when empty).
+        self.stats_file = None
+        # Path of a Chrome trace-event JSON file written at exit (tracing is off when empty).
+        self.trace_file = None
+        # Maximum edit distance of fuzzy name matches ('search-contact --fuzzy', "did you mean").
+        self.fuzzy_distance = self.DEFAULT_FUZZY_DISTANCE
+        # Processes validating large contact files on load and import (all CPUs when empty, 1 disables the pool).
+        self.load_workers = None
+        # Processes scanning large books for queries no index covers (all CPUs when empty, 1 disables the pool).
+        self.scan_workers = None
+        # Time of day (HH:MM) of the birthday reminders shown while the bot runs (off when empty).
+        self.reminder_time = self.DEFAULT_REMINDER_TIME
         self.load_settings()
 
     def load_settings(self):
@@ -15,12 +29,44 @@ class Settings:
             with open(self.SETTINGS_FILE, "r") as file:
                 settings = json.load(file)
                 self.language = settings.get("language", self.DEFAULT_LANGUAGE)
+                self.stats_file = settings.get("stats_file")
+                self.trace_file = settings.get("trace_file")
+                self.fuzzy_distance = settings.get("fuzzy_distance", self.DEFAULT_FUZZY_DISTANCE)
+                self.load_workers = settings.get("load_workers")
+                self.scan_workers = settings.get("scan_workers")
+                self.reminder_time = settings.get("reminder_time", self.DEFAULT_REMINDER_TIME)
 
     def save_settings(self):
         settings = {"language": self.language}
+        if self.stats_file:
+            settings["stats_file"] = self.stats_file
+        if self.trace_file:
+            settings["trace_file"] = self.trace_file
+        if self.fuzzy_distance != self.DEFAULT_FUZZY_DISTANCE:
+            settings["fuzzy_distance"] = self.fuzzy_distance
+        if self.load_workers:
+            settings["load_workers"] = self.load_workers
+        if self.scan_workers:
+            settings["scan_workers"] = self.scan_workers
+        if self.reminder_time != self.DEFAULT_REMINDER_TIME:
+            settings["reminder_time"] = self.reminder_time
         with open(self.SETTINGS_FILE, "w") as file:
             json.dump(settings, file, indent=4)
 
     def set_language(self, language):
         self.language = language
         self.save_settings()
+
+
+_settings = None
+
+
+def get_settings() -> Settings:
+    """
+    Shared settings instance. 'settings.json' is read on first use rather than at
+    import time, and only once per process.
+    """
+    global _settings
+    if _settings is None:
+        _settings = Settings()
+    return _settings
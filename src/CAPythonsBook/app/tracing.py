@@ -0,0 +1,83 @@
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List
+
+
+class _NullSpan:
+    """Span used while tracing is disabled: entering and leaving it costs nothing."""
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    def __init__(self, tracer: "Tracer", name: str, category: str, args: Dict[str, Any]) -> None:
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = 0
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter_ns()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        end = time.perf_counter_ns()
+        self.tracer.add_event(self.name, self.category, self.start, end - self.start, self.args)
+
+
+class Tracer:
+    """
+    Records nested spans as Chrome trace events ("ph": "X" complete events),
+    viewable in chrome://tracing or Perfetto. Disabled until 'start' is called.
+    A single module-level instance ('tracer') is shared by the whole application.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.events: List[Dict[str, Any]] = []
+        self.origin = time.perf_counter_ns()
+
+    def start(self) -> None:
+        self.events = []
+        self.origin = time.perf_counter_ns()
+        self.enabled = True
+
+    def stop(self) -> None:
+        self.enabled = False
+
+    def span(self, name: str, category: str = "app", **args: Any):
+        """Context manager recording the wrapped block as a span named 'name'."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, category, args)
+
+    def add_event(self, name: str, category: str, start_ns: int, duration_ns: int, args: Dict[str, Any]) -> None:
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start_ns - self.origin) / 1000,
+            "dur": duration_ns / 1000,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = {key: str(value) for key, value in args.items()}
+        self.events.append(event)
+
+    def write(self, file_path: str) -> None:
+        """Writes the recorded spans in the Chrome trace-event JSON format."""
+        with open(file_path, "w", encoding="utf-8") as file:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, file, ensure_ascii=False)
+
+
+tracer = Tracer()
@@ -0,0 +1,91 @@
+from typing import Dict, Iterable, Iterator, List, Optional
+
+
+class _Node:
+    __slots__ = ("children", "count")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_Node"] = {}
+        # Кількість однакових слів, що закінчуються в цьому вузлі
+        self.count = 0
+
+
+class PrefixTrie:
+    """
+    Prefix tree of words (contact or command names). Words are added and
+    removed one at a time, and finding the words with a given prefix only
+    walks the prefix and the subtree below it, not all the words.
+    The same word may be added several times; it is kept until removed as often.
+    """
+
+    def __init__(self, words: Iterable[str] = ()) -> None:
+        self.root = _Node()
+        self.size = 0
+        for word in words:
+            self.add(word)
+
+    def add(self, word: str) -> None:
+        node = self.root
+        for char in word:
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = _Node()
+            node = child
+        node.count += 1
+        self.size += 1
+
+    def remove(self, word: str) -> None:
+        """Removes one occurrence of the word; unknown words are ignored."""
+        path = [self.root]
+        for char in word:
+            node = path[-1].children.get(char)
+            if node is None:
+                return
+            path.append(node)
+        if path[-1].count == 0:
+            return
+        path[-1].count -= 1
+        self.size -= 1
+        # Видалення вузлів, що більше не ведуть до жодного слова
+        for index in range(len(word), 0, -1):
+            node = path[index]
+            if node.count or node.children:
+                break
+            del path[index - 1].children[word[index - 1]]
+
+    def __contains__(self, word: str) -> bool:
+        node = self._find(word)
+        return node is not None and node.count > 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def starts_with(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """Distinct words starting with the prefix in sorted order, at most 'limit' of them."""
+        node = self._find(prefix)
+        if node is None:
+            return []
+        words = []
+        for word in self._walk(node, prefix):
+            if limit is not None and len(words) >= limit:
+                break
+            words.append(word)
+        return words
+
+    def _find(self, prefix: str) -> Optional[_Node]:
+        node = self.root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def _walk(self, node: _Node, prefix: str) -> Iterator[str]:
+        # Iterative depth-first walk: names may be longer than the recursion limit allows.
+        stack = [(node, prefix)]
+        while stack:
+            node, word = stack.pop()
+            if node.count:
+                yield word
+            for char in sorted(node.children, reverse=True):
+                stack.append((node.children[char], word + char))
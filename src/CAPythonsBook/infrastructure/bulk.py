@@ -0,0 +1,125 @@
+import json
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from infrastructure.codecs import codec_for
+
+# Below this many records validation runs in the calling process: starting the
+# worker processes would take longer than the validation itself.
+PARALLEL_MIN_RECORDS = 20_000
+# Chunks per worker: smaller chunks even out the load between the workers.
+CHUNKS_PER_WORKER = 4
+
+# (record key, ((canonical field key, validated value), ...))
+ValidRecord = Tuple[str, Tuple[Tuple[str, Any], ...]]
+# (record key, {canonical field key: field or list of fields})
+DecodedRecord = Tuple[str, Dict[str, Any]]
+# (record key, error message)
+InvalidRecord = Tuple[str, str]
+
+
+def validate_records(items: Sequence[Tuple[str, Dict[str, Any]]]) -> Tuple[List[ValidRecord], List[InvalidRecord]]:
+    """
+    Validates raw records '(key, {field key: value})' with the field codecs.
+    Runs in the worker processes, so it returns plain tuples rather than
+    'Record' objects: they are cheap to send back to the parent.
+    """
+    valid: List[ValidRecord] = []
+    invalid: List[InvalidRecord] = []
+    name_codec = codec_for("name")
+    for key, fields in items:
+        try:
+            if not isinstance(fields, dict):
+                raise ValueError("Contact must be an object of fields.")
+            checked = [("name", name_codec.check(fields.get("name")))]
+            for field_key, value in fields.items():
+                if field_key != "name":
+                    codec = codec_for(field_key)
+                    checked.append((codec.key, codec.check(value)))
+            valid.append((key, tuple(checked)))
+        except (ValueError, TypeError) as e:
+            invalid.append((key, str(e)))
+    return valid, invalid
+
+
+def decode_records(items: Sequence[Tuple[str, Dict[str, Any]]]) -> Tuple[List[DecodedRecord], List[InvalidRecord]]:
+    """Validates and converts raw records in this process, in a single pass."""
+    decoded: List[DecodedRecord] = []
+    invalid: List[InvalidRecord] = []
+    name_codec = codec_for("name")
+    for key, fields in items:
+        try:
+            if not isinstance(fields, dict):
+                raise ValueError("Contact must be an object of fields.")
+            converted = {"name": name_codec.decode(fields.get("name"))}
+            for field_key, value in fields.items():
+                if field_key != "name":
+                    codec = codec_for(field_key)
+                    converted[codec.key] = codec.decode(value)
+            decoded.append((key, converted))
+        except (ValueError, TypeError) as e:
+            invalid.append((key, str(e)))
+    return decoded, invalid
+
+
+def parse_records(
+    items: Sequence[Tuple[str, Dict[str, Any]]],
+    workers: Optional[int] = None,
+    min_records: int = PARALLEL_MIN_RECORDS,
+) -> Tuple[List[DecodedRecord], List[InvalidRecord]]:
+    """
+    Validates and converts raw records '(key, {field key: value})' to
+    '(key, {canonical field key: field})', in input order. Large inputs are
+    split into chunks validated by 'validate_records' in a pool of 'workers'
+    processes (all CPUs by default); the parent only builds the fields of the
+    returned values. Small inputs, or a single worker, use 'decode_records'.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(items) < min_records:
+        return decode_records(items)
+
+    # Imported here: small books never start a process pool.
+    from concurrent.futures import ProcessPoolExecutor
+    from app.processes import pool_context
+
+    chunk_size = -(-len(items) // (workers * CHUNKS_PER_WORKER))
+    chunks = [items[start:start + chunk_size] for start in range(0, len(items), chunk_size)]
+    decoded: List[DecodedRecord] = []
+    invalid: List[InvalidRecord] = []
+    with ProcessPoolExecutor(max_workers=workers, mp_context=pool_context()) as executor:
+        for chunk_valid, chunk_invalid in executor.map(validate_records, chunks):
+            for key, fields in chunk_valid:
+                decoded.append((key, {field_key: codec_for(field_key).build(value) for field_key, value in fields}))
+            invalid.extend(chunk_invalid)
+    return decoded, invalid
+
+
+def read_contacts_file(file_path: str) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Raw records of a file to import, as '(key, {field key: value})' pairs. A JSON
+    file is either in the format of the contacts file (an object of records by
+    id) or a list of records; a CSV file has a header row with the field keys
+    and the values of multi-valued fields (phones) separated by ';'. Keys of
+    records without an id are their row numbers, for error messages.
+    """
+    if file_path.lower().endswith(".csv"):
+        # Imported here: only CSV imports need the module.
+        import csv
+
+        with open(file_path, "r", encoding="utf-8", newline="") as file:
+            items = []
+            for row_number, row in enumerate(csv.DictReader(file), 2):
+                fields: Dict[str, Any] = {}
+                for key, value in row.items():
+                    if not key or value is None or not value.strip():
+                        continue
+                    value = value.strip()
+                    fields[key.strip()] = value.split(";") if codec_for(key.strip()).multi else value
+                items.append((f"row {row_number}", fields))
+            return items
+
+    with open(file_path, "r", encoding="utf-8") as file:
+        data = json.load(file)
+    if isinstance(data, dict):
+        return list(data.items())
+    return [(f"item {index}", fields) for index, fields in enumerate(data, 1)]
@@ -0,0 +1,57 @@
+from typing import Any, Callable, Dict, Sequence, Type
+
+from app.entities import Birthday, Field, Name, Phone
+
+
+class FieldCodec:
+    """
+    Conversion of one record field between its 'Field' object(s) and the JSON
+    value in the contacts file. 'multi' fields hold a list of values (phones).
+    The encode/decode functions are built once, when the codec is registered;
+    'decode' is 'check' (validation only, used by bulk-load workers) followed
+    by 'build' (fields of already validated values).
+    """
+
+    def __init__(self, key: str, field_class: Type[Field], multi: bool = False) -> None:
+        self.key = key
+        self.field_class = field_class
+        self.multi = multi
+        if multi:
+            self.decode: Callable[[Any], Any] = lambda values: [field_class(value) for value in values]
+            self.check: Callable[[Any], Any] = lambda values: [field_class.validate(value) for value in values]
+            self.build: Callable[[Any], Any] = lambda values: [field_class.from_valid(value) for value in values]
+            self.encode: Callable[[Any], Any] = lambda fields: [field.value for field in fields]
+        else:
+            self.decode = field_class
+            self.check = field_class.validate
+            self.build = field_class.from_valid
+            self.encode = lambda field: field.value
+
+
+# Ключ у файлі (канонічний або застарілий) -> кодек поля з канонічним ключем
+FIELD_CODECS: Dict[str, FieldCodec] = {}
+
+
+def register_field(key: str, field_class: Type[Field], multi: bool = False, aliases: Sequence[str] = ()) -> FieldCodec:
+    """
+    Registers the codec of a field stored under the canonical 'key'. Values found
+    under one of the 'aliases' (e.g. an older spelling) are loaded into 'key'.
+    """
+    codec = FieldCodec(key, field_class, multi)
+    FIELD_CODECS[key] = codec
+    for alias in aliases:
+        FIELD_CODECS[alias] = codec
+    return codec
+
+
+def codec_for(key: str) -> FieldCodec:
+    """Codec of the field; fields without a registered codec are kept as generic 'Field' values."""
+    codec = FIELD_CODECS.get(key)
+    if codec is None:
+        codec = FIELD_CODECS[key] = FieldCodec(key, Field)
+    return codec
+
+
+register_field("name", Name)
+register_field("phones", Phone, multi=True, aliases=("phone",))
+register_field("birthday", Birthday, aliases=("Birthday",))
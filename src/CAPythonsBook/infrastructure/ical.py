@@ -0,0 +1,108 @@
+import calendar
+from datetime import date, datetime, timezone
+from typing import Callable, Iterable, Iterator, TextIO, Tuple
+
+from app.entities import birthday_in_year, congratulation_date, next_birthday
+
+PRODUCT_ID = "-//CAPythons//Assistant Bot//EN"
+# Years of explicit dates written for birthdays a yearly rule cannot express (see 'birthday_event').
+EXPLICIT_YEARS = 10
+# Content lines longer than this many octets are folded (RFC 5545, 3.1).
+MAX_LINE_OCTETS = 75
+
+# (record id, name, birthday)
+BirthdayItem = Tuple[str, str, date]
+
+
+def escape_text(value: str) -> str:
+    return value.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+
+def fold_line(line: str) -> str:
+    """Splits a content line into lines of at most 75 octets, continued with a space (never inside a character)."""
+    if len(line.encode("utf-8")) <= MAX_LINE_OCTETS:
+        return line + "\r\n"
+    parts, current, size = [], "", 0
+    for char in line:
+        octets = len(char.encode("utf-8"))
+        # Продовження починається з пробілу, який теж займає октет
+        if size + octets > MAX_LINE_OCTETS - (1 if parts else 0):
+            parts.append(current)
+            current, size = "", 0
+        current += char
+        size += octets
+    parts.append(current)
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def _ical_date(day: date) -> str:
+    return day.strftime("%Y%m%d")
+
+
+def birthday_event(record_id: str, summary: str, birthday: date, today: date, stamp: str) -> Iterator[str]:
+    """
+    Content lines of the all-day VEVENT of a birthday, starting with its next
+    congratulation date. Weekend birthdays move to Monday: the yearly rule
+    takes the first weekday among the birthday and the two days after it
+    ('BYSETPOS=1'). When those days cross the end of the month (or the
+    birthday is on 29.02) the rule cannot say it, and the congratulation
+    dates of the next EXPLICIT_YEARS years are listed in 'RDATE' instead.
+    """
+    upcoming = next_birthday(birthday, today)
+    first = congratulation_date(upcoming)
+    yield "BEGIN:VEVENT"
+    yield f"UID:{record_id}-birthday@capythons"
+    yield f"DTSTAMP:{stamp}"
+    yield f"DTSTART;VALUE=DATE:{_ical_date(first)}"
+    days_in_month = calendar.monthrange(2001, birthday.month)[1]
+    if birthday.day > days_in_month - 2:
+        later = [
+            congratulation_date(birthday_in_year(birthday, year))
+            # Рік самого дня народження: перенесення з 31.12 на понеділок змінює рік дати привітання
+            for year in range(upcoming.year + 1, upcoming.year + EXPLICIT_YEARS)
+        ]
+        yield "RDATE;VALUE=DATE:" + ",".join(_ical_date(day) for day in later)
+    else:
+        days = ",".join(str(birthday.day + offset) for offset in range(3))
+        yield f"RRULE:FREQ=YEARLY;BYMONTH={birthday.month};BYMONTHDAY={days};BYDAY=MO,TU,WE,TH,FR;BYSETPOS=1"
+    yield f"SUMMARY:{escape_text(summary)}"
+    yield "CATEGORIES:BIRTHDAY"
+    yield "TRANSP:TRANSPARENT"
+    yield "END:VEVENT"
+
+
+def calendar_lines(
+    birthdays: Iterable[BirthdayItem],
+    today: date,
+    summary: Callable[[str], str] = str,
+) -> Iterator[str]:
+    """
+    Folded, CRLF-terminated lines of an iCalendar (RFC 5545) with one event per
+    birthday, generated lazily; 'summary' makes the event title from the name.
+    """
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    header = ["BEGIN:VCALENDAR", "VERSION:2.0", f"PRODID:{PRODUCT_ID}", "CALSCALE:GREGORIAN", "METHOD:PUBLISH"]
+    for line in header:
+        yield fold_line(line)
+    for record_id, name, birthday in birthdays:
+        for line in birthday_event(record_id, summary(name), birthday, today, stamp):
+            yield fold_line(line)
+    yield fold_line("END:VCALENDAR")
+
+
+def record_birthdays(records: Iterable) -> Iterator[BirthdayItem]:
+    """Birthdays of the records that have one."""
+    for record in records:
+        field = record.fields.get("birthday")
+        if field is not None:
+            yield str(record.id), record.name.value, field.date
+
+
+def write_calendar(lines: Iterable[str], file: TextIO) -> int:
+    """Writes the lines as they are generated; returns the number of events written."""
+    events = 0
+    for line in lines:
+        file.write(line)
+        if line == "BEGIN:VEVENT\r\n":
+            events += 1
+    return events
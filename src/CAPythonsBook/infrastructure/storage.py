@@ -1,7 +1,12 @@
 import json
 import uuid
 from typing import Dict
-from app.entities import Record, AddressBook, Name, Phone, Birthday, Field
+from app.entities import Record
+from app.metrics import metrics
+from app.tracing import tracer
+from app.settings import get_settings
+from infrastructure.bulk import parse_records
+from infrastructure.codecs import codec_for
 
 
 class FileStorage:
@@ -9,32 +14,33 @@ class FileStorage:
         self.file_path = file_path
 
     def save_contacts(self, contacts: Dict[uuid.UUID, Record]) -> None:
-        data = {
-            str(record_id): record.to_dict() for record_id, record in contacts.items()
-        }
-        with open(self.file_path, "w", encoding="utf-8") as file:
-            json.dump(data, file, ensure_ascii=False, indent=4)
+        with metrics.measure("storage", "save_contacts"), tracer.span("save_contacts", "storage"):
+            data = {
+                str(record_id): {key: codec_for(key).encode(value) for key, value in record.fields.items()}
+                for record_id, record in contacts.items()
+            }
+            with open(self.file_path, "w", encoding="utf-8") as file:
+                json.dump(data, file, ensure_ascii=False, indent=4)
 
     def load_contacts(self) -> Dict[uuid.UUID, Record]:
+        with metrics.measure("storage", "load_contacts"), tracer.span("load_contacts", "storage"):
+            return self._load_contacts()
+
+    def _load_contacts(self) -> Dict[uuid.UUID, Record]:
         try:
             with open(self.file_path, "r", encoding="utf-8") as file:
                 data = json.load(file)
-            contacts = {}
-            for record_id, fields in data.items():
-                name = Name(fields.pop("name"))
-                record = Record(name)
-                record.id = uuid.UUID(record_id)
-                for field_name, field_value in fields.items():
-                    if field_name == "phones":
-                        phones = [Phone(phone) for phone in field_value]
-                        record.fields["phones"] = phones
-                    else:
-                        field_class = globals().get(field_name.capitalize(), Field)
-                        record.fields[field_name] = field_class(field_value)
-                contacts[record.id] = record
-            return contacts
         except FileNotFoundError:
             return {}
         except json.JSONDecodeError as e:
             print(f"Error decoding JSON: {e}")
             return {}
+        decoded, invalid = parse_records(list(data.items()), get_settings().load_workers)
+        if invalid:
+            record_id, error = invalid[0]
+            raise ValueError(f"Invalid contact '{record_id}' in {self.file_path}: {error}")
+        contacts = {}
+        for record_id, fields in decoded:
+            record = Record.from_fields(uuid.UUID(record_id), fields)
+            contacts[record.id] = record
+        return contacts
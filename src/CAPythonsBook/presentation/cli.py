@@ -1,6 +1,8 @@
+import atexit
 import sys
 import os
-from typing import Tuple
+from datetime import time
+from typing import TYPE_CHECKING, Tuple
 
 from app.interfaces import Command
 
@@ -9,11 +11,18 @@ sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
 
 from app.entities import AddressBook, NotesBook
 from app.services import handle_command
+from app.command_registry import get_command
 from presentation.messages import Message
 from infrastructure.storage import FileStorage
-from app.settings import Settings
+from app.settings import get_settings
+from app.metrics import metrics
+from app.tracing import tracer
+from app.events import ContactEvent
 from colorama import init, Fore, Style
 
+if TYPE_CHECKING:
+    from app.reminders import BirthdayScheduler
+
 
 def parse_input(user_input: str) -> Tuple[str, list[str]]:
     """Parse the user input into a command and arguments."""
@@ -23,7 +32,48 @@ def parse_input(user_input: str) -> Tuple[str, list[str]]:
     return command, args
 
 
+def split_commands(user_input: str) -> list[str]:
+    """
+    Split a line into the ';'-separated commands it contains, skipping empty ones.
+    A command ending with free text (the text of 'add-note' and 'edit-note')
+    takes the rest of the line with its ';' too.
+    """
+    commands = []
+    parts = user_input.split(";")
+    for index, part in enumerate(parts):
+        words = part.split(maxsplit=1)
+        if not words:
+            continue
+        command = get_command(words[0].lower())
+        if command is not None and command.schema.takes_line:
+            commands.append(";".join(parts[index:]).strip())
+            break
+        commands.append(part.strip())
+    return commands or [""]
+
+
+def start_reminders(address_book: AddressBook, reminder_time: str) -> "BirthdayScheduler":
+    """Starts the birthday reminders; they are printed above a fresh prompt, without waiting for input."""
+    # Imported here: the reminders are started after the books are loaded.
+    from app.reminders import BirthdayScheduler
+
+    def notify(name, day):
+        print()
+        Message.info("birthday_reminder", name=name, congratulation_date=day.strftime("%d.%m.%Y"))
+        print(f"{Fore.YELLOW}{Message.format_message('enter_command')}{Style.RESET_ALL}", end="", flush=True)
+
+    scheduler = BirthdayScheduler(address_book, notify, time.fromisoformat(reminder_time))
+    scheduler.start()
+    return scheduler
+
+
 def main():
+    # Initialize settings first so that tracing also covers loading the books
+    settings = get_settings()
+    if settings.trace_file:
+        tracer.start()
+        atexit.register(tracer.write, settings.trace_file)
+
     storage = FileStorage("addressbook.json")
     address_book = AddressBook(
         storage.load_contacts()
@@ -32,10 +82,16 @@ def main():
     notes_book = NotesBook()
 
     init(autoreset=True)  # Initialize colorama
+    if sys.stdin.isatty():
+        # Imported here: completion is only installed for an interactive terminal.
+        from presentation.completion import install_completer
+
+        install_completer(address_book)
 
-    # Initialize settings and load templates
-    settings = Settings()
+    # Load templates
     Message.load_templates(settings.language)
+    if settings.stats_file:
+        atexit.register(metrics.dump, settings.stats_file)
 
     banner_part_1 = """
      _               _       _                 _     ____          _                ____  
@@ -52,15 +108,31 @@ def main():
     )
     print()
 
+    # Зміни контактів з моменту останнього збереження (обробник у черзі, отримує їх після рядка команд)
+    unsaved_changes = []
+    address_book.events.subscribe(ContactEvent, unsaved_changes.append, queued=True)
+
     handle_command("help", address_book, notes_book)
 
+    reminders = None
+    if settings.reminder_time and sys.stdin.isatty():
+        reminders = start_reminders(address_book, settings.reminder_time)
+
     while not Command.exit_command_flag:
         enter_command_prompt = Message.format_message("enter_command")
         user_input = input(
             f"{Fore.YELLOW}{enter_command_prompt}{Style.RESET_ALL}"
         ).strip()
-        command, args = parse_input(user_input)
-        handle_command(command, address_book, notes_book, *args)
-        storage.save_contacts(
-            address_book
-        )  # Save the contacts after handling the command
+        with tracer.span("repl_command", "cli", input=user_input):
+            for command_input in split_commands(user_input):
+                with tracer.span("parse_input", "cli"):
+                    command, args = parse_input(command_input)
+                handle_command(command, address_book, notes_book, *args)
+            # Save the contacts once per line if they have changed; inside 'begin'...'commit' only on commit
+            address_book.events.drain()
+            if unsaved_changes and not address_book.in_transaction:
+                storage.save_contacts(address_book)
+                unsaved_changes.clear()
+
+    if reminders is not None:
+        reminders.stop()
@@ -0,0 +1,54 @@
+from typing import List, Optional
+
+from app import command_registry
+from app.entities import AddressBook, Name
+
+
+class Completer:
+    """
+    Tab completion for the REPL: the first word of a command completes to
+    command names, the next one to contact names for commands whose first
+    argument is a 'Name' (show-phone, add-phone, change, ...). Both come from
+    prefix tries, so completing does not scan all the contacts.
+    """
+
+    MAX_MATCHES = 100
+
+    def __init__(self, address_book: AddressBook) -> None:
+        self.address_book = address_book
+        self.matches: List[str] = []
+
+    def complete_line(self, line: str) -> List[str]:
+        """Candidates for the last word of the line (only the current ';'-separated command counts)."""
+        words = line.split(";")[-1].lstrip().split(" ")
+        prefix = words[-1]
+        if len(words) == 1:
+            return command_registry.command_names.starts_with(prefix.lower(), self.MAX_MATCHES)
+        command = command_registry.get_command(words[0].lower())
+        if len(words) == 2 and command is not None and command.schema.args and command.schema.args[0].type is Name:
+            return self.address_book.name_index.starts_with(prefix, self.MAX_MATCHES)
+        return []
+
+    def complete(self, text: str, state: int) -> Optional[str]:
+        """'readline' completer function: returns the state-th candidate for the text."""
+        if state == 0:
+            import readline
+
+            line = readline.get_line_buffer()[:readline.get_endidx()]
+            self.matches = [match + " " for match in self.complete_line(line)]
+        return self.matches[state] if state < len(self.matches) else None
+
+
+def install_completer(address_book: AddressBook) -> None:
+    """Enables tab completion in 'input' where 'readline' is available (not on plain Windows)."""
+    try:
+        import readline
+    except ImportError:
+        return
+    readline.set_completer(Completer(address_book).complete)
+    # Лише пробіл і ';' розділяють слова: імена контактів можуть містити '-' та інші символи
+    readline.set_completer_delims(" ;")
+    if "libedit" in (readline.__doc__ or ""):
+        readline.parse_and_bind("bind ^I rl_complete")
+    else:
+        readline.parse_and_bind("tab: complete")
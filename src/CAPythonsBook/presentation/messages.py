@@ -1,11 +1,30 @@
 import json
 import os
+from string import Formatter
+from typing import Dict, List, Tuple, Union
 from colorama import Fore, Style
+from app.tracing import tracer
+
+# Compiled template: literal segments with the color codes already embedded,
+# alternating with placeholders '(field name, conversion, format spec)'.
+Segment = Union[str, Tuple[str, str, str]]
+CompiledTemplate = List[Segment]
 
 
 class Message:
     LANGUAGE_MAP = {"en": "English", "uk": "українська"}
+    DEFAULT_LANGUAGE = "en"
+    RESOURCES_DIR = os.path.join(os.path.dirname(__file__), "..", "resources")
+    TEMPLATE_NOT_FOUND = "Message template not found"
+    # Levels a template is compiled for; "message" is the bare text returned by 'format_message'.
+    LEVELS = ("message", "info", "warning", "error")
+
+    language = DEFAULT_LANGUAGE
     templates = {}
+    # language -> template name -> template text
+    raw_catalogs: Dict[str, Dict[str, str]] = {}
+    # language -> level -> template name -> compiled template
+    catalogs: Dict[str, Dict[str, Dict[str, CompiledTemplate]]] = {}
     colors = {
         "info": Fore.GREEN,
         "highlight": Fore.CYAN,
@@ -15,67 +34,100 @@ class Message:
         "reset": Style.RESET_ALL,
     }
 
+    @classmethod
+    def compile_template(cls, template: str, level: str) -> CompiledTemplate:
+        """
+        Split the template into literal and placeholder segments with the colors
+        of the given level baked into the literals: every parameter is highlighted
+        and followed by the level color again.
+        """
+        after_param_color = cls.colors["info"] if level == "message" else cls.colors[level]
+        prefix = "" if level == "message" else cls.colors[level]
+        suffix = "" if level == "message" else cls.colors["reset"]
+
+        segments: CompiledTemplate = []
+        literal = prefix
+        for text, field_name, format_spec, conversion in Formatter().parse(template):
+            literal += text
+            if field_name is None:
+                continue
+            segments.append(literal + cls.colors["param"])
+            segments.append((field_name, conversion or "", format_spec or ""))
+            literal = cls.colors["reset"] + after_param_color
+        segments.append(literal + suffix)
+        return segments
+
+    @classmethod
+    def load_catalogs(cls) -> None:
+        """Load and compile the message catalogs of all languages (done once)."""
+        for file_name in os.listdir(cls.RESOURCES_DIR):
+            if not (file_name.startswith("messages_") and file_name.endswith(".json")):
+                continue
+            language = file_name[len("messages_"):-len(".json")]
+            with open(os.path.join(cls.RESOURCES_DIR, file_name), "r", encoding="utf-8") as file:
+                templates = json.load(file)
+            cls.catalogs[language] = {
+                level: {name: cls.compile_template(template, level) for name, template in templates.items()}
+                for level in cls.LEVELS
+            }
+            cls.raw_catalogs[language] = templates
+
     @classmethod
     def load_templates(cls, language):
-        """Load message templates based on the selected language."""
-        try:
-            with open(
-                os.path.join(
-                    os.path.dirname(
-                        __file__), f"../resources/messages_{language}.json"
-                ),
-                "r",
-                encoding="utf-8",
-            ) as file:
-                cls.templates = json.load(file)
-        except FileNotFoundError:
+        """Select the message templates of the given language."""
+        if not cls.catalogs:
+            cls.load_catalogs()
+        if language not in cls.catalogs:
             print(
                 f"Language file for '{
                     language}' not found. Loading default (English) templates."
             )
-            with open(
-                os.path.join(
-                    os.path.dirname(__file__), "../resources/messages_en.json"
-                ),
-                "r",
-                encoding="utf-8",
-            ) as file:
-                cls.templates = json.load(file)
+            language = cls.DEFAULT_LANGUAGE
+        cls.language = language
+        cls.templates = cls.raw_catalogs[language]
+
+    @classmethod
+    def render(cls, level: str, template_name: str, kwargs: dict) -> str:
+        """Render a compiled template of the current language for the given level."""
+        with tracer.span("format_message", "presentation", template=template_name):
+            catalog = cls.catalogs.get(cls.language)
+            segments = catalog[level].get(template_name) if catalog else None
+            if segments is None:
+                segments = cls.compile_template(cls.TEMPLATE_NOT_FOUND, level)
+            if len(segments) == 1:
+                return segments[0]
+
+            parts = []
+            for index, segment in enumerate(segments):
+                if index % 2 == 0:
+                    parts.append(segment)
+                    continue
+                field_name, conversion, format_spec = segment
+                value = kwargs[field_name]
+                if conversion:
+                    value = repr(value) if conversion == "r" else ascii(value) if conversion == "a" else str(value)
+                parts.append(format(value, format_spec) if format_spec else str(value))
+            return "".join(parts)
 
     @classmethod
     def format_message(cls, template_name: str, **kwargs) -> str:
         """Format the message with provided parameters."""
-        # print(cls.templates)
-        # print("\n" + template_name)
-
-        # print(cls.templates.get('note_added'))
-        template = cls.templates.get(
-            template_name, "Message template not found")
-        formatted_message = template.format(
-            **{
-                k: f"{cls.colors['param']}{v}{cls.colors['reset']}{cls.colors['info']}"
-                for k, v in kwargs.items()
-            }
-        )
-        return formatted_message
+        return cls.render("message", template_name, kwargs)
 
     @classmethod
     def info(cls, template_name, **kwargs):
         """Display an informational message."""
-        message = cls.format_message(template_name, **kwargs)
-        print(f"{cls.colors['info']}{message}{cls.colors['reset']}")
+        print(cls.render("info", template_name, kwargs))
 
     @classmethod
     def warning(cls, template_name, **kwargs):
         """Display a warning message."""
-        message = cls.format_message(template_name, **kwargs)
-        print(f"{cls.colors['warning']}{message}{cls.colors['reset']}")
+        print(cls.render("warning", template_name, kwargs))
 
     @classmethod
     def error(cls, template_name, **kwargs):
         """Display an error message."""
-        message = cls.format_message(template_name, **kwargs)
-        print(f"{cls.colors['error']}{message}{cls.colors['reset']}")
+        print(cls.render("error", template_name, kwargs))
 
     @classmethod
     def apply_theme(cls, message: str) -> str:
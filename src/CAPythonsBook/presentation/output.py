@@ -0,0 +1,118 @@
+import os
+import sys
+from typing import List, Optional, TextIO
+
+from colorama import Style
+
+
+def raw_stdout() -> TextIO:
+    """The current stdout without colorama's wrapper (if 'colorama.init' installed one)."""
+    stream = sys.stdout
+    return getattr(stream, "_StreamWrapper__wrapped", stream)
+
+
+def is_terminal(stream: TextIO) -> bool:
+    try:
+        return stream.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+def page(items, offset: int = 0, limit: Optional[int] = None):
+    """Yield the items of the requested page of an iterable."""
+    for index, item in enumerate(items):
+        if index < offset:
+            continue
+        if limit is not None and index >= offset + limit:
+            return
+        yield item
+
+
+class OutputWriter:
+    """
+    Buffered writer for long listings. Lines are collected and written in chunks
+    with a single 'write' call. On a terminal colors are kept and output longer
+    than the screen goes through a pager ($PAGER or 'less -R'); otherwise colors
+    are dropped and the text is written straight to the stream behind colorama.
+
+    Usage:
+        with OutputWriter() as writer:
+            writer.write_line(text, Fore.GREEN)
+    """
+
+    CHUNK_LINES = 1000
+
+    def __init__(self, stream: Optional[TextIO] = None, use_pager: bool = True) -> None:
+        self.terminal = is_terminal(raw_stdout() if stream is None else stream)
+        # On a terminal colorama must still translate colors (Windows); elsewhere it is skipped.
+        self.stream = stream or (sys.stdout if self.terminal else raw_stdout())
+        self.color = self.terminal
+        self.page_lines = self._terminal_lines() - 1 if self.terminal and use_pager else None
+        self.pager = None
+        self.closed = False
+        self.buffer: List[str] = []
+        self.lines_written = 0
+
+    def write_line(self, text: str = "", color: str = "") -> None:
+        if self.closed:
+            return
+        self.buffer.append(f"{color}{text}{Style.RESET_ALL}" if color and self.color else text)
+        if self.page_lines is not None and self.pager is None and self.lines_written + len(self.buffer) > self.page_lines:
+            self.pager = self._open_pager()
+            self.page_lines = None
+        if len(self.buffer) >= self.CHUNK_LINES:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self.buffer or self.closed:
+            return
+        chunk = "\n".join(self.buffer) + "\n"
+        self.lines_written += len(self.buffer)
+        self.buffer = []
+        try:
+            if self.pager is not None:
+                self.pager.stdin.write(chunk)
+            else:
+                self.stream.write(chunk)
+        except BrokenPipeError:
+            # The user has quit the pager: drop the rest of the listing.
+            self.closed = True
+
+    def close(self) -> None:
+        self.flush()
+        if self.pager is not None:
+            try:
+                self.pager.stdin.close()
+            except BrokenPipeError:
+                pass
+            self.pager.wait()
+            self.pager = None
+        else:
+            self.stream.flush()
+        self.closed = True
+
+    def _terminal_lines(self) -> int:
+        try:
+            return os.get_terminal_size(self.stream.fileno()).lines
+        except (AttributeError, ValueError, OSError):
+            return 24
+
+    def _open_pager(self):
+        # Imported here: only long listings on a terminal need a pager.
+        import shlex
+        import shutil
+        import subprocess
+
+        command = os.environ.get("PAGER", "less -R" if shutil.which("less") else "")
+        if not command.strip():
+            return None
+        try:
+            return subprocess.Popen(shlex.split(command), stdin=subprocess.PIPE, text=True, encoding="utf-8")
+        except OSError:
+            return None
+
+    def __enter__(self) -> "OutputWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,77 @@
+import json
+import os
+import platform
+
+import pytest
+
+PERF_BASELINE = os.path.join(os.path.dirname(__file__), "perf_baseline.json")
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("perf", "performance regression gate")
+    group.addoption("--perf", action="store_true", default=False,
+                    help="run the performance tests (marked 'perf') against the stored baseline")
+    group.addoption("--perf-threshold", type=float, default=25.0,
+                    help="allowed slowdown of a median versus the baseline, in percent (default: 25)")
+    group.addoption("--perf-baseline", default=PERF_BASELINE,
+                    help="baseline JSON file (default: tests/perf_baseline.json)")
+    group.addoption("--perf-update-baseline", action="store_true", default=False,
+                    help="write the measured medians to the baseline file instead of comparing")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "perf: performance test, runs only with --perf")
+    config.perf_results = {}
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--perf") or config.getoption("--perf-update-baseline"):
+        return
+    skip_perf = pytest.mark.skip(reason="performance test, use --perf to run")
+    for item in items:
+        if "perf" in item.keywords:
+            item.add_marker(skip_perf)
+
+
+@pytest.fixture(scope="session")
+def perf_baseline(request):
+    """Baseline medians by operation name (empty when the file does not exist)."""
+    path = request.config.getoption("--perf-baseline")
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as file:
+        return json.load(file).get("operations", {})
+
+
+@pytest.fixture
+def perf_record(request):
+    """Stores a measured median (seconds) for the terminal report and the baseline update."""
+    def record(operation, median, baseline=None):
+        request.config.perf_results[operation] = {"median": median, "baseline": baseline}
+    return record
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    results = config.perf_results
+    if not results:
+        return
+    terminalreporter.section("performance")
+    for operation, result in sorted(results.items()):
+        median, baseline = result["median"] * 1000, result["baseline"]
+        if baseline:
+            delta = (result["median"] - baseline) / baseline * 100
+            terminalreporter.write_line(
+                f"{operation:<24} {median:10.3f} ms  baseline {baseline * 1000:10.3f} ms  {delta:+7.1f}%")
+        else:
+            terminalreporter.write_line(f"{operation:<24} {median:10.3f} ms  (no baseline)")
+
+    if config.getoption("--perf-update-baseline"):
+        path = config.getoption("--perf-baseline")
+        data = {
+            "meta": {"python": platform.python_version(), "platform": platform.platform()},
+            "operations": {operation: result["median"] for operation, result in sorted(results.items())},
+        }
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=4)
+            file.write("\n")
+        terminalreporter.write_line(f"baseline written to {path}")
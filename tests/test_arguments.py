@@ -0,0 +1,80 @@
+import io
+import os
+import sys
+import unittest
+from contextlib import redirect_stdout
+
+# Додавання каталогу пакета до sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src", "CAPythonsBook")))
+
+from app.arguments import Arg, ArgumentError, ArgumentSchema, PAGING_OPTIONS
+from app.entities import AddressBook, Name, NotesBook, Phone
+from app.command_registry import CommandDispatcher
+from app.services import handle_command
+from presentation.messages import Message
+
+
+class TestArgumentSchema(unittest.TestCase):
+
+    def test_convert(self):
+        """Test converting positional arguments with their declared types."""
+        schema = ArgumentSchema([Arg("name", Name), Arg("phone", Phone)])
+        (name, phone), options = schema.parse(["ivan", "0671234567"])
+        self.assertEqual((name.value, phone.value), ("ivan", "+380671234567"))
+        self.assertEqual(options, {})
+
+    def test_rest_and_options(self):
+        """Test a rest argument combined with paging options."""
+        schema = ArgumentSchema([Arg("keyword", rest=True)], PAGING_OPTIONS)
+        values, options = schema.parse(["ivan", "--limit", "5", "petro"])
+        self.assertEqual(values, ["ivan petro"])
+        self.assertEqual(options, {"limit": 5, "offset": 0})
+
+    def test_errors(self):
+        """Test the machine-friendly error codes."""
+        schema = ArgumentSchema([Arg("name", Name), Arg("phone", Phone)], PAGING_OPTIONS)
+        cases = [
+            (["ivan"], "missing_argument", "phone", None),
+            (["ivan", "0671234567", "x"], "unexpected_argument", None, "x"),
+            (["ivan", "123"], "invalid_value", "phone", "123"),
+            (["ivan", "0671234567", "--limit"], "missing_option_value", "limit", "--limit"),
+        ]
+        for words, code, argument, value in cases:
+            with self.assertRaises(ArgumentError) as context:
+                schema.parse(words)
+            self.assertEqual(context.exception.code, code)
+            self.assertEqual((context.exception.argument, context.exception.value), (argument, value))
+
+    def test_localized_report(self):
+        """Test that 'handle_command' reports an argument error with the template named by its code."""
+        address_book = AddressBook()
+        notes_book = NotesBook(os.path.join(os.path.dirname(__file__), "no_such_notes.json"))
+        language = Message.language
+        Message.load_templates("uk")
+        try:
+            output = io.StringIO()
+            with redirect_stdout(output):
+                handle_command("add", address_book, notes_book, "ivan")
+        finally:
+            Message.load_templates(language)
+        self.assertIn("Бракує аргументу", output.getvalue())
+        self.assertIn("phone", output.getvalue())
+        self.assertEqual(len(address_book), 0)
+
+
+class TestCommandDispatcher(unittest.TestCase):
+
+    def test_handlers_bound_once(self):
+        """Test that handlers are created once and bound to their declared book."""
+        address_book = AddressBook()
+        notes_book = NotesBook(os.path.join(os.path.dirname(__file__), "no_such_notes.json"))
+        dispatcher = CommandDispatcher(address_book, notes_book)
+        handler, _ = dispatcher.lookup("add")
+        self.assertIs(handler.book_type, address_book)
+        self.assertIs(dispatcher.lookup("add")[0], handler)
+        self.assertIs(dispatcher.lookup("add-note")[0].book_type, notes_book)
+        self.assertIsNone(dispatcher.lookup("no-such-command"))
+
+
+if __name__ == "__main__":
+    unittest.main()
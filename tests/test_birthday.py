@@ -0,0 +1,37 @@
+import os
+import sys
+import unittest
+from datetime import date
+
+# Додавання каталогу пакета до sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src", "CAPythonsBook")))
+
+from app.entities import Birthday
+
+
+class TestBirthday(unittest.TestCase):
+
+    def test_parsed_date(self):
+        """Test the ordinal and accessors kept alongside the canonical text."""
+        birthday = Birthday("05.03.1990")
+        self.assertEqual(birthday.ordinal, date(1990, 3, 5).toordinal())
+        self.assertEqual((birthday.date, birthday.month_day, birthday.day_of_year), (date(1990, 3, 5), (3, 5), 65))
+        self.assertEqual(Birthday.from_valid("29.02.2000").date, date(2000, 2, 29))
+
+    def test_canonical_text(self):
+        """Test that dates without leading zeros are stored as DD.MM.YYYY and invalid ones rejected."""
+        self.assertEqual(Birthday("5.3.1990").value, "05.03.1990")
+        for value in ("31.02.1990", "1990-03-05", "", None):
+            with self.assertRaises(ValueError):
+                Birthday(value)
+
+    def test_comparison(self):
+        """Test ordering and equality by date."""
+        birthdays = [Birthday("01.01.2000"), Birthday("31.12.1999"), Birthday("15.06.1980")]
+        self.assertEqual([b.value for b in sorted(birthdays)], ["15.06.1980", "31.12.1999", "01.01.2000"])
+        self.assertEqual(Birthday("5.3.1990"), Birthday("05.03.1990"))
+        self.assertEqual(len({Birthday("5.3.1990"), Birthday("05.03.1990")}), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
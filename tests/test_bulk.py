@@ -0,0 +1,64 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+import uuid
+
+# Додавання каталогу пакета до sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src", "CAPythonsBook")))
+
+from app.entities import Birthday, Phone
+from infrastructure.bulk import decode_records, parse_records, read_contacts_file, validate_records
+
+
+def raw_records(count):
+    return [
+        (str(uuid.UUID(int=index)), {"name": f"name-{index}", "phones": [f"067{index:07d}"], "birthday": "01.02.1990"})
+        for index in range(count)
+    ]
+
+
+class TestBulkValidation(unittest.TestCase):
+
+    def test_validate_records(self):
+        """Test compact results and errors of invalid records."""
+        items = raw_records(2) + [("bad-phone", {"name": "x", "phones": ["123"]}), ("no-name", {"phones": []})]
+        valid, invalid = validate_records(items)
+        self.assertEqual(valid[0], (items[0][0], (("name", "name-0"), ("phones", ["+380670000000"]), ("birthday", "01.02.1990"))))
+        self.assertEqual([key for key, _ in invalid], ["bad-phone", "no-name"])
+
+        decoded, decode_invalid = decode_records(items)
+        self.assertEqual(decode_invalid, invalid)
+        fields = decoded[0][1]
+        self.assertIsInstance(fields["phones"][0], Phone)
+        self.assertIsInstance(fields["birthday"], Birthday)
+
+    def test_parallel_matches_serial(self):
+        """Test that the process pool returns the same results in the same order."""
+        items = raw_records(200) + [("bad", {"name": "x", "birthday": "31.02.1990"})]
+
+        def plain(result):
+            decoded, invalid = result
+            return [(key, {k: [f.value for f in v] if isinstance(v, list) else v.value for k, v in fields.items()})
+                    for key, fields in decoded], invalid
+
+        self.assertEqual(plain(parse_records(items, workers=2, min_records=10)), plain(decode_records(items)))
+
+    def test_read_contacts_file(self):
+        """Test reading CSV and JSON import files."""
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path = os.path.join(directory, "contacts.csv")
+            with open(csv_path, "w", encoding="utf-8") as file:
+                file.write("name,phones,birthday\nivan,0671234567;0501234567,\n")
+            self.assertEqual(read_contacts_file(csv_path),
+                             [("row 2", {"name": "ivan", "phones": ["0671234567", "0501234567"]})])
+
+            json_path = os.path.join(directory, "contacts.json")
+            with open(json_path, "w", encoding="utf-8") as file:
+                json.dump([{"name": "petro"}], file)
+            self.assertEqual(read_contacts_file(json_path), [("item 1", {"name": "petro"})])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import os
+import sys
+import tempfile
+import unittest
+
+# Додавання каталогу пакета до sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src", "CAPythonsBook")))
+
+from app.cache import QueryCache
+from app.entities import AddressBook, Name, NotesBook, Phone, Record
+from app.metrics import metrics
+
+
+class TestQueryCache(unittest.TestCase):
+
+    def setUp(self):
+        metrics.reset()
+
+    def test_lru(self):
+        """Test hits, misses and eviction of the least recently used entry."""
+        cache = QueryCache("test", max_entries=2)
+        self.assertEqual(cache.get("a", 0, lambda: 1), 1)
+        cache.get("b", 0, lambda: 2)
+        self.assertEqual(cache.get("a", 0, lambda: -1), 1)
+        cache.get("c", 0, lambda: 3)
+        self.assertEqual(cache.get("b", 0, lambda: 20), 20)
+        self.assertEqual((cache.hits, cache.misses), (1, 4))
+        self.assertEqual(metrics.snapshot()["counters"], {"test.hits": 1, "test.misses": 4})
+
+    def test_generation(self):
+        """Test that a newer generation drops the cached results."""
+        cache = QueryCache("test")
+        cache.get("a", 0, lambda: 1)
+        self.assertEqual(cache.get("a", 1, lambda: 2), 2)
+        self.assertEqual(cache.misses, 2)
+
+
+class TestBookCaches(unittest.TestCase):
+
+    def setUp(self):
+        self.book = AddressBook()
+        record = Record(Name("ivan"))
+        record.add_phone(Phone("0671234567"))
+        self.book.add_record(record)
+        self.record = record
+
+    def test_search_cached_until_changed(self):
+        """Test that repeated searches hit the cache and changes invalidate it."""
+        self.assertEqual(len(list(self.book.search("phone:067*"))), 1)
+        self.assertEqual(len(list(self.book.search("  PHONE:067* "))), 1)
+        self.assertEqual(self.book.cache.hits, 1)
+
+        self.record.remove_phone(Phone("0671234567"))
+        self.assertEqual(list(self.book.search("phone:067*")), [])
+        new_record = Record(Name("petro"))
+        new_record.add_phone(Phone("0679999999"))
+        self.book.add_record(new_record)
+        self.assertEqual([r.name.value for r in self.book.search("phone:067*")], ["petro"])
+        self.assertEqual(self.book.cache.hits, 1)
+
+    def test_notes_search_cached(self):
+        """Test caching of note searches."""
+        with tempfile.TemporaryDirectory() as directory:
+            notes = NotesBook(os.path.join(directory, "notes.json"))
+            notes.add_note("shopping", "milk", [])
+            self.assertEqual(len(notes.search_notes("milk")), 1)
+            self.assertEqual(len(notes.search_notes("Milk")), 1)
+            self.assertEqual((notes.cache.hits, notes.cache.misses), (1, 1))
+            notes.add_note("more", "milk and bread", [])
+            self.assertEqual(len(notes.search_notes("milk")), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+import uuid
+
+# Додавання каталогу пакета до sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src", "CAPythonsBook")))
+
+from app.entities import Birthday, Field, Name, Phone, Record
+from infrastructure.codecs import codec_for
+from infrastructure.storage import FileStorage
+
+
+class TestFieldCodecs(unittest.TestCase):
+
+    def test_codecs(self):
+        """Test registered, aliased and generic field codecs."""
+        self.assertEqual(codec_for("Birthday").key, "birthday")
+        phones = codec_for("phones").decode(["0671234567", "0501234567"])
+        self.assertTrue(all(isinstance(phone, Phone) for phone in phones))
+        self.assertEqual(codec_for("phones").encode(phones), ["+380671234567", "+380501234567"])
+        email = codec_for("email").decode("ivan@example.com")
+        self.assertIs(type(email), Field)
+        with self.assertRaises(ValueError):
+            codec_for("phones").decode(["123"])
+
+    def test_round_trip(self):
+        """Test saving and loading records, including the legacy "Birthday" key."""
+        record = Record(Name("ivan"))
+        record.add_phone(Phone("0671234567"))
+        record.add_field("birthday", Birthday("29.02.1992"))
+        record.add_field("email", Field("ivan@example.com"))
+        legacy_id = uuid.uuid4()
+
+        with tempfile.TemporaryDirectory() as directory:
+            storage = FileStorage(os.path.join(directory, "addressbook.json"))
+            storage.save_contacts({record.id: record})
+            with open(storage.file_path, encoding="utf-8") as file:
+                data = json.load(file)
+            data[str(legacy_id)] = {"Birthday": "01.01.1990", "name": "petro"}
+            with open(storage.file_path, "w", encoding="utf-8") as file:
+                json.dump(data, file)
+
+            contacts = storage.load_contacts()
+
+        self.assertEqual(contacts[record.id].to_dict(), record.to_dict())
+        legacy = contacts[legacy_id]
+        self.assertEqual(list(legacy.fields), ["name", "birthday"])
+        self.assertIsInstance(legacy.fields["birthday"], Birthday)
+        self.assertIs(legacy.name, legacy.fields["name"])
+
+
+if __name__ == "__main__":
+    unittest.main()
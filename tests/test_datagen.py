@@ -0,0 +1,37 @@
+import os
+import sys
+import unittest
+
+# Додавання кореневої теки проекту до sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks.datagen import generate_address_book, generate_notes
+
+
+class TestDataGenerator(unittest.TestCase):
+
+    def test_deterministic(self):
+        """Test that the same seed produces the same dataset."""
+        first = generate_address_book(200, seed=7)
+        second = generate_address_book(200, seed=7)
+        self.assertEqual(
+            [record.to_dict() for record in first.data.values()],
+            [record.to_dict() for record in second.data.values()],
+        )
+        self.assertEqual(list(first.data), list(second.data))
+
+    def test_unique_names(self):
+        """Test that generated contact names are unique."""
+        book = generate_address_book(2000)
+        names = [record.name.value for record in book.data.values()]
+        self.assertEqual(len(names), len(set(names)))
+
+    def test_notes(self):
+        """Test the shape of generated notes."""
+        notes = generate_notes(50)
+        self.assertEqual(len(notes), 50)
+        self.assertTrue(all(set(note) == {"id", "title", "text", "tags"} for note in notes))
+
+
+if __name__ == "__main__":
+    unittest.main()
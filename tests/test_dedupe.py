@@ -0,0 +1,83 @@
+import os
+import sys
+import unittest
+
+# Додавання каталогу пакета до sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src", "CAPythonsBook")))
+
+from app import dedupe
+from app.dedupe import find_duplicates, phonetic_key
+from app.entities import AddressBook, Birthday, Field, Name, Phone, Record
+
+
+def make_record(name, *phones, **fields):
+    record = Record(Name(name), **fields)
+    for phone in phones:
+        record.add_phone(Phone(phone))
+    return record
+
+
+class TestDedupe(unittest.TestCase):
+
+    def setUp(self):
+        self.records = [
+            make_record("Ivan Petrenko", "0671234567"),
+            make_record("Olena Shevchenko", "0501111111"),
+            make_record("Petrenko Ivan", "0939999999", email=Field("ivan@example.com")),
+            make_record("Ivan Petrenk", "0671234567"),
+            make_record("Ivan Petrenko", "0671234567", birthday=Birthday("01.01.1990")),
+            make_record("Ivan Petrenko", "0671234567", birthday=Birthday("02.02.1992")),
+        ]
+        self.book = AddressBook({record.id: record for record in self.records})
+
+    def test_phonetic_key(self):
+        """Test that word order, vowels and doubled letters do not change the key."""
+        self.assertEqual(phonetic_key("Ivan Petrenko"), phonetic_key("petrennko ivan"))
+        self.assertNotEqual(phonetic_key("Ivan Petrenko"), phonetic_key("Olena Shevchenko"))
+
+    def test_clusters(self):
+        """Test clusters in book order with the confidence of their weakest link."""
+        clusters = find_duplicates(self.records)
+        self.assertEqual(len(clusters), 1)
+        # Запис 5 має інший день народження, тож не приєднується навіть через сильні зв'язки з іншими
+        self.assertEqual(clusters[0].records, [self.records[0], self.records[3], self.records[4]])
+        # Найслабший зв'язок — ім'я з пропущеною літерою
+        self.assertEqual(clusters[0].confidence, 0.86)
+        # The same name without a shared phone only counts at a lower threshold
+        self.assertIn(self.records[2], find_duplicates(self.records, min_confidence=0.5)[0].records)
+        self.assertEqual(find_duplicates(self.records, min_confidence=1.0), [])
+
+    def test_large_block_uses_window(self):
+        """Test that an oversized block is compared only within the name-order window."""
+        records = [make_record("Ivan Petrenko", f"067{index:07d}") for index in range(dedupe.MAX_BLOCK_SIZE + 20)]
+        clusters = find_duplicates(records, min_confidence=0.5)
+        self.assertEqual(len(clusters), 1)
+        self.assertEqual(len(clusters[0].records), len(records))
+
+    def test_merge(self):
+        """Test merging phones and missing fields into the first contact."""
+        cluster = find_duplicates(self.records)[0]
+        target = self.book.merge(cluster.records)
+        self.assertIs(target, self.records[0])
+        self.assertEqual(len(self.book), 4)
+        self.assertEqual([phone.value for phone in target.phones], ["+380671234567"])
+        self.assertEqual(target.fields["birthday"].value, "01.01.1990")
+
+        cluster = find_duplicates(list(self.book.values()), min_confidence=0.5)[0]
+        self.assertEqual(cluster.records, [target, self.records[2]])
+        self.book.merge(cluster.records)
+        self.assertEqual([phone.value for phone in target.phones], ["+380671234567", "+380939999999"])
+        self.assertEqual(target.fields["email"].value, "ivan@example.com")
+        # The contact with another birthday is kept with it
+        self.assertEqual(len(self.book), 3)
+        self.assertEqual(self.book.data[self.records[5].id].fields["birthday"].value, "02.02.1992")
+
+    def test_merge_conflicting_fields(self):
+        """Test that contacts with different birthdays are not merged."""
+        with self.assertRaises(ValueError):
+            self.book.merge([self.records[4], self.records[5]])
+        self.assertEqual(len(self.book), 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
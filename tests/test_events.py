@@ -0,0 +1,78 @@
+import os
+import sys
+import tempfile
+import unittest
+
+# Додавання каталогу пакета до sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src", "CAPythonsBook")))
+
+from app.entities import AddressBook, Birthday, Name, NotesBook, Phone, Record
+from app.events import (
+    ContactEvent, EventBus, FieldRemoved, FieldSet, NoteAdded, NoteDeleted, NoteEdited, NoteEvent,
+    PhoneAdded, PhoneEdited, PhoneRemoved, RecordAdded, RecordChanged, RecordRemoved,
+)
+
+
+class TestEventBus(unittest.TestCase):
+
+    def test_sync_and_queued(self):
+        """Test that synchronous handlers run at once and queued ones on drain, by base type."""
+        bus = EventBus()
+        sync_events, queued_events = [], []
+        bus.subscribe(RecordChanged, sync_events.append)
+        bus.subscribe(ContactEvent, queued_events.append, queued=True)
+        event = PhoneAdded(None, None)
+        bus.publish(event)
+        self.assertEqual(sync_events, [event])
+        self.assertEqual(queued_events, [])
+        self.assertEqual(bus.drain(), 1)
+        self.assertEqual(queued_events, [event])
+
+    def test_unsubscribe(self):
+        """Test cancelling a subscription."""
+        bus = EventBus()
+        events = []
+        unsubscribe = bus.subscribe(ContactEvent, events.append)
+        unsubscribe()
+        bus.publish(RecordAdded(None, None))
+        self.assertEqual(events, [])
+
+
+class TestEntityEvents(unittest.TestCase):
+
+    def test_contact_events(self):
+        """Test the events published by an address book and its records."""
+        book = AddressBook()
+        events = []
+        book.events.subscribe(ContactEvent, events.append)
+        record = Record(Name("ivan"))
+        book.add_record(record)
+        record.add_phone(Phone("0671234567"))
+        record.edit_phone(Phone("0671234567"), Phone("0501234567"))
+        record.remove_phone(Phone("0501234567"))
+        record.remove_phone(Phone("0501234567"))
+        record.add_field("birthday", Birthday("01.01.1990"))
+        record.remove_field("birthday")
+        book.delete(record.id)
+        record.add_phone(Phone("0631234567"))
+        self.assertEqual(
+            [type(event) for event in events],
+            [RecordAdded, PhoneAdded, PhoneEdited, PhoneRemoved, FieldSet, FieldRemoved, RecordRemoved],
+        )
+        self.assertEqual(book.generation, len(events))
+
+    def test_note_events(self):
+        """Test the events published by a notes book."""
+        with tempfile.TemporaryDirectory() as directory:
+            notes = NotesBook(os.path.join(directory, "notes.json"))
+            events = []
+            notes.events.subscribe(NoteEvent, events.append)
+            notes.add_note("title", "text", [])
+            note_id = notes.notes[0]["id"]
+            notes.edit_note(note_id, "new title", "new text")
+            notes.delete_note(note_id)
+            self.assertEqual([type(event) for event in events], [NoteAdded, NoteEdited, NoteDeleted])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import sys
+import unittest
+
+# Додавання каталогу пакета до sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src", "CAPythonsBook")))
+
+from app.arguments import ArgumentSchema, Arg, Flag
+from app.entities import AddressBook, Name, Record
+from app.fuzzy import BKTree, edit_distance
+
+
+class TestBKTree(unittest.TestCase):
+
+    def test_edit_distance(self):
+        """Test the Levenshtein distance."""
+        self.assertEqual(edit_distance("kitten", "sitting"), 3)
+        self.assertEqual(edit_distance("", "abc"), 3)
+        self.assertEqual(edit_distance("іван", "іван"), 0)
+
+    def test_search(self):
+        """Test that the search matches a linear scan and orders by distance."""
+        words = ["ivan", "ivanna", "iryna", "petro", "petra", "olga", "oleg", "ivan-2"]
+        tree = BKTree()
+        for index, word in enumerate(words):
+            tree.add(word, index)
+        for query in ("ivan", "petr", "olha", "x"):
+            for max_distance in range(4):
+                expected = sorted((edit_distance(query, w), w) for w in words if edit_distance(query, w) <= max_distance)
+                found = [(distance, key) for distance, key, _ in tree.search(query, max_distance)]
+                self.assertEqual(found, expected)
+
+    def test_remove(self):
+        """Test that removed items are no longer found."""
+        tree = BKTree()
+        tree.add("ivan", 1)
+        tree.add("ivan", 2)
+        tree.add("ivanna", 3)
+        tree.remove("ivan", 1)
+        tree.remove("ivanna", 3)
+        self.assertEqual(tree.search("ivan", 2), [(0, "ivan", {2})])
+
+
+class TestFuzzyAddressBook(unittest.TestCase):
+
+    def setUp(self):
+        self.book = AddressBook()
+        for name in ("Ivan", "Iryna", "Petro"):
+            self.book.add_record(Record(Name(name)))
+
+    def test_find_similar(self):
+        """Test fuzzy search and "did you mean" suggestions kept up to date."""
+        self.assertEqual([r.name.value for r in self.book.find_similar("ivn", 1)], ["Ivan"])
+        self.book.add_record(Record(Name("Ivo")))
+        self.assertEqual(self.book.suggest_names("ivn", 1), ["Ivan", "Ivo"])
+        self.assertEqual(self.book.suggest_names("zzz", 1), [])
+
+    def test_flag(self):
+        """Test parsing an option without a value."""
+        schema = ArgumentSchema([Arg("keyword", rest=True)], [Flag("--fuzzy")])
+        self.assertEqual(schema.parse(["ivan", "--fuzzy"]), (["ivan"], {"fuzzy": True}))
+        self.assertEqual(schema.parse(["ivan"]), (["ivan"], {"fuzzy": False}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import io
+import os
+import sys
+import unittest
+from contextlib import redirect_stdout
+
+# Додавання каталогу пакета до sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src", "CAPythonsBook")))
+
+from app import command_registry
+from app.command_registry import register_command
+from app.interfaces import Command
+from app.services import HelpCommand
+from presentation.messages import Message
+
+
+class TestHelpCommand(unittest.TestCase):
+
+    def setUp(self):
+        Message.load_templates("en")
+        self.registry = dict(command_registry.command_registry)
+
+    def tearDown(self):
+        command_registry.command_registry.clear()
+        command_registry.command_registry.update(self.registry)
+        command_registry.registry_version += 1
+
+    def run_help(self, prefix=""):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            HelpCommand(None).execute(prefix)
+        return output.getvalue()
+
+    def test_cached(self):
+        """Test that the table is rendered once per language and registry version."""
+        first = self.run_help()
+        table = HelpCommand.get_table("en")
+        self.assertEqual(self.run_help(), first)
+        self.assertIs(HelpCommand.get_table("en"), table)
+        self.assertIn("set-language", first)
+
+    def test_prefix(self):
+        """Test filtering the table by a command prefix."""
+        output = self.run_help("add")
+        self.assertIn("add-phone", output)
+        self.assertIn("add-note", output)
+        self.assertNotIn("show-phone", output)
+        self.assertIn("No results found", self.run_help("zzz"))
+
+    def test_prefixes_not_cached(self):
+        """Test that filtering by prefixes keeps one cached table per language."""
+        HelpCommand.rendered.clear()
+        for prefix in ("", "a", "ad", "add", "zzz"):
+            self.run_help(prefix)
+        self.assertEqual(len(HelpCommand.rendered), 1)
+        version, header, rows, output = next(iter(HelpCommand.rendered.values()))
+        self.assertEqual(output + "\n", self.run_help())
+
+    def test_invalidated_on_register(self):
+        """Test that registering a command drops the cached tables."""
+        self.run_help()
+
+        @register_command("zz-test", book=None)
+        class TestCommand(Command):
+            description = {"en": "Test command.", "uk": "Тестова команда."}
+            example = {"en": "", "uk": ""}
+
+            def execute(self):
+                pass
+
+        self.assertIn("zz-test", self.run_help("zz"))
+        self.assertEqual(HelpCommand.get_table("en")[0], command_registry.registry_version)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import io
+import os
+import sys
+import unittest
+from datetime import date
+
+# Додавання каталогу пакета до sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src", "CAPythonsBook")))
+
+from app.entities import Birthday, Name, Record
+from infrastructure.ical import calendar_lines, escape_text, fold_line, record_birthdays, write_calendar
+
+TODAY = date(2026, 10, 19)
+
+
+class TestICalendar(unittest.TestCase):
+
+    def test_fold_line(self):
+        """Test folding at 75 octets without splitting multi-byte characters."""
+        line = "SUMMARY:" + "День народження " * 10
+        folded = fold_line(line)
+        parts = folded[:-2].split("\r\n")
+        self.assertTrue(all(len(part.encode("utf-8")) <= 75 for part in parts))
+        self.assertTrue(all(part.startswith(" ") for part in parts[1:]))
+        self.assertEqual("".join(part[1:] if index else part for index, part in enumerate(parts)), line)
+        self.assertEqual(escape_text("a;b,c\\d"), r"a\;b\,c\\d")
+
+    def test_events(self):
+        """Test yearly rules, explicit dates at the end of a month and streaming output."""
+        records = [
+            Record(Name("ivan"), birthday=Birthday("24.10.1990")),
+            Record(Name("petro")),
+            Record(Name("olena"), birthday=Birthday("31.10.1985")),
+        ]
+        lines = calendar_lines(record_birthdays(records), TODAY, lambda name: f"Birthday of {name}")
+        self.assertEqual(next(lines), "BEGIN:VCALENDAR\r\n")
+        output = io.StringIO()
+        self.assertEqual(write_calendar(lines, output), 2)
+        text = output.getvalue().replace("\r\n ", "")
+        # 24.10.2026 is a Saturday and 31.10.2026 too: both move to Monday
+        self.assertIn("DTSTART;VALUE=DATE:20261026\r\n"
+                      "RRULE:FREQ=YEARLY;BYMONTH=10;BYMONTHDAY=24,25,26;BYDAY=MO,TU,WE,TH,FR;BYSETPOS=1\r\n"
+                      "SUMMARY:Birthday of ivan\r\n", text)
+        self.assertIn("DTSTART;VALUE=DATE:20261102\r\nRDATE;VALUE=DATE:20271101,20281031,", text)
+        self.assertTrue(text.endswith("END:VEVENT\r\nEND:VCALENDAR\r\n"))
+
+    def test_end_of_year_moved_to_january(self):
+        """Test that a birthday moved into January does not skip the next year."""
+        records = [Record(Name("ivan"), birthday=Birthday("31.12.1990"))]
+        text = "".join(calendar_lines(record_birthdays(records), date(2028, 12, 1))).replace("\r\n ", "")
+        # 31.12.2028 is a Sunday: congratulated on 01.01.2029, and the next birthday is 31.12.2029
+        self.assertIn("DTSTART;VALUE=DATE:20290101\r\nRDATE;VALUE=DATE:20291231,20301231,", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
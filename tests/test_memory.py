@@ -0,0 +1,53 @@
+import os
+import sys
+import tempfile
+import unittest
+
+# Додавання каталогу пакета до sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src", "CAPythonsBook")))
+
+from app.entities import AddressBook, Birthday, Field, Name, NotesBook, Phone, Record
+from app.memory import deep_sizeof, memory_report
+
+
+class TestMemoryReport(unittest.TestCase):
+
+    def setUp(self):
+        self.book = AddressBook()
+        record = Record(Name("John"))
+        record.add_phone(Phone("1234567890"))
+        record.add_phone(Phone("5555555555"))
+        record.add_field("birthday", Birthday("01.01.1990"))
+        record.add_field("email", Field("john@example.com"))
+        self.book.add_record(record)
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.notes_book = NotesBook(os.path.join(self.directory.name, "notes.json"))
+        self.notes_book.notes.append({"id": "1", "title": "t", "text": "some text", "tags": []})
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_breakdown(self):
+        """Test the breakdown by field type adds up to the total."""
+        report = memory_report(self.book, self.notes_book)
+        breakdown = report["breakdown"]
+        self.assertEqual(breakdown["Phone"]["count"], 2)
+        self.assertEqual(breakdown["Name"]["count"], 1)
+        self.assertEqual(breakdown["Birthday"]["count"], 1)
+        self.assertEqual(breakdown["Field"]["count"], 1)
+        self.assertEqual(breakdown["note text"]["count"], 1)
+        self.assertEqual(sum(entry["bytes"] for entry in breakdown.values()), report["total_bytes"])
+        self.assertEqual(report["contacts"]["count"], 1)
+
+    def test_shared_objects_counted_once(self):
+        """Test that objects reachable twice are counted once."""
+        shared = "x" * 100
+        seen = set()
+        first = deep_sizeof([shared], seen)
+        second = deep_sizeof([shared], seen)
+        self.assertLess(second, first)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+# Додавання каталогу пакета до sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src", "CAPythonsBook")))
+
+from presentation.messages import Message
+
+
+class TestMessage(unittest.TestCase):
+
+    def setUp(self):
+        Message.load_templates("en")
+
+    def test_format_message_matches_str_format(self):
+        """Test that compiled templates render like the plain 'str.format' of the template."""
+        colors = Message.colors
+        expected = Message.templates["contact_added"].format(
+            name=f"{colors['param']}ivan{colors['reset']}{colors['info']}",
+            phone=f"{colors['param']}0671234567{colors['reset']}{colors['info']}",
+        )
+        self.assertEqual(Message.format_message("contact_added", name="ivan", phone="0671234567"), expected)
+
+    def test_level_colors(self):
+        """Test that a level message is wrapped in its color and returns to it after parameters."""
+        colors = Message.colors
+        rendered = Message.render("error", "contact_not_found", {"name": "ivan"})
+        self.assertTrue(rendered.startswith(colors["error"]))
+        self.assertTrue(rendered.endswith(colors["reset"]))
+        self.assertIn(f"ivan{colors['reset']}{colors['error']}", rendered)
+
+    def test_missing_template(self):
+        """Test the fallback text of an unknown template."""
+        self.assertEqual(Message.format_message("no_such_template"), Message.TEMPLATE_NOT_FOUND)
+
+    def test_switch_language_without_io(self):
+        """Test that switching languages does not read the catalogs again."""
+        with mock.patch("builtins.open", side_effect=AssertionError("unexpected I/O")):
+            Message.load_templates("uk")
+            self.assertEqual(Message.format_message("greeting"), "Чим я можу допомогти?")
+            Message.load_templates("en")
+        self.assertEqual(Message.format_message("greeting"), "How can I help you?")
+
+
+if __name__ == "__main__":
+    unittest.main()
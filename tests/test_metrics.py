@@ -0,0 +1,60 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# Додавання каталогу пакета до sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src", "CAPythonsBook")))
+
+from app.metrics import LatencyHistogram, Metrics
+
+
+class TestLatencyHistogram(unittest.TestCase):
+
+    def test_percentiles(self):
+        """Test nearest-rank percentiles over the recorded samples."""
+        histogram = LatencyHistogram()
+        for duration in range(1, 101):
+            histogram.add(duration / 1000)
+        self.assertEqual(histogram.count, 100)
+        self.assertAlmostEqual(histogram.percentile(50), 0.050)
+        self.assertAlmostEqual(histogram.percentile(95), 0.095)
+        self.assertAlmostEqual(histogram.percentile(99), 0.099)
+        self.assertAlmostEqual(histogram.max, 0.100)
+
+    def test_empty(self):
+        """Test that an empty histogram reports zeros."""
+        self.assertEqual(LatencyHistogram().to_dict()["p99_ms"], 0.0)
+
+
+class TestMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.metrics = Metrics()
+
+    def test_measure_counts_errors(self):
+        """Test that a failing block is timed and counted as an error."""
+        with self.metrics.measure("commands", "add"):
+            pass
+        with self.assertRaises(ValueError):
+            with self.metrics.measure("commands", "add"):
+                raise ValueError("boom")
+        snapshot = self.metrics.snapshot()
+        self.assertEqual(snapshot["commands"]["add"]["count"], 2)
+        self.assertEqual(snapshot["errors"], {"add": 1})
+
+    def test_dump(self):
+        """Test dumping the collected metrics as JSON."""
+        with self.metrics.measure("storage", "save_contacts"):
+            pass
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "stats.json")
+            self.metrics.dump(file_path)
+            with open(file_path, encoding="utf-8") as file:
+                data = json.load(file)
+        self.assertEqual(data["storage"]["save_contacts"]["count"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import io
+import os
+import sys
+import unittest
+
+# Додавання каталогу пакета до sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src", "CAPythonsBook")))
+
+from colorama import Fore
+from presentation.output import OutputWriter, page
+
+
+class CountingStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+
+class TestPaging(unittest.TestCase):
+
+    def test_page(self):
+        """Test selecting a page of an iterable."""
+        self.assertEqual(list(page(range(10), 2, 3)), [2, 3, 4])
+        self.assertEqual(list(page(range(10), 8)), [8, 9])
+
+
+class TestOutputWriter(unittest.TestCase):
+
+    def test_plain_chunks(self):
+        """Test that output off a terminal is uncolored and written in chunks."""
+        stream = CountingStream()
+        with OutputWriter(stream) as writer:
+            for number in range(2500):
+                writer.write_line(str(number), Fore.GREEN)
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(len(lines), 2500)
+        self.assertEqual(lines[-1], "2499")
+        self.assertEqual(stream.writes, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
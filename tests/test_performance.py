@@ -0,0 +1,113 @@
+"""
+Performance regression gate.
+
+Runs key operations against fixed generated datasets and compares their median
+time with tests/perf_baseline.json:
+
+    pytest tests/test_performance.py --perf [--perf-threshold 25]
+    pytest tests/test_performance.py --perf-update-baseline
+"""
+import contextlib
+import io
+import os
+import random
+import sys
+
+import pytest
+
+# Додавання кореневої теки проекту до sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks.datagen import generate_address_book, generate_notes_book
+from benchmarks.run_benchmarks import measure
+from benchmarks.startup import run_main
+from app.entities import AddressBook, Name
+from app.services import HelpCommand, SearchContactsCommand
+from infrastructure.storage import FileStorage
+
+DATASET_SIZE = 5_000
+LOOKUPS = 50
+REPEAT = 15
+
+OPERATIONS = [
+    "load_contacts",
+    "save_contacts",
+    "find_by_name",
+    "search_contact",
+    "search_contact_cached",
+    "search_notes",
+    "search_notes_cached",
+    "get_upcoming_birthdays",
+    "get_upcoming_birthdays_cached",
+    "help",
+    "startup",
+]
+
+
+@pytest.fixture(scope="module")
+def operations(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("perf")
+    startup_directory = tmp_path_factory.mktemp("startup")
+    book = generate_address_book(DATASET_SIZE)
+    notes_book = generate_notes_book(DATASET_SIZE, str(directory / "notes.json"))
+    storage = FileStorage(str(directory / "addressbook.json"))
+    storage.save_contacts(book.data)
+    save_storage = FileStorage(str(directory / "addressbook_saved.json"))
+
+    names = [record.name.value for record in book.data.values()]
+    lookup_names = [Name(name) for name in random.Random(DATASET_SIZE).choices(names, k=LOOKUPS)]
+    search_command = SearchContactsCommand(book)
+    help_command = HelpCommand(book)
+
+    def find_names():
+        for name in lookup_names:
+            book.find_by_name(name)
+
+    def quiet(func, *args):
+        def run():
+            with contextlib.redirect_stdout(io.StringIO()):
+                func(*args)
+        return run
+
+    def uncached(cache, func):
+        # Without the cached result every run computes it, as the first run after a change does
+        def run():
+            cache.clear()
+            func()
+        return run
+
+    return {
+        "load_contacts": lambda: AddressBook(storage.load_contacts()),
+        "save_contacts": lambda: save_storage.save_contacts(book.data),
+        "find_by_name": find_names,
+        "search_contact": uncached(book.cache, quiet(search_command.execute, "shevchenko")),
+        "search_contact_cached": quiet(search_command.execute, "shevchenko"),
+        "search_notes": uncached(notes_book.cache, lambda: notes_book.search_notes("deadline")),
+        "search_notes_cached": lambda: notes_book.search_notes("deadline"),
+        "get_upcoming_birthdays": uncached(book.cache, book.get_upcoming_birthdays),
+        "get_upcoming_birthdays_cached": book.get_upcoming_birthdays,
+        "help": quiet(help_command.execute),
+        "startup": lambda: run_main(str(startup_directory)),
+    }
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("operation", OPERATIONS)
+def test_no_regression(operation, operations, perf_baseline, perf_record, pytestconfig):
+    """The median time of the operation must not exceed the baseline by more than the threshold."""
+    func = operations[operation]
+    func()  # warm-up
+    median = measure(func, REPEAT)["median"]
+    baseline = perf_baseline.get(operation)
+    perf_record(operation, median, baseline)
+
+    if pytestconfig.getoption("--perf-update-baseline"):
+        return
+    if baseline is None:
+        pytest.skip(f"no baseline for '{operation}'")
+    threshold = pytestconfig.getoption("--perf-threshold")
+    delta = (median - baseline) / baseline * 100
+    assert delta <= threshold, (
+        f"{operation}: median {median * 1000:.3f} ms is {delta:+.1f}% versus "
+        f"baseline {baseline * 1000:.3f} ms (allowed +{threshold:.1f}%)"
+    )
@@ -0,0 +1,80 @@
+import os
+import sys
+import unittest
+
+# Додавання каталогу пакета до sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src", "CAPythonsBook")))
+
+from app.entities import AddressBook, Name, Phone, Record
+from app.phones import country_code_of, normalize_phone
+from app.query import PhoneSuffix, parse_query
+
+
+class TestPhoneNormalization(unittest.TestCase):
+
+    def test_formats(self):
+        """Test that the usual ways of writing a number give the same E.164 form."""
+        for text in ("0671234567", "067-123-45-67", "(067)1234567", "+38 067 123 45 67", "380671234567", "00380671234567"):
+            self.assertEqual(normalize_phone(text), "+380671234567", text)
+        self.assertEqual(normalize_phone("+1 (202) 555-0143"), "+12025550143")
+        for text in ("123", "067123456x", "+0671234567", "+1234567890123456", "123456789a", None):
+            with self.assertRaises(ValueError):
+                normalize_phone(text)
+
+    def test_legacy_numbers(self):
+        """Test that 10-digit numbers without a leading 0 are kept as they are, without a country code."""
+        self.assertEqual(normalize_phone("1234567890"), "1234567890")
+        self.assertEqual(normalize_phone("123-456-78-90"), "1234567890")
+        phone = Phone("1234123412")
+        self.assertEqual((phone.value, phone.number, phone.country_code), ("1234123412", 1234123412, None))
+        self.assertEqual(Phone.from_valid(phone.value).value, "1234123412")
+
+    def test_compact_storage(self):
+        """Test the integer number and country code kept by 'Phone'."""
+        phone = Phone("067 123 45 67")
+        self.assertEqual((phone.number, phone.country_code), (380671234567, 380))
+        self.assertEqual(phone.value, "+380671234567")
+        self.assertEqual(Phone.from_valid("+442071234567").country_code, 44)
+        self.assertEqual([country_code_of(digits) for digits in ("12025550143", "74951234567", "491511234567")], [1, 7, 49])
+
+
+class TestPhoneSuffixSearch(unittest.TestCase):
+
+    def setUp(self):
+        self.book = AddressBook()
+        for name, phone in (("ivan", "0671234567"), ("john", "+12025550143"), ("olena", "0501234567")):
+            record = Record(Name(name))
+            record.add_phone(Phone(phone))
+            self.book.add_record(record)
+
+    def names(self, query):
+        return [record.name.value for record in self.book.search(query)]
+
+    def test_suffix_lookup(self):
+        """Test finding a number by any format or by its last digits."""
+        self.assertIsInstance(parse_query("phone:067-123-45-67"), PhoneSuffix)
+        for query in ("phone:0671234567", "phone:+380671234567", "0671234567", "067-123-45-67"):
+            self.assertEqual(self.names(query), ["ivan"], query)
+        self.assertEqual(self.names("1234567"), ["ivan", "olena"])
+        self.assertEqual(self.names("phone:5550143"), ["john"])
+        self.assertEqual(self.names("phone:067*"), ["ivan"])
+
+    def test_national_prefix(self):
+        """Test that a bare national prefix finds the E.164 numbers starting with it."""
+        query = parse_query("067")
+        self.assertEqual(query.nodes[1].pattern.text, "+38067*")
+        self.assertEqual(self.names("067"), ["ivan"])
+        self.assertEqual(self.names("0501"), ["olena"])
+        self.assertEqual(self.names("202"), ["john"])
+
+    def test_index_follows_changes(self):
+        """Test that the suffix index is updated when phones change."""
+        self.assertEqual(list(self.book.query_indexes.phone_suffixes.keys_with_prefix("7654321")), ["765432105083", "765432176083"])
+        record = self.book.find_by_name(Name("olena"))
+        record.edit_phone(Phone("0501234567"), Phone("0509999999"))
+        self.assertEqual(self.names("1234567"), ["ivan"])
+        self.assertEqual(self.names("9999999"), ["olena"])
+
+
+if __name__ == "__main__":
+    unittest.main()
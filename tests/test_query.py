@@ -0,0 +1,103 @@
+import os
+import sys
+import unittest
+
+# Додавання каталогу пакета до sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src", "CAPythonsBook")))
+
+from app.entities import AddressBook, Birthday, Field, Name, Phone, Record
+from app.query import And, Not, Or, Term, parse_query
+
+
+class TestParseQuery(unittest.TestCase):
+
+    def test_parse(self):
+        """Test parsing fields, negation, bare words and alternatives."""
+        query = parse_query("name:ivan phone:067* -tag:old shev or petro")
+        self.assertIsInstance(query, Or)
+        first, second = query.nodes
+        self.assertIsInstance(first, And)
+        self.assertEqual([type(node) for node in first.nodes], [Term, Term, Not, Term])
+        self.assertEqual((first.nodes[1].field, first.nodes[1].pattern.prefix), ("phone", "+38067"))
+        self.assertEqual((first.nodes[3].field, first.nodes[3].pattern.text), (None, "*shev*"))
+        self.assertEqual((second.field, second.pattern.text), (None, "*petro*"))
+        self.assertEqual(parse_query("shev*").pattern.text, "shev*")
+
+    def test_errors(self):
+        """Test rejecting empty queries and dangling 'or'."""
+        for query in ("", "ivan or", "***"):
+            with self.assertRaises(ValueError):
+                parse_query(query)
+
+
+class TestSearch(unittest.TestCase):
+
+    def setUp(self):
+        self.book = AddressBook()
+        for name, phone, birthday in (
+            ("ivan-petrenko", "0671234567", "05.03.1990"),
+            ("iryna", "0501234567", "05.12.1985"),
+            ("petro", "0631234567", None),
+        ):
+            record = Record(Name(name))
+            record.add_phone(Phone(phone))
+            if birthday:
+                record.add_field("birthday", Birthday(birthday))
+            self.book.add_record(record)
+        self.book.data[next(iter(self.book.data))].add_field("tag", Field("old"))
+
+    def names(self, query):
+        return [record.name.value for record in self.book.search(query)]
+
+    def test_queries(self):
+        """Test that indexed and scanned queries give the same matches."""
+        self.assertEqual(self.names("petr"), ["ivan-petrenko", "petro"])
+        self.assertEqual(self.names("phone:067*"), ["ivan-petrenko"])
+        self.assertEqual(self.names("birthday:05.*"), ["iryna", "ivan-petrenko"])
+        self.assertEqual(self.names("birthday:05.* -tag:old"), ["iryna"])
+        self.assertEqual(self.names("name:petro or name:iryna"), ["iryna", "petro"])
+        self.assertEqual(self.names("-tag:old"), ["iryna", "petro"])
+        self.assertEqual(self.names("tag:old"), ["ivan-petrenko"])
+
+    def test_bare_word_substring(self):
+        """Test that a bare word matches inside words and partial phone numbers, and 'word*' only at the start."""
+        self.assertEqual(self.names("enko"), ["ivan-petrenko"])
+        self.assertEqual(self.names("ryn"), ["iryna"])
+        self.assertEqual(self.names("ryn*"), [])
+        self.assertEqual(self.names("12345"), ["iryna", "ivan-petrenko", "petro"])
+        self.assertEqual(self.names("6312"), ["petro"])
+
+    def test_indexed_and_scanned_order(self):
+        """Test that a query lists its matches by name whether it uses an index or a scan."""
+        indexes = self.book.query_indexes
+        indexed, scanned = "i*", "i* or -name:*"
+        self.assertIsNotNone(parse_query(indexed).estimate(indexes))
+        self.assertIsNone(parse_query(scanned).estimate(indexes))
+        # Порядок книги: ivan-petrenko, iryna
+        self.assertEqual(self.names(indexed), ["iryna", "ivan-petrenko"])
+        self.assertEqual(self.names(scanned), ["iryna", "ivan-petrenko"])
+
+    def test_planner(self):
+        """Test that the most selective index drives the query and unindexed ones scan."""
+        indexes = self.book.query_indexes
+        query = parse_query("birthday:05.* name:iryna")
+        self.assertEqual(query.estimate(indexes), 1)
+        self.assertEqual(len(query.candidates(indexes)), 1)
+        self.assertIsNone(parse_query("-tag:old").estimate(indexes))
+        self.assertIsNone(parse_query("tag:old or name:iryna").estimate(indexes))
+
+    def test_index_follows_changes(self):
+        """Test that changed, added and deleted records are re-indexed."""
+        self.book.query_indexes
+        petro = next(record for record in self.book.values() if record.name.value == "petro")
+        petro.add_phone(Phone("0679999999"))
+        self.assertEqual(self.names("phone:067*"), ["ivan-petrenko", "petro"])
+        petro.remove_phone(Phone("0679999999"))
+        self.book.delete(petro.id)
+        self.assertEqual(self.names("phone:06*"), ["ivan-petrenko"])
+        petro.add_phone(Phone("0671111111"))
+        self.assertEqual(self.names("phone:067*"), ["ivan-petrenko"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import os
+import sys
+import threading
+import unittest
+from datetime import date, datetime, time
+
+# Додавання каталогу пакета до sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src", "CAPythonsBook")))
+
+from app.entities import AddressBook, Birthday, Field, Name, Record, congratulation_date
+from app.reminders import BirthdayScheduler
+
+
+class TestBirthdayScheduler(unittest.TestCase):
+
+    def setUp(self):
+        # 19.10.2026 is a Monday
+        self.now = datetime(2026, 10, 19, 8, 0)
+        self.book = AddressBook()
+        self.ivan = Record(Name("ivan"), birthday=Birthday("20.10.1990"))
+        self.olena = Record(Name("olena"), birthday=Birthday("24.10.1985"))  # Saturday
+        self.book.add_record(self.ivan)
+        self.book.add_record(self.olena)
+        self.sent = []
+        self.scheduler = BirthdayScheduler(self.book, lambda name, day: self.sent.append((name, day)),
+                                           time(9, 0), lambda: self.now)
+
+    def test_congratulation_date(self):
+        """Test that weekend birthdays move to Monday."""
+        self.assertEqual(congratulation_date(date(2026, 10, 24)), date(2026, 10, 26))
+        self.assertEqual(congratulation_date(date(2026, 10, 20)), date(2026, 10, 20))
+
+    def test_reminders_fire_in_order(self):
+        """Test the delay to the next reminder and the reminders sent when due."""
+        self.assertEqual(self.scheduler.run_pending(), 25 * 3600)
+        self.now = datetime(2026, 10, 26, 9, 30)
+        self.scheduler.run_pending()
+        self.assertEqual(self.sent, [("ivan", date(2026, 10, 20)), ("olena", date(2026, 10, 26))])
+        # The next reminders are a year later and are not repeated
+        self.assertEqual(self.scheduler.reminders[0][0], datetime(2027, 10, 20, 9, 0))
+        self.scheduler.run_pending()
+        self.assertEqual(len(self.sent), 2)
+
+    def test_reschedules_only_on_birthday_changes(self):
+        """Test that only birthday changes rebuild the heap."""
+        self.scheduler.run_pending()
+        self.ivan.add_field("email", Field("ivan@example.com"))
+        self.book.add_record(Record(Name("petro")))
+        self.assertFalse(self.scheduler.dirty)
+        self.ivan.remove_field("birthday")
+        self.assertTrue(self.scheduler.dirty)
+        self.scheduler.run_pending()
+        self.assertEqual([record_id for _, record_id, _ in self.scheduler.reminders], [self.olena.id])
+
+    def test_renamed_contact(self):
+        """Test that a reminder uses the name the contact has when it fires."""
+        self.scheduler.run_pending()
+        self.ivan.edit_field("name", Name("ivan petrenko"))
+        self.assertFalse(self.scheduler.dirty)
+        self.now = datetime(2026, 10, 20, 9, 0)
+        self.scheduler.run_pending()
+        self.assertEqual(self.sent, [("ivan petrenko", date(2026, 10, 20))])
+
+    def test_background_thread(self):
+        """Test that the thread sends a due reminder and stops."""
+        self.now = datetime(2026, 10, 20, 10, 0)
+        sent = threading.Event()
+        self.scheduler.notify = lambda name, day: sent.set()
+        self.scheduler.start()
+        try:
+            self.assertTrue(sent.wait(5))
+        finally:
+            self.scheduler.stop()
+        self.assertIsNone(self.scheduler.thread)
+
+
+if __name__ == "__main__":
+    unittest.main()
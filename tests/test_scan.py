@@ -0,0 +1,89 @@
+import os
+import sys
+import unittest
+import uuid
+
+# Додавання каталогу пакета до sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src", "CAPythonsBook")))
+
+from app.collation import collation_key
+from app.entities import AddressBook, Field, Name, Phone, Record
+from app.query import parse_query
+from app.scan import ScanEngine
+
+
+def make_book(count):
+    records = {}
+    for index in range(count):
+        record = Record(Name(f"name-{index}"))
+        record.add_phone(Phone(f"067{index:07d}"))
+        record.add_field("email", Field(f"user{index}@{'mail.ua' if index % 3 else 'example.com'}"))
+        records[record.id] = record
+    return AddressBook(records)
+
+
+class TestScanEngine(unittest.TestCase):
+
+    def test_parallel_matches_serial(self):
+        """Test that the worker processes return the same records in book order."""
+        book = make_book(100)
+        records = list(book.data.values())
+        node = parse_query("email:*@example.com -phone:*5")
+        serial = ScanEngine(workers=1).scan(node, records)
+        engine = ScanEngine(workers=2, min_records=10, partition_size=16)
+        try:
+            self.assertEqual(engine.scan(node, records), serial)
+            self.assertEqual(len(serial), len([index for index in range(100) if index % 3 == 0 and index % 10 != 5]))
+            self.assertEqual(len(engine.versions), 7)
+        finally:
+            engine.shutdown()
+
+    def test_changes_update_partitions(self):
+        """Test that book changes reach the workers without restarting the pool."""
+        book = make_book(100)
+        engine = book._scan_engine = ScanEngine(workers=2, min_records=10, partition_size=16)
+        try:
+            node = parse_query("email:*@example.com")
+            self.assertEqual(len(book.scan_engine.scan(node, list(book.data.values()))), 34)
+            executor, versions = engine.executor, list(engine.versions)
+            # Зміна запису в першому розділі та новий запис в останньому
+            first = next(iter(book.data.values()))
+            first.add_field("email", Field("first@mail.ua"))
+            book.add_record(Record(Name("extra"), email=Field("extra@example.com")))
+            changed = [partition for partition, version in enumerate(engine.versions) if version != versions[partition]]
+            self.assertEqual(changed, [0, 6])
+            found = engine.scan(node, list(book.data.values()))
+            self.assertEqual(len(found), 34)
+            self.assertEqual(found[-1].name.value, "extra")
+            self.assertNotIn(first, found)
+            self.assertIs(engine.executor, executor)
+            # Rolled back changes reload the records
+            book.begin()
+            book.delete(found[-1].id)
+            book.rollback()
+            self.assertFalse(engine.loaded)
+            self.assertEqual(engine.scan(node, list(book.data.values())), found)
+        finally:
+            engine.shutdown()
+
+    def test_small_book_scans_in_process(self):
+        """Test that no pool is started below the threshold."""
+        book = make_book(5)
+        engine = ScanEngine(workers=2, min_records=10)
+        result = engine.scan(parse_query("email:*@*"), list(book.data.values()))
+        self.assertEqual(len(result), 5)
+        self.assertIsNone(engine.executor)
+
+    def test_book_search_uses_scan(self):
+        """Test unindexed book searches through the scan engine."""
+        book = make_book(30)
+        book._scan_engine = ScanEngine(workers=2, min_records=10)
+        try:
+            names = [record.name.value for record in book.search("email:*@example.com")]
+            self.assertEqual(names, sorted((f"name-{index}" for index in range(0, 30, 3)), key=collation_key))
+        finally:
+            book.scan_engine.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import os
+import sys
+import unittest
+
+# Додавання каталогу пакета до sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src", "CAPythonsBook")))
+
+from app.collation import collation_key
+from app.entities import AddressBook, Birthday, Name, Record
+from app.indexes import SortedView
+
+
+class TestCollation(unittest.TestCase):
+
+    def test_ukrainian_alphabet(self):
+        """Test Latin before Cyrillic, the Ukrainian letter order and case-insensitivity."""
+        names = ["Ярослав", "Ґанна", "Іван", "Євген", "Юрій", "Zoe", "adam", "Гліб", "Їжак", "Єва", "ivan petrenko", "Ivana"]
+        self.assertEqual(sorted(names, key=collation_key),
+                         ["adam", "ivan petrenko", "Ivana", "Zoe", "Гліб", "Ґанна", "Єва", "Євген", "Іван", "Їжак", "Юрій", "Ярослав"])
+        self.assertEqual(collation_key("Мар'яна")[0], collation_key("марʼяна")[0])
+
+    def test_accented_and_other_letters(self):
+        """Test accented Latin letters with their base letters and other scripts after the alphabet."""
+        names = ["Łukasz", "zoe", "Émile", "adam", "Йосип", "αλφα", "ezra", "Иван", "Élise"]
+        self.assertEqual(sorted(names, key=collation_key),
+                         ["adam", "Élise", "Émile", "ezra", "Łukasz", "zoe", "Иван", "Йосип", "αλφα"])
+        # 'й' typed as 'и' with a combining breve is still 'й'
+        self.assertEqual(collation_key("\u0438\u0306")[0], collation_key("й")[0])
+
+
+class TestSortedViews(unittest.TestCase):
+
+    def setUp(self):
+        self.book = AddressBook()
+        for name, birthday in (("Юрій", "05.03.1990"), ("Ґанна", None), ("adam", "01.12.1985"), ("Іван", "20.01.2000")):
+            record = Record(Name(name))
+            if birthday:
+                record.add_field("birthday", Birthday(birthday))
+            self.book.add_record(record)
+
+    def names(self, order, offset=0, limit=None):
+        return [record.name.value for record in self.book.sorted_records(order, offset, limit)]
+
+    def test_orders_and_pages(self):
+        """Test the three orders and range paging."""
+        self.assertEqual(self.names("created"), ["Юрій", "Ґанна", "adam", "Іван"])
+        self.assertEqual(self.names("name"), ["adam", "Ґанна", "Іван", "Юрій"])
+        self.assertEqual(self.names("birthday"), ["Іван", "Юрій", "adam", "Ґанна"])
+        self.assertEqual(self.names("name", 1, 2), ["Ґанна", "Іван"])
+
+    def test_views_follow_changes(self):
+        """Test that the views are updated incrementally on add, change and delete."""
+        self.names("name"), self.names("birthday")
+        views = dict(self.book._sorted_views)
+        self.book.add_record(Record(Name("Богдан"), birthday=Birthday("01.01.1970")))
+        adam = self.book.find_by_name(Name("adam"))
+        adam.edit_field("birthday", Birthday("01.02.1985"))
+        self.book.delete(self.book.find_by_name(Name("Юрій")).id)
+        self.assertEqual(self.names("name"), ["adam", "Богдан", "Ґанна", "Іван"])
+        self.assertEqual(self.names("birthday"), ["Богдан", "Іван", "adam", "Ґанна"])
+        self.assertEqual(self.book._sorted_views, views)
+
+    def test_sorted_view(self):
+        """Test moving and removing entries of a view."""
+        view = SortedView([(2, "b"), (1, "a")])
+        view.set("c", 0)
+        view.set("a", 3)
+        view.discard("b")
+        view.discard("missing")
+        self.assertEqual(view.page(), ["c", "a"])
+        self.assertEqual(len(view), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# Додавання каталогу пакета до sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src", "CAPythonsBook")))
+
+from app.tracing import Tracer
+
+
+class TestTracer(unittest.TestCase):
+
+    def setUp(self):
+        self.tracer = Tracer()
+
+    def test_disabled(self):
+        """Test that nothing is recorded until tracing is started."""
+        with self.tracer.span("execute"):
+            pass
+        self.assertEqual(self.tracer.events, [])
+
+    def test_nested_spans(self):
+        """Test that an inner span lies within its outer span."""
+        self.tracer.start()
+        with self.tracer.span("execute", "commands", command="add"):
+            with self.tracer.span("find_by_name"):
+                pass
+        inner, outer = self.tracer.events
+        self.assertEqual((inner["name"], outer["name"]), ("find_by_name", "execute"))
+        self.assertEqual(outer["args"], {"command": "add"})
+        self.assertGreaterEqual(inner["ts"], outer["ts"])
+        self.assertLessEqual(inner["ts"] + inner["dur"], outer["ts"] + outer["dur"])
+
+    def test_write(self):
+        """Test the Chrome trace-event file layout."""
+        self.tracer.start()
+        with self.tracer.span("parse_input", "cli"):
+            pass
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "trace.json")
+            self.tracer.write(file_path)
+            with open(file_path, encoding="utf-8") as file:
+                data = json.load(file)
+        event, = data["traceEvents"]
+        self.assertEqual((event["ph"], event["cat"]), ("X", "cli"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import os
+import sys
+import unittest
+
+# Додавання каталогу пакета до sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src", "CAPythonsBook")))
+
+from app.entities import AddressBook, Birthday, Field, Name, Phone, Record
+from presentation.cli import split_commands
+
+
+class TestAddressBookTransaction(unittest.TestCase):
+
+    def setUp(self):
+        self.book = AddressBook()
+        record = Record(Name("ivan"))
+        record.add_phone(Phone("0671234567"))
+        self.book.add_record(record)
+        self.record = record
+
+    def test_rollback(self):
+        """Test that rollback restores added records and in-place field changes."""
+        self.book.begin()
+        self.record.edit_phone(Phone("0671234567"), Phone("0999999999"))
+        self.record.add_field("birthday", Birthday("01.01.1990"))
+        self.book.add_record(Record(Name("petro")))
+        self.book.rollback()
+
+        self.assertFalse(self.book.in_transaction)
+        self.assertEqual(list(self.book.values()), [self.record])
+        self.assertEqual([phone.value for phone in self.record.phones], ["+380671234567"])
+        self.assertNotIn("birthday", self.record.fields)
+
+    def test_changes_after_rollback(self):
+        """Test that a record deleted in a rolled back transaction publishes its changes again."""
+        added = Record(Name("petro"))
+        self.book.begin()
+        self.book.delete(self.record.id)
+        self.book.add_record(added)
+        self.book.rollback()
+        self.assertIsNone(added.owner)
+
+        generation = self.book.generation
+        self.assertEqual(list(self.book.search("email:x@y.com")), [])
+        self.record.add_field("email", Field("x@y.com"))
+        self.record.add_phone(Phone("0501112233"))
+        self.assertGreater(self.book.generation, generation)
+        self.assertEqual(list(self.book.search("email:x@y.com")), [self.record])
+        self.assertEqual(list(self.book.search("0501112233")), [self.record])
+
+    def test_commit(self):
+        """Test that commit keeps the changes and ends the transaction."""
+        self.book.begin()
+        self.book.add_record(Record(Name("petro")))
+        self.book.commit()
+        self.assertFalse(self.book.in_transaction)
+        self.assertEqual(len(self.book), 2)
+
+    def test_misuse(self):
+        """Test nested begin and commit without a transaction."""
+        self.book.begin()
+        with self.assertRaises(ValueError):
+            self.book.begin()
+        self.book.rollback()
+        with self.assertRaises(ValueError):
+            self.book.commit()
+
+
+class TestSplitCommands(unittest.TestCase):
+
+    def test_split(self):
+        """Test splitting a line into ';'-separated commands."""
+        self.assertEqual(split_commands("add a 0671234567; ;all"), ["add a 0671234567", "all"])
+        self.assertEqual(split_commands(""), [""])
+
+    def test_free_text_keeps_semicolons(self):
+        """Test that only a command ending with free text takes the ';' after it."""
+        self.assertEqual(split_commands("add-note todo buy milk; call ivan"), ["add-note todo buy milk; call ivan"])
+        self.assertEqual(split_commands("all; edit-note 1 todo a; b"), ["all", "edit-note 1 todo a; b"])
+        self.assertEqual(split_commands("search-contact x; all"), ["search-contact x", "all"])
+        self.assertEqual(split_commands("search-notes milk;all"), ["search-notes milk", "all"])
+
+
+if __name__ == "__main__":
+    unittest.main()
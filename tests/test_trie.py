@@ -0,0 +1,64 @@
+import os
+import sys
+import unittest
+
+# Додавання каталогу пакета до sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src", "CAPythonsBook")))
+
+from app.entities import AddressBook, Name, Record
+from app.trie import PrefixTrie
+from presentation.completion import Completer
+import app.services  # noqa: F401  (registers the commands)
+
+
+class TestPrefixTrie(unittest.TestCase):
+
+    def test_starts_with(self):
+        """Test finding words by prefix in sorted order with a limit."""
+        trie = PrefixTrie(["іван", "ірина", "петро", "іван-2"])
+        self.assertEqual(trie.starts_with("і"), ["іван", "іван-2", "ірина"])
+        self.assertEqual(trie.starts_with("і", limit=2), ["іван", "іван-2"])
+        self.assertEqual(trie.starts_with("x"), [])
+        self.assertEqual(len(trie.starts_with("")), 4)
+
+    def test_remove(self):
+        """Test that duplicates are counted and removed nodes are pruned."""
+        trie = PrefixTrie(["anna", "anna", "ann"])
+        trie.remove("anna")
+        self.assertIn("anna", trie)
+        trie.remove("anna")
+        self.assertNotIn("anna", trie)
+        self.assertEqual(trie.starts_with("an"), ["ann"])
+        trie.remove("unknown")
+        self.assertEqual(len(trie), 1)
+        trie.remove("ann")
+        self.assertEqual(trie.root.children, {})
+
+
+class TestCompletion(unittest.TestCase):
+
+    def setUp(self):
+        self.book = AddressBook()
+        for name in ("ivan", "iryna", "petro"):
+            self.book.add_record(Record(Name(name)))
+        self.completer = Completer(self.book)
+
+    def test_name_index_updated(self):
+        """Test that the name trie follows added and deleted records."""
+        self.assertEqual(self.book.name_index.starts_with("i"), ["iryna", "ivan"])
+        record = Record(Name("ihor"))
+        self.book.add_record(record)
+        self.book.delete(next(r.id for r in self.book.values() if r.name.value == "ivan"))
+        self.assertEqual(self.book.name_index.starts_with("i"), ["ihor", "iryna"])
+
+    def test_complete_line(self):
+        """Test completing command names and contact names."""
+        self.assertIn("show-phone", self.completer.complete_line("sh"))
+        self.assertEqual(self.completer.complete_line("show-phone i"), ["iryna", "ivan"])
+        self.assertEqual(self.completer.complete_line("all; change p"), ["petro"])
+        self.assertEqual(self.completer.complete_line("add-note i"), [])
+        self.assertEqual(self.completer.complete_line("change ivan 0"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()